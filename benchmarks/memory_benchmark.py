@@ -0,0 +1,59 @@
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import List, Tuple
+
+from optrees import Graph
+
+
+def random_edges(
+    vertices_count: int, edges_count: int, seed: int = 0
+) -> List[Tuple[str, str, float]]:
+    generator = random.Random(seed)
+    edges = {}
+    for vertex in range(1, vertices_count):
+        edges[(generator.randrange(vertex), vertex)] = generator.random()
+    while len(edges) < edges_count:
+        left, right = sorted(generator.sample(range(vertices_count), 2))
+        edges.setdefault((left, right), generator.random())
+    return [
+        (f"v{left}", f"v{right}", weight) for (left, right), weight in edges.items()
+    ]
+
+
+def measure(vertices_count: int, edges_count: int) -> Tuple[int, float, float]:
+    edges = random_edges(vertices_count, edges_count)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = Graph("G")
+    graph.from_list(edges)
+    build_time = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    del graph
+    gc.collect()
+    teardown_time = time.perf_counter() - start
+    return allocated, build_time, teardown_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the Graph object memory.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--density", type=int, default=4)
+    arguments = parser.parse_args()
+    print(f"{'V':>8}{'E':>10}{'bytes/edge':>12}{'build (s)':>12}{'teardown (s)':>14}")
+    for vertices_count in arguments.sizes:
+        edges_count = arguments.density * vertices_count
+        allocated, build_time, teardown_time = measure(vertices_count, edges_count)
+        print(
+            f"{vertices_count:>8}{edges_count:>10}{allocated / edges_count:>12.1f}"
+            f"{build_time:>12.3f}{teardown_time:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
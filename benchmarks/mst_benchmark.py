@@ -0,0 +1,329 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from optrees import CSRGraph, Graph, GraphReader, __version__, boruvka, kruskal, prim
+from optrees.optimal_trees_algorithms.selection import DENSE_PRIM_VERTICES_LIMIT
+
+EdgeArrays = Tuple[int, np.ndarray, np.ndarray, np.ndarray]
+
+
+def random_tree(vertices_count: int, generator: np.random.Generator) -> np.ndarray:
+    # Every vertex but the first joins a random earlier one of a random order,
+    # which keeps every family connected.
+    order = generator.permutation(vertices_count)
+    parents = generator.random(vertices_count - 1) * np.arange(1, vertices_count)
+    return np.stack((order[1:], order[parents.astype(np.int64)]))
+
+
+def simple_edges(
+    vertices_count: int, sources: np.ndarray, targets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Loops and parallel edges are dropped, so the edges also fit the Graph
+    # model, where "a - b" can only appear once.
+    left = np.minimum(sources, targets).astype(np.int64)
+    right = np.maximum(sources, targets).astype(np.int64)
+    keys = np.unique(left[left != right] * vertices_count + right[left != right])
+    return np.divmod(keys, vertices_count)
+
+
+def with_tree(
+    vertices_count: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    generator: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray]:
+    tree = random_tree(vertices_count, generator)
+    return simple_edges(
+        vertices_count,
+        np.concatenate((tree[0], sources)),
+        np.concatenate((tree[1], targets)),
+    )
+
+
+def sparse_graph(edges_count: int, generator: np.random.Generator) -> EdgeArrays:
+    vertices_count = max(2, edges_count // 4)
+    extra = max(0, edges_count - vertices_count + 1)
+    sources, targets = with_tree(
+        vertices_count,
+        generator.integers(0, vertices_count, extra),
+        generator.integers(0, vertices_count, extra),
+        generator,
+    )
+    return vertices_count, sources, targets, generator.random(len(sources))
+
+
+def dense_graph(edges_count: int, generator: np.random.Generator) -> EdgeArrays:
+    # About half of all pairs.
+    vertices_count = max(2, int(np.sqrt(4 * edges_count)) + 1)
+    pairs = vertices_count * (vertices_count - 1) // 2
+    keys = generator.choice(pairs, min(edges_count, pairs), replace=False)
+    left, right = np.triu_indices(vertices_count, 1)
+    sources, targets = with_tree(vertices_count, left[keys], right[keys], generator)
+    return vertices_count, sources, targets, generator.random(len(sources))
+
+
+def complete_graph(edges_count: int, generator: np.random.Generator) -> EdgeArrays:
+    vertices_count = max(2, int((1 + np.sqrt(1 + 8 * edges_count)) / 2))
+    sources, targets = np.triu_indices(vertices_count, 1)
+    return vertices_count, sources, targets, generator.random(len(sources))
+
+
+def grid_graph(edges_count: int, generator: np.random.Generator) -> EdgeArrays:
+    side = max(2, int(np.sqrt(edges_count / 2)) + 1)
+    vertices = np.arange(side * side).reshape(side, side)
+    sources = np.concatenate((vertices[:, :-1].ravel(), vertices[:-1, :].ravel()))
+    targets = np.concatenate((vertices[:, 1:].ravel(), vertices[1:, :].ravel()))
+    return side * side, sources, targets, generator.random(len(sources))
+
+
+def geometric_graph(edges_count: int, generator: np.random.Generator) -> EdgeArrays:
+    # Points in the unit square joined when closer than the radius that gives
+    # an average degree of eight; the weights are the distances.
+    vertices_count = max(2, edges_count // 4)
+    radius = np.sqrt(8 / (np.pi * vertices_count))
+    cells_count = max(1, int(1 / radius))
+    points = generator.random((vertices_count, 2))
+    cells = np.minimum((points * cells_count).astype(np.int64), cells_count - 1)
+    cell_ids = cells[:, 0] * cells_count + cells[:, 1]
+    order = np.argsort(cell_ids, kind="stable")
+    points, cells, cell_ids = points[order], cells[order], cell_ids[order]
+    starts = np.searchsorted(cell_ids, np.arange(cells_count * cells_count + 1))
+    sources, targets = [], []
+    for row_offset, column_offset in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        rows = cells[:, 0] + row_offset
+        columns = cells[:, 1] + column_offset
+        valid = (rows < cells_count) & (columns >= 0) & (columns < cells_count)
+        vertices = np.flatnonzero(valid)
+        neighbor_cells = rows[valid] * cells_count + columns[valid]
+        counts = starts[neighbor_cells + 1] - starts[neighbor_cells]
+        left = np.repeat(vertices, counts)
+        # Position inside the neighbour cell for every repeated vertex.
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        right = np.repeat(starts[neighbor_cells], counts) + offsets
+        close = np.sum((points[left] - points[right]) ** 2, axis=1) < radius**2
+        if row_offset == column_offset == 0:
+            close &= left < right
+        sources.append(left[close])
+        targets.append(right[close])
+    # Consecutive points in cell order form a short connecting path.
+    sources.append(np.arange(vertices_count - 1))
+    targets.append(np.arange(1, vertices_count))
+    sources, targets = simple_edges(
+        vertices_count, np.concatenate(sources), np.concatenate(targets)
+    )
+    weights = np.sqrt(np.sum((points[sources] - points[targets]) ** 2, axis=1))
+    return vertices_count, sources, targets, weights
+
+
+def power_law_graph(edges_count: int, generator: np.random.Generator) -> EdgeArrays:
+    # Chung-Lu graph with degree exponent 2.5 and average degree six.
+    vertices_count = max(2, edges_count // 3)
+    expected_degrees = np.arange(1, vertices_count + 1) ** (-1 / 1.5)
+    probabilities = expected_degrees / expected_degrees.sum()
+    extra = max(0, edges_count - vertices_count + 1)
+    sources, targets = with_tree(
+        vertices_count,
+        generator.choice(vertices_count, extra, p=probabilities),
+        generator.choice(vertices_count, extra, p=probabilities),
+        generator,
+    )
+    return vertices_count, sources, targets, generator.random(len(sources))
+
+
+FAMILIES: Dict[str, Callable[[int, np.random.Generator], EdgeArrays]] = {
+    "sparse": sparse_graph,
+    "dense": dense_graph,
+    "grid": grid_graph,
+    "geometric": geometric_graph,
+    "power_law": power_law_graph,
+    "complete": complete_graph,
+}
+
+ALGORITHMS = {
+    "kruskal": kruskal,
+    "prim": prim,
+    "boruvka": boruvka,
+    "dense_prim": partial(prim, dense=True),
+    "filter_kruskal": partial(kruskal, filtered=True),
+}
+
+
+def write_graph_file(file_path: str, labels: List[str], edges: EdgeArrays):
+    _, sources, targets, weights = edges
+    with open(file_path, "w") as file:
+        file.write("G\n")
+        for left, right, weight in zip(
+            sources.tolist(), targets.tolist(), weights.tolist()
+        ):
+            file.write(f"{labels[left]} {labels[right]} {weight!r}\n")
+
+
+def measure(function: Callable[[], object], repeats: int) -> Dict[str, object]:
+    times = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    # Peak memory is measured on a separate run, since tracing slows it down.
+    gc.collect()
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "times": times,
+        "best": min(times),
+        "median": float(np.median(times)),
+        "peak_bytes": peak,
+    }
+
+
+def run(arguments: argparse.Namespace) -> List[Dict[str, object]]:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for family in arguments.families:
+            for edges_count in arguments.sizes:
+                generator = np.random.default_rng([arguments.seed, edges_count])
+                edges = FAMILIES[family](edges_count, generator)
+                vertices_count = edges[0]
+                labels = [f"v{vertex}" for vertex in range(vertices_count)]
+                csr_graph = CSRGraph(
+                    "G", labels, edges[1], edges[2], edges[3], validate=False
+                )
+                file_path = os.path.join(directory, f"{family}-{edges_count}.txt")
+                write_graph_file(file_path, labels, edges)
+                reader = GraphReader(file_path)
+                graph: Optional[Graph] = None
+                if csr_graph.edges_count <= arguments.object_limit:
+                    graph = reader.read()
+                operations: Dict[str, Callable[[], object]] = {
+                    "GraphReader.read_csr": reader.read_csr,
+                }
+                if graph is not None:
+                    operations["GraphReader.read"] = reader.read
+                for name in arguments.algorithms:
+                    # The dense engine needs a matrix of vertices_count**2 weights.
+                    if (
+                        name == "dense_prim"
+                        and vertices_count > DENSE_PRIM_VERTICES_LIMIT
+                    ):
+                        continue
+                    algorithm = ALGORITHMS[name]
+                    operations[f"{name}[CSRGraph]"] = (
+                        lambda algorithm=algorithm: algorithm(csr_graph)
+                    )
+                    if graph is not None:
+                        operations[f"{name}[Graph]"] = (
+                            lambda algorithm=algorithm: algorithm(graph)
+                        )
+                for operation, function in operations.items():
+                    result = {
+                        "family": family,
+                        "vertices": vertices_count,
+                        "edges": csr_graph.edges_count,
+                        "operation": operation,
+                        **measure(function, arguments.repeats),
+                    }
+                    results.append(result)
+                    print(
+                        f"{family:<10}{vertices_count:>10}{csr_graph.edges_count:>10}"
+                        f"  {operation:<22}{result['best']:>10.4f}"
+                        f"{result['peak_bytes'] / 2**20:>10.1f}",
+                        flush=True,
+                    )
+                os.remove(file_path)
+    return results
+
+
+def compare(
+    results: List[Dict[str, object]], baseline_path: str, tolerance: float
+) -> bool:
+    with open(baseline_path) as file:
+        baseline = {
+            (result["family"], result["edges"], result["operation"]): result
+            for result in json.load(file)["results"]
+        }
+    regressions = False
+    print(f"\n{'family':<10}{'E':>10}  {'operation':<22}{'ratio':>8}")
+    for result in results:
+        key = (result["family"], result["edges"], result["operation"])
+        if key not in baseline:
+            continue
+        ratio = result["best"] / baseline[key]["best"]
+        flag = " regression" if ratio > 1 + tolerance else ""
+        regressions = regressions or bool(flag)
+        print(f"{key[0]:<10}{key[1]:>10}  {key[2]:<22}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time the MST algorithms and GraphReader on graph families."
+    )
+    parser.add_argument(
+        "--families", nargs="+", choices=list(FAMILIES), default=list(FAMILIES)
+    )
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e2, 1e3, 1e4, 1e5])
+    parser.add_argument(
+        "--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS)
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--object-limit",
+        type=float,
+        default=1e5,
+        help="largest edge count also run on Graph objects",
+    )
+    parser.add_argument("--output", default="mst_benchmark.json")
+    parser.add_argument("--baseline", help="JSON results of an earlier run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="slowdown over the baseline reported as a regression",
+    )
+    arguments = parser.parse_args()
+    arguments.sizes = [int(size) for size in arguments.sizes]
+    print(
+        f"{'family':<10}{'V':>10}{'E':>10}  {'operation':<22}{'best (s)':>10}{'MiB':>10}"
+    )
+    results = run(arguments)
+    with open(arguments.output, "w") as file:
+        json.dump(
+            {
+                "metadata": {
+                    "optrees": __version__,
+                    "python": sys.version.split()[0],
+                    "numpy": np.__version__,
+                    "platform": platform.platform(),
+                    "date": datetime.now(timezone.utc).isoformat(),
+                    "seed": arguments.seed,
+                    "repeats": arguments.repeats,
+                },
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+    if arguments.baseline and compare(results, arguments.baseline, arguments.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
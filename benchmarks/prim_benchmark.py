@@ -0,0 +1,115 @@
+import argparse
+import math
+import random
+import time
+
+import numpy as np
+
+from optrees import Graph, kruskal, prim
+
+
+def legacy_prim(graph: Graph):
+    # A verbatim copy of prim() before the heap engines.
+    mst_graph = Graph("MST")
+    while mst_graph.vertices_count < graph.vertices_count:
+        for vertex in graph.vertices.values():
+            if vertex not in mst_graph:
+                min_weight = np.Infinity
+                min_edge = None
+                for edge in vertex.edges.values():
+                    if mst_graph.vertices_count > 0:
+                        is_the_vertex_connected_to_mst_graph = (
+                            edge.right_vertex in mst_graph
+                            or edge.left_vertex in mst_graph
+                        )
+                    else:
+                        is_the_vertex_connected_to_mst_graph = True
+                    if (
+                        edge.weight < min_weight
+                        and is_the_vertex_connected_to_mst_graph
+                    ):
+                        min_weight = edge.weight
+                        min_edge = edge
+                if min_edge is not None:
+                    mst_graph.add_edge(min_edge)
+                else:
+                    raise ValueError("The graph is not connected.")
+    return mst_graph
+
+
+def random_graph(vertices_count: int, edges_count: int, seed: int = 0) -> Graph:
+    generator = random.Random(seed)
+    # A random spanning tree over shuffled vertex names keeps the graph
+    # connected without handing the engines the tree in insertion order.
+    names = list(range(vertices_count))
+    generator.shuffle(names)
+    edges = {}
+    for vertex in range(1, vertices_count):
+        pair = sorted((names[generator.randrange(vertex)], names[vertex]))
+        edges[tuple(pair)] = generator.random()
+    edges_count = min(edges_count, vertices_count * (vertices_count - 1) // 2)
+    while len(edges) < edges_count:
+        left, right = sorted(generator.sample(range(vertices_count), 2))
+        edges.setdefault((left, right), generator.random())
+    edges_list = [
+        (f"v{left}", f"v{right}", weight) for (left, right), weight in edges.items()
+    ]
+    generator.shuffle(edges_list)
+    graph = Graph(f"G({vertices_count}, {edges_count})")
+    graph.from_list(edges_list)
+    return graph
+
+
+def measure_legacy(graph: Graph, mst_weight: float) -> str:
+    # The old implementation fails on some inputs and returns heavier trees
+    # on others; both are reported instead of a time.
+    try:
+        start = time.perf_counter()
+        tree = legacy_prim(graph)
+        elapsed = time.perf_counter() - start
+    except ValueError:
+        return f"{'fails':>10}"
+    if not math.isclose(tree.weight_sum, mst_weight):
+        return f"{'wrong':>10}"
+    return f"{elapsed:10.3f}"
+
+
+def measure(function, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the Prim engines.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 5000])
+    parser.add_argument("--legacy-limit", type=int, default=1000)
+    arguments = parser.parse_args()
+    print(f"{'family':<8}{'V':>8}{'E':>10}{'legacy':>10}{'lazy':>10}{'indexed':>10}")
+    for vertices_count in arguments.sizes:
+        families = {
+            "sparse": 4 * vertices_count,
+            "dense": vertices_count * (vertices_count - 1) // 4,
+        }
+        for family, edges_count in families.items():
+            if family == "dense" and vertices_count > 2000:
+                continue
+            graph = random_graph(vertices_count, edges_count)
+            mst_weight = kruskal(graph).weight_sum
+            for heap in ("lazy", "indexed"):
+                assert math.isclose(prim(graph, heap=heap).weight_sum, mst_weight)
+            legacy = (
+                measure_legacy(graph, mst_weight)
+                if vertices_count <= arguments.legacy_limit
+                else f"{'-':>10}"
+            )
+            lazy = measure(prim, graph, heap="lazy")
+            indexed = measure(prim, graph, heap="indexed")
+            print(
+                f"{family:<8}{vertices_count:>8}{graph.edges_count:>10}"
+                f"{legacy}{lazy:10.3f}{indexed:10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
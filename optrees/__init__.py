@@ -1,18 +1,102 @@
 # flake8: noqa
 
 from .graph.basic_objects import Edge, Vertex
-from .graph.graph import Graph
-from .optimal_trees_algorithms.boruvka import boruvka
-from .optimal_trees_algorithms.kruskal import kruskal
-from .optimal_trees_algorithms.prim import prim
+from .graph.graph import Graph, GraphReader
+from .graph.csr_graph import CSRGraph
+from .graph.sparse_matrix import SparseMatrix
+from .graph.deletion_messages import (
+    disable_deletion_messages,
+    enable_deletion_messages,
+)
+from .helpers.disjoint_set import DisjointSet
+from .helpers.heaps import IndexedHeap, RadixHeap
+from .helpers.kd_tree import KDTree
+from .helpers.link_cut_tree import LinkCutTree
+from .helpers.max_flow import FlowNetwork
+from .optimal_trees_algorithms.bellman_ford import bellman_ford
+from .optimal_trees_algorithms.batch import batch_minimum_spanning_trees
+from .optimal_trees_algorithms.boruvka import (
+    boruvka,
+    numpy_boruvka,
+    numpy_boruvka_edges,
+)
+from .optimal_trees_algorithms.cost_allocation import (
+    MSTGame,
+    bird,
+    folk,
+    kar,
+    monte_carlo_shapley,
+)
+from .optimal_trees_algorithms.edmonds import edmonds, tarjan
+from .optimal_trees_algorithms.euclidean import euclidean_mst, euclidean_mst_edges
+from .optimal_trees_algorithms.external import external_mst
+from .optimal_trees_algorithms.forest import minimum_spanning_forest
+from .optimal_trees_algorithms.gomory_hu import gusfield
+from .optimal_trees_algorithms.kruskal import (
+    filter_kruskal_edges,
+    kruskal,
+    numpy_kruskal,
+    numpy_kruskal_edges,
+)
+from .optimal_trees_algorithms.dijkstra import dijkstra
+from .optimal_trees_algorithms.prim import dense_prim_edges, prim
+from .optimal_trees_algorithms.selection import select_mst_algorithm
+from .optimal_trees_algorithms.dynamic_mst import DynamicMST
+from .optimal_trees_algorithms.streaming import StreamingMST
+from .getMinimumSpanningTree import getMinimumSpanningTree
+from .getMinimumSpanningForest import getMinimumSpanningForest
+from .getCostAllocation import getCostAllocation
+from .getMinimumArborescence import getMinimumArborescence
+from .getMinimumCutTree import getMinimumCutTree
+from .getShortestPathTree import getShortestPathTree
 from .version import __version__
 
 __all__ = [
     "Vertex",
     "Edge",
     "Graph",
+    "GraphReader",
+    "CSRGraph",
+    "SparseMatrix",
+    "DisjointSet",
+    "IndexedHeap",
+    "RadixHeap",
+    "KDTree",
+    "LinkCutTree",
+    "FlowNetwork",
+    "DynamicMST",
+    "StreamingMST",
+    "MSTGame",
+    "disable_deletion_messages",
+    "enable_deletion_messages",
+    "batch_minimum_spanning_trees",
+    "bellman_ford",
+    "bird",
     "boruvka",
+    "dense_prim_edges",
+    "dijkstra",
+    "edmonds",
+    "euclidean_mst",
+    "euclidean_mst_edges",
+    "external_mst",
+    "filter_kruskal_edges",
+    "folk",
+    "getCostAllocation",
+    "getMinimumArborescence",
+    "getMinimumCutTree",
+    "getMinimumSpanningForest",
     "getMinimumSpanningTree",
+    "getShortestPathTree",
+    "gusfield",
+    "kar",
     "kruskal",
+    "minimum_spanning_forest",
+    "monte_carlo_shapley",
+    "numpy_boruvka",
+    "numpy_boruvka_edges",
+    "numpy_kruskal",
+    "numpy_kruskal_edges",
     "prim",
+    "select_mst_algorithm",
+    "tarjan",
 ]
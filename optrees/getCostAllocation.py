@@ -0,0 +1,32 @@
+from typing import Union
+
+from optrees import CSRGraph, Graph, Vertex
+
+from .optimal_trees_algorithms.cost_allocation import (
+    bird,
+    folk,
+    kar,
+    monte_carlo_shapley,
+)
+
+
+def getCostAllocation(
+    graph: Union[Graph, CSRGraph],
+    source: Union[str, Vertex],
+    rule: str = "folk",
+    **kwargs,
+):
+    # Kar's rule is the Shapley value of the minimum cost spanning tree game.
+    rules = {
+        "bird": bird,
+        "folk": folk,
+        "kar": kar,
+        "monte_carlo": monte_carlo_shapley,
+        "shapley": kar,
+    }
+    if rule in rules:
+        return rules[rule](graph, source, **kwargs)
+    else:
+        raise ValueError(
+            f"Rule {rule} not found. Available rules: {list(rules.keys())}"
+        )
@@ -0,0 +1,24 @@
+from typing import Union
+
+from optrees import CSRGraph, Graph, Vertex
+
+from .optimal_trees_algorithms.edmonds import edmonds, tarjan
+
+
+def getMinimumArborescence(
+    graph: Union[Graph, CSRGraph],
+    root: Union[str, Vertex],
+    algorithm: str = "tarjan",
+    **kwargs,
+):
+    algorithms = {
+        "edmonds": edmonds,
+        "tarjan": tarjan,
+    }
+    if algorithm in algorithms:
+        return algorithms[algorithm](graph, root, **kwargs)
+    else:
+        raise ValueError(
+            f"Algorithm {algorithm} not found. "
+            f"Available algorithms: {list(algorithms.keys())}"
+        )
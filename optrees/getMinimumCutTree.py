@@ -0,0 +1,20 @@
+from typing import Union
+
+from optrees import CSRGraph, Graph
+
+from .optimal_trees_algorithms.gomory_hu import gusfield
+
+
+def getMinimumCutTree(
+    graph: Union[Graph, CSRGraph], algorithm: str = "gusfield", **kwargs
+):
+    algorithms = {
+        "gusfield": gusfield,
+    }
+    if algorithm in algorithms:
+        return algorithms[algorithm](graph, **kwargs)
+    else:
+        raise ValueError(
+            f"Algorithm {algorithm} not found. "
+            f"Available algorithms: {list(algorithms.keys())}"
+        )
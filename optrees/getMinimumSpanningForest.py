@@ -0,0 +1,20 @@
+from typing import Optional, Union
+
+from optrees import CSRGraph, Graph
+
+from .optimal_trees_algorithms.forest import FOREST_ENGINES, minimum_spanning_forest
+
+
+def getMinimumSpanningForest(
+    graph: Union[Graph, CSRGraph],
+    algorithm: str = "boruvka",
+    workers: Optional[int] = None,
+    **kwargs,
+):
+    if algorithm in FOREST_ENGINES:
+        return minimum_spanning_forest(graph, algorithm, workers, **kwargs)
+    else:
+        raise ValueError(
+            f"Algorithm {algorithm} not found. "
+            f"Available algorithms: {list(FOREST_ENGINES.keys())}"
+        )
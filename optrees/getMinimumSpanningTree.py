@@ -1,20 +1,65 @@
-from optrees import Graph
+from functools import partial
+from inspect import signature
+from typing import Union
 
-from .optimal_trees_algorithms.boruvka import boruvka
-from .optimal_trees_algorithms.kruskal import kruskal
+from optrees import CSRGraph, Graph
+from optrees.graph.csr_graph import spanning_subgraph
+
+from .optimal_trees_algorithms.boruvka import boruvka, numpy_boruvka
+from .optimal_trees_algorithms.kruskal import kruskal, numpy_kruskal
 from .optimal_trees_algorithms.prim import prim
+from .optimal_trees_algorithms.selection import select_mst_algorithm
+
+# Engines tried in order when the selected one does not take the options.
+FALLBACK_ALGORITHMS = ["boruvka", "kruskal", "numpy_boruvka", "numpy_kruskal", "prim"]
+
+
+def _takes_options(algorithm, options: dict) -> bool:
+    try:
+        signature(algorithm).bind(None, **options)
+    except TypeError:
+        return False
+    return True
 
 
-def getMinimumSpanningTree(graph: Graph, algorithm: str = "boruvka"):
+def getMinimumSpanningTree(
+    graph: Union[Graph, CSRGraph],
+    algorithm: str = "auto",
+    return_algorithm: bool = False,
+    **kwargs,
+):
     algorithms = {
         "boruvka": boruvka,
+        "dense_prim": partial(prim, dense=True),
+        "filter_kruskal": partial(kruskal, filtered=True),
         "kruskal": kruskal,
+        "numpy_boruvka": numpy_boruvka,
+        "numpy_kruskal": numpy_kruskal,
         "prim": prim,
     }
+    if algorithm == "auto":
+        algorithm = select_mst_algorithm(graph)
+        if not _takes_options(algorithms[algorithm], kwargs):
+            candidates = [
+                name
+                for name in FALLBACK_ALGORITHMS
+                if _takes_options(algorithms[name], kwargs)
+            ]
+            if not candidates:
+                raise ValueError(
+                    f"No algorithm takes the options {list(kwargs.keys())}."
+                )
+            algorithm = candidates[0]
+        tree = algorithms[algorithm](graph, **kwargs)
+        # The engines label their results MST or MSF; auto always gives MST.
+        if tree.label != "MST":
+            tree = spanning_subgraph(tree, range(tree.edges_count), "MST")
+        return (tree, algorithm) if return_algorithm else tree
     if algorithm in algorithms:
-        return algorithms[algorithm](graph)
+        tree = algorithms[algorithm](graph, **kwargs)
+        return (tree, algorithm) if return_algorithm else tree
     else:
         raise ValueError(
             f"Algorithm {algorithm} not found. "
-            f"Available algorithms: {list(algorithms.keys())}"
+            f"Available algorithms: {['auto'] + list(algorithms.keys())}"
         )
@@ -0,0 +1,25 @@
+from typing import Union
+
+from optrees import CSRGraph, Graph, Vertex
+
+from .optimal_trees_algorithms.bellman_ford import bellman_ford
+from .optimal_trees_algorithms.dijkstra import dijkstra
+
+
+def getShortestPathTree(
+    graph: Union[Graph, CSRGraph],
+    source: Union[str, Vertex],
+    algorithm: str = "dijkstra",
+    **kwargs,
+):
+    algorithms = {
+        "bellman_ford": bellman_ford,
+        "dijkstra": dijkstra,
+    }
+    if algorithm in algorithms:
+        return algorithms[algorithm](graph, source, **kwargs)
+    else:
+        raise ValueError(
+            f"Algorithm {algorithm} not found. "
+            f"Available algorithms: {list(algorithms.keys())}"
+        )
@@ -2,14 +2,13 @@ from typing import Union
 
 
 class BasicVertex:
+    __slots__ = ("__label", "__edges", "__neighbors")
+
     def __init__(self, label: str):
         self.__label = label
         self.__edges: dict = {}
         self.__neighbors: dict = {}
 
-    def __del__(self):
-        print(f"Vertex {self.label} is deleted.")
-
     def __str__(self):
         return self.__label
 
@@ -61,6 +60,8 @@ class BasicVertex:
 
 
 class Vertex(BasicVertex):
+    __slots__ = ()
+
     def __init__(self, label: str):
         super().__init__(label)
 
@@ -75,6 +76,16 @@ class Vertex(BasicVertex):
 
 
 class BasicEdge:
+    __slots__ = (
+        "__left_vertex",
+        "__right_vertex",
+        "__weight",
+        "__orientation",
+        "__label",
+        "__start",
+        "__end",
+    )
+
     def __init__(
         self, left_vertex, right_vertex, weight=0.0, orientation="-", label=None
     ):
@@ -101,9 +112,6 @@ class BasicEdge:
         left_vertex._BasicVertex__edges[self.label] = self
         right_vertex._BasicVertex__edges[self.label] = self
 
-    def __del__(self):
-        print(f"Edge {self.label} is deleted.")
-
     def __str__(self) -> str:
         return self.__label
 
@@ -194,6 +202,8 @@ class BasicEdge:
 
 
 class Edge(BasicEdge):
+    __slots__ = ()
+
     def __init__(
         self, left_vertex, right_vertex, weight=0.0, orientation="-", label=None
     ):
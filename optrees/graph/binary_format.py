@@ -0,0 +1,161 @@
+import struct
+from typing import BinaryIO, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from optrees.graph.csr_graph import CSRGraph, as_csr_graph, index_dtype
+from optrees.graph.graph import Graph
+
+MAGIC = b"OPTREES\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQQQQQ")
+ALIGNMENT = 8
+SEPARATOR = "\x00"
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _section_offsets(
+    label_bytes: int,
+    index_size: int,
+    edges_count: int,
+    vertex_labels_bytes: int,
+    edge_labels_count: int,
+) -> List[int]:
+    # Every section starts on an 8-byte boundary so the edge arrays can be
+    # memory-mapped directly with their native dtype.
+    sizes = [
+        label_bytes,
+        index_size * edges_count,
+        index_size * edges_count,
+        8 * edges_count,
+        edges_count,
+        vertex_labels_bytes,
+        8 * edge_labels_count,
+    ]
+    offsets = []
+    offset = HEADER.size
+    for size in sizes:
+        offset = _aligned(offset)
+        offsets.append(offset)
+        offset += size
+    offsets.append(_aligned(offset))
+    return offsets
+
+
+def _encode_labels(labels: Sequence[str]) -> bytes:
+    if any(SEPARATOR in label for label in labels):
+        raise ValueError("The labels must not contain null characters.")
+    return SEPARATOR.join(labels).encode("utf-8")
+
+
+def _decode_labels(data: bytes, count: int) -> List[str]:
+    return data.decode("utf-8").split(SEPARATOR) if count else []
+
+
+def _write_section(file: BinaryIO, offset: int, data: Union[bytes, np.ndarray]):
+    file.write(b"\x00" * (offset - file.tell()))
+    file.write(data if isinstance(data, bytes) else data.tobytes())
+
+
+def _map_array(file_path: str, dtype: np.dtype, offset: int, length: int) -> np.ndarray:
+    if length == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=length)
+
+
+def write_binary(graph: Union[Graph, CSRGraph], file_path: str):
+    csr_graph = as_csr_graph(graph)
+    index_size = index_dtype(csr_graph.vertices_count).itemsize
+    edges_count = csr_graph.edges_count
+    label = csr_graph.label.encode("utf-8")
+    vertex_labels = _encode_labels(csr_graph.labels)
+    edge_label_ids = np.array(sorted(csr_graph.edge_labels), dtype=np.int64)
+    edge_labels = _encode_labels(
+        [csr_graph.edge_labels[edge_id] for edge_id in edge_label_ids.tolist()]
+    )
+    offsets = _section_offsets(
+        len(label), index_size, edges_count, len(vertex_labels), len(edge_label_ids)
+    )
+    with open(file_path, "wb") as file:
+        file.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                index_size,
+                len(label),
+                csr_graph.vertices_count,
+                edges_count,
+                len(vertex_labels),
+                len(edge_label_ids),
+                len(edge_labels),
+            )
+        )
+        dtype = index_dtype(csr_graph.vertices_count).newbyteorder("<")
+        sections = [
+            label,
+            csr_graph.sources.astype(dtype, copy=False),
+            csr_graph.targets.astype(dtype, copy=False),
+            csr_graph.edge_weights.astype("<f8", copy=False),
+            csr_graph.orientations.astype(np.int8, copy=False),
+            vertex_labels,
+            edge_label_ids.astype("<i8", copy=False),
+            edge_labels,
+        ]
+        for offset, data in zip(offsets, sections):
+            _write_section(file, offset, data)
+
+
+def _read_header(file: BinaryIO) -> Tuple[int, ...]:
+    data = file.read(HEADER.size)
+    if len(data) != HEADER.size:
+        raise ValueError("The file is not a valid binary graph.")
+    magic, version, *fields = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError("The file is not a valid binary graph.")
+    if version != VERSION:
+        raise ValueError(f"The binary graph version {version} is not supported.")
+    return tuple(fields)
+
+
+def read_binary(file_path: str) -> CSRGraph:
+    with open(file_path, "rb") as file:
+        (
+            index_size,
+            label_bytes,
+            vertices_count,
+            edges_count,
+            vertex_labels_bytes,
+            edge_labels_count,
+            edge_labels_bytes,
+        ) = _read_header(file)
+        offsets = _section_offsets(
+            label_bytes,
+            index_size,
+            edges_count,
+            vertex_labels_bytes,
+            edge_labels_count,
+        )
+        file.seek(offsets[0])
+        label = file.read(label_bytes).decode("utf-8")
+        file.seek(offsets[5])
+        labels = _decode_labels(file.read(vertex_labels_bytes), vertices_count)
+        file.seek(offsets[6])
+        edge_label_ids = np.frombuffer(file.read(8 * edge_labels_count), "<i8")
+        file.seek(offsets[7])
+        edge_labels = _decode_labels(file.read(edge_labels_bytes), edge_labels_count)
+    # The edge arrays are read-only views of the file; the operating system
+    # pages them in on demand and shares them between processes.
+    dtype = np.dtype(f"<i{index_size}")
+    return CSRGraph(
+        label,
+        labels,
+        _map_array(file_path, dtype, offsets[1], edges_count),
+        _map_array(file_path, dtype, offsets[2], edges_count),
+        _map_array(file_path, np.dtype("<f8"), offsets[3], edges_count),
+        _map_array(file_path, np.dtype(np.int8), offsets[4], edges_count),
+        dict(zip(edge_label_ids.tolist(), edge_labels)),
+        validate=False,
+    )
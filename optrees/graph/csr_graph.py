@@ -0,0 +1,345 @@
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from optrees.graph.basic_objects import Edge, Vertex
+from optrees.graph.graph import ORIENTATION_CODES, ORIENTATIONS, Graph
+
+
+def index_dtype(size: int) -> np.dtype:
+    return np.dtype(np.int32) if size < np.iinfo(np.int32).max else np.dtype(np.int64)
+
+
+def integral_weights(weights: np.ndarray) -> bool:
+    return bool(np.array_equal(weights, np.floor(weights)))
+
+
+def sort_keys(weights: np.ndarray) -> np.ndarray:
+    # Integer weights spanning fewer than 2**16 values are sorted as uint16,
+    # for which numpy's stable sort is a radix sort; the order is the same.
+    if len(weights) == 0:
+        return weights
+    low = weights.min()
+    if weights.max() - low < 1 << 16 and integral_weights(weights):
+        return (weights - low).astype(np.uint16)
+    return weights
+
+
+class CSRGraph:
+    def __init__(
+        self,
+        label: str,
+        labels: Sequence[str],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        edge_weights: Optional[np.ndarray] = None,
+        orientations: Optional[np.ndarray] = None,
+        edge_labels: Optional[Dict[int, str]] = None,
+        validate: bool = True,
+    ):
+        edges_count = len(sources)
+        if len(targets) != edges_count:
+            raise ValueError("The sources and targets must have the same length.")
+        self.__label = label
+        self.__labels = list(labels)
+        self.__vertex_ids: Optional[Dict[str, int]] = None
+        if validate and len(self.vertex_ids) != len(self.__labels):
+            raise ValueError("The vertex labels must be unique.")
+        dtype = index_dtype(len(self.__labels))
+        self.__sources = np.asarray(sources).astype(dtype, copy=False)
+        self.__targets = np.asarray(targets).astype(dtype, copy=False)
+        if (
+            validate
+            and edges_count
+            and (
+                min(self.__sources.min(), self.__targets.min()) < 0
+                or max(self.__sources.max(), self.__targets.max()) >= len(self.__labels)
+            )
+        ):
+            raise ValueError("The edge endpoints must be valid vertex ids.")
+        self.__edge_weights = (
+            np.zeros(edges_count, dtype=np.float64)
+            if edge_weights is None
+            else np.asarray(edge_weights).astype(np.float64, copy=False)
+        )
+        self.__orientations = (
+            np.zeros(edges_count, dtype=np.int8)
+            if orientations is None
+            else np.asarray(orientations).astype(np.int8, copy=False)
+        )
+        self.__edge_labels = dict(edge_labels) if edge_labels else {}
+        self.__indptr: Optional[np.ndarray] = None
+        self.__indices: Optional[np.ndarray] = None
+        self.__weights: Optional[np.ndarray] = None
+        self.__edge_ids: Optional[np.ndarray] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__label})"
+
+    def __contains__(self, other):
+        if isinstance(other, Vertex):
+            return other.label in self.vertex_ids
+        return False
+
+    @property
+    def label(self) -> str:
+        return self.__label
+
+    @property
+    def labels(self) -> List[str]:
+        return self.__labels
+
+    @property
+    def vertex_ids(self) -> Dict[str, int]:
+        if self.__vertex_ids is None:
+            self.__vertex_ids = {
+                vertex_label: index for index, vertex_label in enumerate(self.__labels)
+            }
+        return self.__vertex_ids
+
+    @property
+    def vertices_count(self) -> int:
+        return len(self.__labels)
+
+    @property
+    def edges_count(self) -> int:
+        return len(self.__sources)
+
+    @property
+    def weight_sum(self) -> float:
+        return float(self.__edge_weights.sum())
+
+    @property
+    def sources(self) -> np.ndarray:
+        return self.__sources
+
+    @property
+    def targets(self) -> np.ndarray:
+        return self.__targets
+
+    @property
+    def edge_weights(self) -> np.ndarray:
+        return self.__edge_weights
+
+    @property
+    def orientations(self) -> np.ndarray:
+        return self.__orientations
+
+    @property
+    def edge_labels(self) -> Dict[int, str]:
+        return self.__edge_labels
+
+    @property
+    def indptr(self) -> np.ndarray:
+        if self.__indptr is None:
+            self.__build_adjacency()
+        return self.__indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        if self.__indices is None:
+            self.__build_adjacency()
+        return self.__indices
+
+    @property
+    def weights(self) -> np.ndarray:
+        if self.__weights is None:
+            self.__build_adjacency()
+        return self.__weights
+
+    @property
+    def edge_ids(self) -> np.ndarray:
+        if self.__edge_ids is None:
+            self.__build_adjacency()
+        return self.__edge_ids
+
+    def __build_adjacency(self):
+        # Every edge is stored in both endpoint rows; orientation is kept in
+        # the edge arrays only.
+        vertices_count = self.vertices_count
+        edges_count = self.edges_count
+        dtype = index_dtype(max(vertices_count, 2 * edges_count))
+        heads = np.concatenate((self.__sources, self.__targets))
+        tails = np.concatenate((self.__targets, self.__sources))
+        ids = np.tile(np.arange(edges_count, dtype=dtype), 2)
+        order = np.lexsort((ids, heads))
+        indptr = np.zeros(vertices_count + 1, dtype=dtype)
+        np.cumsum(np.bincount(heads, minlength=vertices_count), out=indptr[1:])
+        self.__indptr = indptr
+        self.__indices = tails[order]
+        self.__edge_ids = ids[order]
+        self.__weights = self.__edge_weights[self.__edge_ids]
+
+    def degree(self, vertex_id: int) -> int:
+        return int(self.indptr[vertex_id + 1] - self.indptr[vertex_id])
+
+    def neighbors(self, vertex_id: int) -> np.ndarray:
+        return self.indices[self.indptr[vertex_id] : self.indptr[vertex_id + 1]]
+
+    def edge_label(self, edge_id: int) -> str:
+        if edge_id in self.__edge_labels:
+            return self.__edge_labels[edge_id]
+        left = self.__labels[self.__sources[edge_id]]
+        right = self.__labels[self.__targets[edge_id]]
+        return f"{left} {ORIENTATIONS[self.__orientations[edge_id]]} {right}"
+
+    def edge_subgraph(self, edge_ids: Sequence[int], label: str) -> "CSRGraph":
+        edge_ids = np.asarray(edge_ids, dtype=np.int64)
+        edge_labels = {}
+        if self.__edge_labels:
+            positions = {edge_id: index for index, edge_id in enumerate(edge_ids.tolist())}
+            edge_labels = {
+                positions[edge_id]: edge_label
+                for edge_id, edge_label in self.__edge_labels.items()
+                if edge_id in positions
+            }
+        return CSRGraph(
+            label,
+            self.__labels,
+            self.__sources[edge_ids],
+            self.__targets[edge_ids],
+            self.__edge_weights[edge_ids],
+            self.__orientations[edge_ids],
+            edge_labels,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        sources: Sequence[int],
+        targets: Sequence[int],
+        edge_weights: Optional[Sequence[float]] = None,
+        labels: Optional[Sequence[str]] = None,
+        label: str = "G",
+    ) -> "CSRGraph":
+        sources = np.asarray(sources)
+        targets = np.asarray(targets)
+        if labels is None:
+            vertices_count = (
+                int(max(sources.max(), targets.max())) + 1 if len(sources) else 0
+            )
+            labels = [str(vertex) for vertex in range(vertices_count)]
+        return cls(label, labels, sources, targets, edge_weights)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        labels = list(graph.vertices)
+        vertex_ids = {vertex_label: index for index, vertex_label in enumerate(labels)}
+        edges = graph.edges.values()
+        edges_count = len(graph.edges)
+        dtype = index_dtype(len(labels))
+        sources = np.fromiter(
+            (vertex_ids[edge.left_vertex.label] for edge in edges), dtype, edges_count
+        )
+        targets = np.fromiter(
+            (vertex_ids[edge.right_vertex.label] for edge in edges), dtype, edges_count
+        )
+        edge_weights = np.fromiter(
+            (edge.weight if edge.weight is not None else 0 for edge in edges),
+            np.float64,
+            edges_count,
+        )
+        orientations = np.fromiter(
+            (ORIENTATION_CODES[edge.orientation] for edge in edges), np.int8, edges_count
+        )
+        edge_labels = {
+            index: edge.label
+            for index, edge in enumerate(edges)
+            if edge.label
+            != f"{edge.left_vertex.label} {edge.orientation} {edge.right_vertex.label}"
+        }
+        return cls(
+            graph.label, labels, sources, targets, edge_weights, orientations, edge_labels
+        )
+
+    def to_graph(self) -> Graph:
+        graph = Graph(self.__label)
+        vertices = [Vertex(vertex_label) for vertex_label in self.__labels]
+        graph.add_vertices(vertices)
+        for index, (left, right, weight, orientation) in enumerate(
+            zip(
+                self.__sources.tolist(),
+                self.__targets.tolist(),
+                self.__edge_weights.tolist(),
+                self.__orientations.tolist(),
+            )
+        ):
+            graph.add_edge(
+                Edge(
+                    vertices[left],
+                    vertices[right],
+                    weight,
+                    ORIENTATIONS[orientation],
+                    self.__edge_labels.get(index),
+                )
+            )
+        return graph
+
+
+def as_csr_graph(graph: Union[Graph, CSRGraph]) -> CSRGraph:
+    if isinstance(graph, CSRGraph):
+        return graph
+    if isinstance(graph, Graph):
+        return CSRGraph.from_graph(graph)
+    raise TypeError("The graph is not valid.")
+
+
+def spanning_subgraph(
+    graph: Union[Graph, CSRGraph], edge_ids: Sequence[int], label: str
+) -> Union[Graph, CSRGraph]:
+    if isinstance(graph, CSRGraph):
+        return graph.edge_subgraph(edge_ids, label)
+    edges = list(graph.edges.values())
+    subgraph = Graph(label)
+    for edge_id in edge_ids:
+        subgraph.add_edge(edges[edge_id])
+    return subgraph
+
+
+def vertex_id(graph: CSRGraph, vertex: Union[str, Vertex]) -> int:
+    label = vertex.label if isinstance(vertex, Vertex) else vertex
+    if label not in graph.vertex_ids:
+        raise ValueError(f"The vertex {label} is not in the graph.")
+    return graph.vertex_ids[label]
+
+
+def directed_arcs(
+    graph: CSRGraph,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Undirected edges can be used in both directions; "->" and "<-" edges
+    # only from their start vertex. The last array maps arcs to edge ids.
+    orientations = graph.orientations
+    forward = orientations != ORIENTATION_CODES["<-"]
+    backward = orientations != ORIENTATION_CODES["->"]
+    sources, targets = graph.sources, graph.targets
+    weights = graph.edge_weights
+    return (
+        np.concatenate((sources[forward], targets[backward])).astype(np.int64),
+        np.concatenate((targets[forward], sources[backward])).astype(np.int64),
+        np.concatenate((weights[forward], weights[backward])),
+        np.concatenate((np.flatnonzero(forward), np.flatnonzero(backward))),
+    )
+
+
+def connected_components(graph: CSRGraph) -> np.ndarray:
+    # Every vertex hooks onto the smallest label among its neighbours and
+    # then jumps to its label's label until the labels are stable, so each
+    # component ends up labelled by its smallest vertex id.
+    labels = np.arange(graph.vertices_count)
+    sources = graph.sources.astype(np.int64)
+    targets = graph.targets.astype(np.int64)
+    while True:
+        source_labels, target_labels = labels[sources], labels[targets]
+        lowest = np.minimum(source_labels, target_labels)
+        hooked = labels.copy()
+        np.minimum.at(hooked, source_labels, lowest)
+        np.minimum.at(hooked, target_labels, lowest)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            break
+        labels = hooked
+    return np.unique(labels, return_inverse=True)[1]
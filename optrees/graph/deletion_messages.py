@@ -0,0 +1,21 @@
+from optrees.graph.basic_objects import BasicEdge, BasicVertex
+from optrees.graph.graph import BasicGraph
+
+TRACKED_CLASSES = (BasicVertex, BasicEdge, BasicGraph)
+
+
+def _print_deletion(item):
+    print(f"{item.__class__.__name__} {item.label} is deleted.")
+
+
+def enable_deletion_messages():
+    # The finalizer is installed on the classes only while debugging, so
+    # regular runs neither print nor pay for a Python-level __del__ call.
+    for tracked_class in TRACKED_CLASSES:
+        tracked_class.__del__ = _print_deletion
+
+
+def disable_deletion_messages():
+    for tracked_class in TRACKED_CLASSES:
+        if "__del__" in vars(tracked_class):
+            del tracked_class.__del__
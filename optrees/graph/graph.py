@@ -1,10 +1,39 @@
-from typing import List, Tuple
+from itertools import chain, count, zip_longest
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 
 from optrees.graph.basic_objects import Edge, Vertex
+from optrees.graph.sparse_matrix import SparseMatrix
 from optrees.helpers.lists import item_check_exists
 
+if TYPE_CHECKING:
+    from optrees.graph.csr_graph import CSRGraph
+
+DENSE_VERTICES_LIMIT = 2048
+
 
 class BasicGraph:
+    __slots__ = (
+        "__label",
+        "__vertices",
+        "__edges",
+        "__vertices_count",
+        "__edges_count",
+        "__weight_sum",
+        "__vertex_indices",
+    )
+
     def __init__(self, label: str):
         self.__label = label
         self.__vertices: dict = {}
@@ -12,9 +41,7 @@ class BasicGraph:
         self.__vertices_count = 0
         self.__edges_count = 0
         self.__weight_sum = 0.0
-
-    def __del__(self):
-        print(f"Graph {self.label} is deleted.")
+        self.__vertex_indices: Optional[Dict[str, int]] = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.__label})"
@@ -59,11 +86,20 @@ class BasicGraph:
     def weight_sum(self) -> float:
         return self.__weight_sum
 
+    @property
+    def vertex_indices(self) -> Dict[str, int]:
+        if self.__vertex_indices is None:
+            self.__vertex_indices = {
+                label: index for index, label in enumerate(self.__vertices)
+            }
+        return self.__vertex_indices
+
     def add_vertex(self, vertex: Vertex):
         if vertex.label in self.__vertices.keys():
             raise ValueError("The vertex is already in the graph.")
         self.__vertices[vertex.label] = vertex
         self.__vertices_count += 1
+        self.__vertex_indices = None
 
     def add_vertices(self, vertices: List[Vertex]):
         for vertex in vertices:
@@ -79,6 +115,7 @@ class BasicGraph:
         self.__edges[edge.label] = edge
         self.__edges_count += 1
         self.__weight_sum += edge.weight
+        self.__vertex_indices = None
 
     def add_edges(self, edges: List[Edge]):
         for edge in edges:
@@ -91,6 +128,7 @@ class BasicGraph:
             self.remove_edge(edge)
         del self.__vertices[vertex.label]
         self.__vertices_count -= 1
+        self.__vertex_indices = None
 
     def remove_vertices(self, vertices: List[Vertex]):
         for vertex in vertices:
@@ -100,6 +138,9 @@ class BasicGraph:
         if edge.label not in self.__edges.keys():
             raise ValueError("The edge is not in the graph.")
         del self.__edges[edge.label]
+        self.__edges_count -= 1
+        self.__weight_sum -= edge.weight
+        self.__vertex_indices = None
 
     def remove_edges(self, edges: List[Edge]):
         for edge in edges:
@@ -107,6 +148,8 @@ class BasicGraph:
 
 
 class Graph(BasicGraph):
+    __slots__ = ()
+
     def __init__(self, label: str):
         super().__init__(label)
 
@@ -151,45 +194,240 @@ class Graph(BasicGraph):
             )
             self.add_edge(Edge(**edge_dict))
 
-    def adjacency_matrix(self) -> List[List[float]]:
-        pass
+    def adjacency_matrix(
+        self, sparse: Optional[bool] = None, fill_value: float = 0.0
+    ) -> Union[np.ndarray, SparseMatrix]:
+        vertex_indices = self.vertex_indices
+        vertices_count = len(vertex_indices)
+        edges = self.edges.values()
+        edges_count = len(self.edges)
+        lefts = np.fromiter(
+            (vertex_indices[edge.left_vertex.label] for edge in edges),
+            np.int64,
+            edges_count,
+        )
+        rights = np.fromiter(
+            (vertex_indices[edge.right_vertex.label] for edge in edges),
+            np.int64,
+            edges_count,
+        )
+        weights = np.fromiter(
+            (edge.weight if edge.weight is not None else 0 for edge in edges),
+            np.float64,
+            edges_count,
+        )
+        orientations = np.fromiter(
+            (ORIENTATION_CODES[edge.orientation] for edge in edges),
+            np.int8,
+            edges_count,
+        )
+        # Undirected edges fill both entries, directed edges only the one
+        # leaving their start vertex.
+        forward = orientations != ORIENTATION_CODES["<-"]
+        backward = orientations != ORIENTATION_CODES["->"]
+        matrix = SparseMatrix.from_coo(
+            np.concatenate((lefts[forward], rights[backward])),
+            np.concatenate((rights[forward], lefts[backward])),
+            np.concatenate((weights[forward], weights[backward])),
+            (vertices_count, vertices_count),
+        )
+        if sparse is None:
+            sparse = vertices_count > DENSE_VERTICES_LIMIT
+        return matrix if sparse else matrix.toarray(fill_value)
+
+
+ORIENTATIONS = ("-", "->", "<-")
+ORIENTATION_CODES = {orientation: code for code, orientation in enumerate(ORIENTATIONS)}
+
+
+def parse_weight(token: str) -> float:
+    return 0.0 if token == "None" else float(token)
 
 
 class GraphReader:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, chunk_size: int = 1 << 20):
         self.__file_path = file_path
+        self.__chunk_size = chunk_size
 
-    def read(self) -> Graph:
-        read_graph_label = 0
-        read_graph_vertices = 1
-        left_vertex, right_vertex, weight, orientation, label = range(5)
+    @property
+    def file_path(self) -> str:
+        return self.__file_path
+
+    def read_label(self) -> str:
+        with open(self.__file_path) as file:
+            return file.readline().strip()
+
+    def iter_chunks(self) -> Iterator[List[List[str]]]:
+        for edges_tuples, _ in self.__iter_chunks():
+            yield edges_tuples
+
+    def __iter_chunks(self) -> Iterator[Tuple[List[List[str]], List[int]]]:
         with open(self.__file_path) as file:
-            lines = file.readlines()
-            graph = Graph(lines[read_graph_label].strip())
-            for line in lines[read_graph_vertices:]:
-                edge_tuple = line.strip().split()
-                if len(edge_tuple) <= 1 or len(edge_tuple) > 5:
+            file.readline()
+            while True:
+                lines = file.readlines(self.__chunk_size)
+                if not lines:
+                    break
+                # Labels written by write() contain spaces ("a - b"), so the
+                # fifth field takes the rest of the line.
+                edges_tuples = list(
+                    filter(None, (line.split(None, 4) for line in lines))
+                )
+                if not edges_tuples:
+                    continue
+                lengths = list(map(len, edges_tuples))
+                if min(lengths) <= 1:
+                    edge_tuple = edges_tuples[lengths.index(min(lengths))]
                     raise ValueError(f"The edge tuple {edge_tuple} is invalid.")
-                if edge_tuple[left_vertex] not in graph.vertices.keys():
-                    graph.add_vertex(Vertex(edge_tuple[left_vertex]))
-                if edge_tuple[right_vertex] not in graph.vertices.keys():
-                    graph.add_vertex(Vertex(edge_tuple[right_vertex]))
-                edge_dict = {
-                    "left_vertex": graph.vertices[edge_tuple[left_vertex]],
-                    "right_vertex": graph.vertices[edge_tuple[right_vertex]],
-                    "weight": edge_tuple[weight]
-                    if item_check_exists(edge_tuple, weight)
-                    else 0,
-                    "orientation": edge_tuple[orientation]
-                    if item_check_exists(edge_tuple, orientation)
-                    else "-",
-                    "label": edge_tuple[label]
-                    if item_check_exists(edge_tuple, label)
-                    else None,
-                }
-                graph.add_edge(Edge(**edge_dict))
+                if max(lengths) == 5:
+                    for edge_tuple in edges_tuples:
+                        if len(edge_tuple) == 5:
+                            edge_tuple[4] = edge_tuple[4].rstrip()
+                yield edges_tuples, lengths
+
+    def iter_edges(self) -> Iterator[Tuple[str, str, float, str, Optional[str]]]:
+        left_vertex, right_vertex, weight, orientation, label = range(5)
+        for edges_tuples in self.iter_chunks():
+            for edge_tuple in edges_tuples:
+                yield (
+                    edge_tuple[left_vertex],
+                    edge_tuple[right_vertex],
+                    (
+                        parse_weight(edge_tuple[weight])
+                        if item_check_exists(edge_tuple, weight)
+                        else 0.0
+                    ),
+                    (
+                        edge_tuple[orientation]
+                        if item_check_exists(edge_tuple, orientation)
+                        else "-"
+                    ),
+                    edge_tuple[label] if item_check_exists(edge_tuple, label) else None,
+                )
+
+    def read(self) -> Graph:
+        graph = Graph(self.read_label())
+        vertices = graph.vertices
+        for left_label, right_label, weight, orientation, label in self.iter_edges():
+            if left_label not in vertices:
+                graph.add_vertex(Vertex(left_label))
+            if right_label not in vertices:
+                graph.add_vertex(Vertex(right_label))
+            graph.add_edge(
+                Edge(
+                    vertices[left_label],
+                    vertices[right_label],
+                    weight,
+                    orientation,
+                    label,
+                )
+            )
         return graph
 
+    def read_csr(self) -> "CSRGraph":
+        from optrees.graph.csr_graph import CSRGraph, index_dtype
+
+        # Labels are interned with a running counter, so the raw ids grow with
+        # the first appearance of every label and are compacted at the end.
+        vertex_ids: Dict[str, int] = {}
+        counter = count()
+        endpoints, weights, orientations = [], [], []
+        edge_labels: Dict[int, str] = {}
+        edges_count = 0
+        for edges_tuples, lengths in self.__iter_chunks():
+            chunk_size = len(edges_tuples)
+            fields_count = max(lengths)
+            columns: List[Sequence[Optional[str]]]
+            if min(lengths) == fields_count:
+                columns = [
+                    list(map(itemgetter(field), edges_tuples))
+                    for field in range(fields_count)
+                ]
+            else:
+                columns = list(zip_longest(*edges_tuples))
+            endpoints.append(
+                np.fromiter(
+                    map(
+                        vertex_ids.setdefault,
+                        chain.from_iterable(zip(columns[0], columns[1])),
+                        counter,
+                    ),
+                    np.int64,
+                    2 * chunk_size,
+                )
+            )
+            weights.append(self.__parse_weights(columns, chunk_size))
+            orientations.append(self.__parse_orientations(columns, chunk_size))
+            if fields_count == 5:
+                for index, (left, right, code, label) in enumerate(
+                    zip(columns[0], columns[1], orientations[-1].tolist(), columns[4])
+                ):
+                    if (
+                        label is not None
+                        and label != f"{left} {ORIENTATIONS[code]} {right}"
+                    ):
+                        edge_labels[edges_count + index] = label
+            edges_count += chunk_size
+        raw_ids = np.fromiter(vertex_ids.values(), np.int64, len(vertex_ids))
+        dtype = index_dtype(len(vertex_ids))
+        ids = (
+            np.searchsorted(raw_ids, np.concatenate(endpoints)).astype(dtype)
+            if endpoints
+            else np.zeros(0, dtype)
+        )
+        return CSRGraph(
+            self.read_label(),
+            list(vertex_ids),
+            ids[0::2],
+            ids[1::2],
+            np.concatenate(weights) if weights else None,
+            np.concatenate(orientations) if orientations else None,
+            edge_labels,
+        )
+
+    @staticmethod
+    def __parse_orientations(
+        columns: List[Sequence[Optional[str]]], chunk_size: int
+    ) -> np.ndarray:
+        if len(columns) < 4:
+            return np.zeros(chunk_size, dtype=np.int8)
+        orientations = np.fromiter(
+            (ORIENTATION_CODES.get(orientation, -1) for orientation in columns[3]),
+            np.int8,
+            chunk_size,
+        )
+        missing = np.fromiter(
+            (orientation is None for orientation in columns[3]), bool, chunk_size
+        )
+        orientations[missing] = ORIENTATION_CODES["-"]
+        if (orientations < 0).any():
+            raise ValueError("The orientation is not valid.")
+        return orientations
+
+    @staticmethod
+    def __parse_weights(
+        columns: List[Sequence[Optional[str]]], chunk_size: int
+    ) -> np.ndarray:
+        if len(columns) < 3:
+            return np.zeros(chunk_size, dtype=np.float64)
+        weight_column = columns[2]
+        if None in weight_column or "None" in weight_column:
+            weight_column = [
+                0.0 if weight is None else parse_weight(weight)
+                for weight in weight_column
+            ]
+        return np.array(weight_column, dtype=np.float64)
+
+    def read_binary(self) -> "CSRGraph":
+        from optrees.graph.binary_format import read_binary
+
+        return read_binary(self.__file_path)
+
+    def write_binary(self, graph: Union[Graph, "CSRGraph"]):
+        from optrees.graph.binary_format import write_binary
+
+        write_binary(graph, self.__file_path)
+
     def write(self, graph: Graph):
         with open(self.__file_path, "w") as file:
             file.write(f"{graph.label}\n")
@@ -0,0 +1,95 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+class SparseMatrix:
+    def __init__(
+        self,
+        shape: Tuple[int, int],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        data: np.ndarray,
+    ):
+        rows_count, columns_count = shape
+        if len(indptr) != rows_count + 1 or len(indices) != len(data):
+            raise ValueError("The sparse matrix arrays are not consistent.")
+        self.__shape = (rows_count, columns_count)
+        self.__indptr = np.asarray(indptr, dtype=np.int64)
+        self.__indices = np.asarray(indices, dtype=np.int64)
+        self.__data = np.asarray(data, dtype=np.float64)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(shape={self.__shape}, nnz={self.nnz})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.__shape
+
+    @property
+    def indptr(self) -> np.ndarray:
+        return self.__indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self.__indices
+
+    @property
+    def data(self) -> np.ndarray:
+        return self.__data
+
+    @property
+    def nnz(self) -> int:
+        return len(self.__data)
+
+    @classmethod
+    def from_coo(
+        cls,
+        rows: Sequence[int],
+        columns: Sequence[int],
+        data: Sequence[float],
+        shape: Tuple[int, int],
+    ) -> "SparseMatrix":
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        data = np.asarray(data, dtype=np.float64)
+        order = np.lexsort((columns, rows))
+        rows, columns, data = rows[order], columns[order], data[order]
+        # Repeated entries come from parallel edges; the lightest one is kept.
+        if len(data):
+            starts = np.flatnonzero(
+                np.r_[True, (rows[1:] != rows[:-1]) | (columns[1:] != columns[:-1])]
+            )
+            data = np.minimum.reduceat(data, starts)
+            rows, columns = rows[starts], columns[starts]
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(shape, indptr, columns, data)
+
+    def row_ids(self) -> np.ndarray:
+        return np.repeat(np.arange(self.__shape[0]), np.diff(self.__indptr))
+
+    def tocoo(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.row_ids(), self.__indices.copy(), self.__data.copy()
+
+    def toarray(self, fill_value: float = 0.0) -> np.ndarray:
+        matrix = np.full(self.__shape, fill_value, dtype=np.float64)
+        matrix[self.row_ids(), self.__indices] = self.__data
+        return matrix
+
+    def get(self, row: int, column: int, default: float = 0.0) -> float:
+        start, end = self.__indptr[row], self.__indptr[row + 1]
+        position = start + np.searchsorted(self.__indices[start:end], column)
+        if position < end and self.__indices[position] == column:
+            return float(self.__data[position])
+        return default
+
+    def dot(self, vector: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float64)
+        if len(vector) != self.__shape[1]:
+            raise ValueError("The vector length does not match the matrix.")
+        return np.bincount(
+            self.row_ids(),
+            weights=self.__data * vector[self.__indices],
+            minlength=self.__shape[0],
+        )
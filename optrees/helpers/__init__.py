@@ -0,0 +1,3 @@
+# flake8: noqa
+
+from .disjoint_set import DisjointSet
@@ -0,0 +1,51 @@
+from typing import List
+
+
+class DisjointSet:
+    def __init__(self, size: int = 0):
+        self.__parent: List[int] = list(range(size))
+        self.__rank: List[int] = [0] * size
+        self.__components_count = size
+
+    def __len__(self) -> int:
+        return len(self.__parent)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__parent)})"
+
+    @property
+    def components_count(self) -> int:
+        return self.__components_count
+
+    def add(self) -> int:
+        item = len(self.__parent)
+        self.__parent.append(item)
+        self.__rank.append(0)
+        self.__components_count += 1
+        return item
+
+    def find(self, item: int) -> int:
+        parent = self.__parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    def union(self, left: int, right: int) -> bool:
+        left_root = self.find(left)
+        right_root = self.find(right)
+        if left_root == right_root:
+            return False
+        rank = self.__rank
+        if rank[left_root] < rank[right_root]:
+            left_root, right_root = right_root, left_root
+        self.__parent[right_root] = left_root
+        if rank[left_root] == rank[right_root]:
+            rank[left_root] += 1
+        self.__components_count -= 1
+        return True
+
+    def connected(self, left: int, right: int) -> bool:
+        return self.find(left) == self.find(right)
@@ -0,0 +1,132 @@
+from typing import Any, List, Tuple
+
+
+class IndexedHeap:
+    def __init__(self, size: int):
+        self.__items: List[int] = []
+        self.__priorities: List[Any] = [None] * size
+        self.__positions: List[int] = [-1] * size
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, item: int) -> bool:
+        return self.__positions[item] >= 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__items)})"
+
+    def priority(self, item: int) -> Any:
+        return self.__priorities[item]
+
+    def push(self, item: int, priority: Any):
+        if item in self:
+            raise ValueError(f"The item {item} is already in the heap.")
+        self.__priorities[item] = priority
+        self.__positions[item] = len(self.__items)
+        self.__items.append(item)
+        self.__sift_up(len(self.__items) - 1)
+
+    def decrease_key(self, item: int, priority: Any):
+        if item not in self:
+            raise ValueError(f"The item {item} is not in the heap.")
+        if priority > self.__priorities[item]:
+            raise ValueError("The new priority is greater than the current one.")
+        self.__priorities[item] = priority
+        self.__sift_up(self.__positions[item])
+
+    def pop(self) -> Tuple[int, Any]:
+        if not self.__items:
+            raise IndexError("pop from an empty heap")
+        items = self.__items
+        top = items[0]
+        last = items.pop()
+        self.__positions[top] = -1
+        if items:
+            items[0] = last
+            self.__positions[last] = 0
+            self.__sift_down(0)
+        return top, self.__priorities[top]
+
+    def __sift_up(self, position: int):
+        items = self.__items
+        priorities = self.__priorities
+        positions = self.__positions
+        item = items[position]
+        priority = priorities[item]
+        while position > 0:
+            parent_position = (position - 1) >> 1
+            parent = items[parent_position]
+            if priorities[parent] <= priority:
+                break
+            items[position] = parent
+            positions[parent] = position
+            position = parent_position
+        items[position] = item
+        positions[item] = position
+
+    def __sift_down(self, position: int):
+        items = self.__items
+        priorities = self.__priorities
+        positions = self.__positions
+        size = len(items)
+        item = items[position]
+        priority = priorities[item]
+        while True:
+            child_position = 2 * position + 1
+            if child_position >= size:
+                break
+            right_position = child_position + 1
+            if (
+                right_position < size
+                and priorities[items[right_position]] < priorities[items[child_position]]
+            ):
+                child_position = right_position
+            child = items[child_position]
+            if priority <= priorities[child]:
+                break
+            items[position] = child
+            positions[child] = position
+            position = child_position
+        items[position] = item
+        positions[item] = position
+
+
+class RadixHeap:
+    def __init__(self):
+        self.__buckets: List[List[Tuple[int, int]]] = [[] for _ in range(65)]
+        self.__last = 0
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__size})"
+
+    def push(self, item: int, priority: int):
+        # Monotone heap: priorities are non-negative integers never smaller
+        # than the last popped one, and they are bucketed by the highest bit
+        # in which they differ from it.
+        if priority < self.__last:
+            raise ValueError("The priority is smaller than the last popped one.")
+        self.__buckets[(priority ^ self.__last).bit_length()].append((priority, item))
+        self.__size += 1
+
+    def pop(self) -> Tuple[int, int]:
+        if not self.__size:
+            raise IndexError("pop from an empty heap")
+        buckets = self.__buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            entries = buckets[index]
+            buckets[index] = []
+            last = min(entries)[0]
+            self.__last = last
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        priority, item = buckets[0].pop()
+        self.__size -= 1
+        return item, priority
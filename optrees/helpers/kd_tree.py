@@ -0,0 +1,266 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class KDTree:
+    def __init__(self, points: Sequence[Sequence[float]], leaf_size: int = 16):
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2:
+            raise ValueError("The points must be a two-dimensional array.")
+        if not np.isfinite(points).all():
+            raise ValueError("The coordinates must be finite.")
+        if leaf_size < 2:
+            raise ValueError("The leaf size must be at least 2.")
+        points_count, dimensions = points.shape
+        # The tree is complete: leaf j holds positions bounds[j]:bounds[j + 1]
+        # and node i has children 2i and 2i + 1, with the root at 1.
+        leaves_count = 1
+        while points_count > leaves_count * leaf_size:
+            leaves_count *= 2
+        bounds = np.arange(leaves_count + 1) * points_count // leaves_count
+        order = np.arange(points_count)
+        ordered = points
+        # The first position of the right child of every inner node.
+        middles = np.zeros(leaves_count, dtype=np.int64)
+        level_size = 1
+        while level_size < leaves_count:
+            # Every node of the level is split at its median along its widest
+            # dimension; a stable sort by (node, coordinate) splits them all.
+            step = leaves_count // level_size
+            level_bounds = bounds[::step]
+            level = np.arange(level_size)
+            middles[level_size + level] = bounds[step * level + step // 2]
+            starts = level_bounds[:-1]
+            spreads = np.maximum.reduceat(ordered, starts) - np.minimum.reduceat(
+                ordered, starts
+            )
+            nodes = np.repeat(level, np.diff(level_bounds))
+            keys = ordered[np.arange(points_count), spreads.argmax(axis=1)[nodes]]
+            permutation = np.lexsort((keys, nodes))
+            order, ordered = order[permutation], ordered[permutation]
+            level_size *= 2
+        lows = np.empty((2 * leaves_count, dimensions))
+        highs = np.empty((2 * leaves_count, dimensions))
+        if points_count:
+            lows[leaves_count:] = np.minimum.reduceat(ordered, bounds[:-1])
+            highs[leaves_count:] = np.maximum.reduceat(ordered, bounds[:-1])
+        level_size = leaves_count // 2
+        while level_size >= 1:
+            level = slice(level_size, 2 * level_size)
+            left = slice(2 * level_size, 4 * level_size, 2)
+            right = slice(2 * level_size + 1, 4 * level_size, 2)
+            lows[level] = np.minimum(lows[left], lows[right])
+            highs[level] = np.maximum(highs[left], highs[right])
+            level_size //= 2
+        # Leaves are padded to the same size with infinitely far points.
+        sizes = np.diff(bounds)
+        slots = np.arange(leaf_size)
+        padding = slots[None, :] >= sizes[:, None]
+        positions = bounds[:-1, None] + slots[None, :]
+        positions[padding] = -1
+        leaf_points = np.full((leaves_count, leaf_size, dimensions), np.inf)
+        leaf_points[~padding] = ordered[positions[~padding]]
+        self.__points = points
+        self.__leaf_size = leaf_size
+        self.__leaves_count = leaves_count
+        self.__bounds = bounds
+        self.__middles = middles
+        self.__order = order
+        self.__ordered = ordered
+        self.__lows = np.ascontiguousarray(lows.T)
+        self.__highs = np.ascontiguousarray(highs.T)
+        self.__leaf_positions = positions
+        self.__leaf_points = leaf_points
+
+    def __len__(self) -> int:
+        return len(self.__points)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__points)})"
+
+    @property
+    def points(self) -> np.ndarray:
+        return self.__points
+
+    @property
+    def leaf_size(self) -> int:
+        return self.__leaf_size
+
+    def __node_labels(self, labels: np.ndarray) -> np.ndarray:
+        # The label shared by all the points of a node, or -1 when they differ.
+        leaves_count = self.__leaves_count
+        starts = self.__bounds[:-1]
+        lowest = np.minimum.reduceat(labels, starts)
+        highest = np.maximum.reduceat(labels, starts)
+        node_labels = np.empty(2 * leaves_count, dtype=np.int64)
+        node_labels[leaves_count:] = np.where(lowest == highest, lowest, -1)
+        level_size = leaves_count // 2
+        while level_size >= 1:
+            level = slice(level_size, 2 * level_size)
+            left = node_labels[slice(2 * level_size, 4 * level_size, 2)]
+            right = node_labels[slice(2 * level_size + 1, 4 * level_size, 2)]
+            node_labels[level] = np.where(left == right, left, -1)
+            level_size //= 2
+        return node_labels
+
+    def __box_distances(self, queries: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        distances = np.zeros(len(nodes))
+        for lows, highs, coordinates in zip(
+            self.__lows, self.__highs, self.__ordered[queries].T
+        ):
+            gaps = np.maximum(lows[nodes] - coordinates, coordinates - highs[nodes])
+            distances += np.square(np.maximum(gaps, 0))
+        return distances
+
+    def __inner_distances(self, queries: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        # Squared distance from a point inside a box to the sides of the box;
+        # points outside any box of the node have a negative distance.
+        distances = np.full(len(nodes), np.inf)
+        for lows, highs, coordinates in zip(
+            self.__lows, self.__highs, self.__ordered[queries].T
+        ):
+            margins = np.minimum(coordinates - lows[nodes], highs[nodes] - coordinates)
+            distances = np.minimum(distances, margins)
+        return np.where(distances >= 0, np.square(distances), -1.0)
+
+    def __near_children(self, queries: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        # The child holding the query, or the one on its side of the order.
+        return 2 * nodes + (queries >= self.__middles[nodes])
+
+    def closest_pairs(
+        self, labels: Sequence[int], lower_bounds: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        labels = np.asarray(labels, dtype=np.int64)
+        if len(labels) != len(self.__points):
+            raise ValueError("There must be one label for every point.")
+        if lower_bounds is not None and len(lower_bounds) != len(labels):
+            raise ValueError("There must be one lower bound for every point.")
+        points_count = len(labels)
+        if points_count == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0)
+        leaves_count = self.__leaves_count
+        tree_labels = labels[self.__order]
+        node_labels = self.__node_labels(tree_labels)
+        leaf_labels = np.where(
+            self.__leaf_positions >= 0, tree_labels[self.__leaf_positions], -1
+        )
+        # The closest distance found for every label bounds the search of all
+        # the points with that label, since only the closest pair is needed.
+        label_bests = np.full(int(labels.max()) + 1, np.inf)
+        query_bests = np.full(points_count, np.inf)
+        partners = np.full(points_count, -1, dtype=np.int64)
+        # Points that cannot be closer to another label than the best pair
+        # already found for their own label stop walking.
+        squared_bounds = np.zeros(points_count)
+        if lower_bounds is not None:
+            squared_bounds = np.square(lower_bounds[self.__order])
+        # Every point walks the tree without a stack, starting at its own
+        # leaf: it enters a node from its parent (0), or comes back to it from
+        # its near child (1) or from its far child (2).
+        queries = np.arange(points_count)
+        nodes = leaves_count + np.repeat(
+            np.arange(leaves_count), np.diff(self.__bounds)
+        )
+        arrivals = np.zeros(points_count, dtype=np.int8)
+        while len(queries):
+            # Coming back from the near child, the far child is next.
+            sideways = np.flatnonzero(arrivals == 1)
+            nodes[sideways] = (
+                self.__near_children(queries[sideways], nodes[sideways]) ^ 1
+            )
+            arrivals[sideways] = 0
+            up = arrivals == 2
+            entering = np.flatnonzero(arrivals == 0)
+            entering_queries = queries[entering]
+            entering_nodes = nodes[entering]
+            entering_labels = tree_labels[entering_queries]
+            entering_bests = label_bests[entering_labels]
+            pruned = (
+                (node_labels[entering_nodes] == entering_labels)
+                | (squared_bounds[entering_queries] >= entering_bests)
+                | (
+                    self.__box_distances(entering_queries, entering_nodes)
+                    >= entering_bests
+                )
+            )
+            at_leaf = entering_nodes >= leaves_count
+            leaves = ~pruned & at_leaf
+            if leaves.any():
+                self.__search_leaves(
+                    entering_queries[leaves],
+                    entering_labels[leaves],
+                    entering_nodes[leaves] - leaves_count,
+                    leaf_labels,
+                    query_bests,
+                    partners,
+                    label_bests,
+                )
+            up[entering[pruned | at_leaf]] = True
+            descending = entering[~pruned & ~at_leaf]
+            nodes[descending] = self.__near_children(
+                queries[descending], nodes[descending]
+            )
+            # Leaving the root ends the walk, and so does leaving a box that
+            # holds the whole ball of the best distance around the point.
+            walking = ~up | (nodes > 1)
+            rising = np.flatnonzero(up & walking)
+            parents = nodes[rising] // 2
+            near = self.__near_children(queries[rising], parents) == nodes[rising]
+            back = rising[near]
+            inside = self.__inner_distances(queries[back], nodes[back]) >= (
+                label_bests[tree_labels[queries[back]]]
+            )
+            walking[back[inside]] = False
+            arrivals[rising] = np.where(near, 1, 2)
+            nodes[rising] = parents
+            queries, nodes, arrivals = (
+                queries[walking],
+                nodes[walking],
+                arrivals[walking],
+            )
+        if lower_bounds is not None:
+            # Every subtree left out was at least as far as the final best of
+            # the label, and merging labels only moves the other labels away,
+            # so the bounds stay valid for any coarser labels.
+            lower_bounds[self.__order] = np.sqrt(
+                np.maximum(
+                    squared_bounds,
+                    np.minimum(query_bests, label_bests[tree_labels]),
+                )
+            )
+        # The closest pair of every label is the one of its best point.
+        found = np.flatnonzero(
+            (partners >= 0) & (query_bests == label_bests[tree_labels])
+        )
+        _, first = np.unique(tree_labels[found], return_index=True)
+        found = found[first]
+        order = self.__order
+        return (
+            order[found],
+            order[partners[found]],
+            np.sqrt(query_bests[found]),
+        )
+
+    def __search_leaves(
+        self,
+        queries: np.ndarray,
+        query_labels: np.ndarray,
+        leaves: np.ndarray,
+        leaf_labels: np.ndarray,
+        query_bests: np.ndarray,
+        partners: np.ndarray,
+        label_bests: np.ndarray,
+    ):
+        coordinates = self.__ordered[queries]
+        distances = np.square(self.__leaf_points[leaves] - coordinates[:, None, :]).sum(
+            axis=2
+        )
+        distances[leaf_labels[leaves] == query_labels[:, None]] = np.inf
+        slots = distances.argmin(axis=1)
+        closest = distances[np.arange(len(queries)), slots]
+        better = closest < query_bests[queries]
+        query_bests[queries[better]] = closest[better]
+        partners[queries[better]] = self.__leaf_positions[leaves, slots][better]
+        np.minimum.at(label_bests, query_labels, closest)
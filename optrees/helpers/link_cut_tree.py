@@ -0,0 +1,154 @@
+from typing import Any, List
+
+
+class LinkCutTree:
+    def __init__(self):
+        self.__left: List[int] = []
+        self.__right: List[int] = []
+        self.__parent: List[int] = []
+        self.__flip: List[bool] = []
+        self.__values: List[Any] = []
+        self.__best: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__values)})"
+
+    def add(self, value: Any) -> int:
+        node = len(self.__values)
+        self.__left.append(-1)
+        self.__right.append(-1)
+        self.__parent.append(-1)
+        self.__flip.append(False)
+        self.__values.append(value)
+        self.__best.append(node)
+        return node
+
+    def value(self, node: int) -> Any:
+        return self.__values[node]
+
+    def set_value(self, node: int, value: Any):
+        self.__access(node)
+        self.__values[node] = value
+        self.__update(node)
+
+    def __is_root(self, node: int) -> bool:
+        parent = self.__parent[node]
+        return parent < 0 or (
+            self.__left[parent] != node and self.__right[parent] != node
+        )
+
+    def __push(self, node: int):
+        if self.__flip[node]:
+            left, right = self.__left[node], self.__right[node]
+            self.__left[node], self.__right[node] = right, left
+            if left >= 0:
+                self.__flip[left] = not self.__flip[left]
+            if right >= 0:
+                self.__flip[right] = not self.__flip[right]
+            self.__flip[node] = False
+
+    def __update(self, node: int):
+        values, best = self.__values, self.__best
+        candidate = node
+        for child in (self.__left[node], self.__right[node]):
+            if child >= 0 and values[best[child]] > values[candidate]:
+                candidate = best[child]
+        best[node] = candidate
+
+    def __rotate(self, node: int):
+        left, right, parents = self.__left, self.__right, self.__parent
+        parent = parents[node]
+        grandparent = parents[parent]
+        if not self.__is_root(parent):
+            if left[grandparent] == parent:
+                left[grandparent] = node
+            else:
+                right[grandparent] = node
+        parents[node] = grandparent
+        if left[parent] == node:
+            child = right[node]
+            left[parent] = child
+            right[node] = parent
+        else:
+            child = left[node]
+            right[parent] = child
+            left[node] = parent
+        if child >= 0:
+            parents[child] = parent
+        parents[parent] = node
+        self.__update(parent)
+        self.__update(node)
+
+    def __splay(self, node: int):
+        path = [node]
+        while not self.__is_root(path[-1]):
+            path.append(self.__parent[path[-1]])
+        for item in reversed(path):
+            self.__push(item)
+        left = self.__left
+        while not self.__is_root(node):
+            parent = self.__parent[node]
+            if not self.__is_root(parent):
+                grandparent = self.__parent[parent]
+                same_side = (left[grandparent] == parent) == (left[parent] == node)
+                self.__rotate(parent if same_side else node)
+            self.__rotate(node)
+
+    def __access(self, node: int):
+        # Makes the root-to-node path preferred; node ends as the splay root
+        # of that path with no deeper nodes on its right.
+        last = -1
+        current = node
+        while current >= 0:
+            self.__splay(current)
+            self.__right[current] = last
+            self.__update(current)
+            last = current
+            current = self.__parent[current]
+        self.__splay(node)
+
+    def __make_root(self, node: int):
+        self.__access(node)
+        self.__flip[node] = not self.__flip[node]
+        self.__push(node)
+
+    def find_root(self, node: int) -> int:
+        self.__access(node)
+        while True:
+            self.__push(node)
+            if self.__left[node] < 0:
+                break
+            node = self.__left[node]
+        self.__splay(node)
+        return node
+
+    def connected(self, left: int, right: int) -> bool:
+        return left == right or self.find_root(left) == self.find_root(right)
+
+    def link(self, left: int, right: int):
+        # With left as the root of its tree, both nodes are connected exactly
+        # when the root of right is left; this saves a second access.
+        self.__make_root(left)
+        if self.find_root(right) == left:
+            raise ValueError("The nodes are already connected.")
+        self.__parent[left] = right
+
+    def cut(self, left: int, right: int):
+        self.__make_root(left)
+        self.__access(right)
+        self.__push(left)
+        if self.__left[right] != left or self.__right[left] >= 0:
+            raise ValueError("The nodes are not adjacent.")
+        self.__left[right] = -1
+        self.__parent[left] = -1
+        self.__update(right)
+
+    def path_max(self, left: int, right: int) -> int:
+        self.__make_root(left)
+        if self.find_root(right) != left:
+            raise ValueError("The nodes are not connected.")
+        self.__access(right)
+        return self.__best[right]
@@ -0,0 +1,117 @@
+from collections import deque
+from typing import List, Tuple
+
+import numpy as np
+
+
+class FlowNetwork:
+    def __init__(
+        self,
+        vertices_count: int,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        capacities: np.ndarray,
+    ):
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        capacities = np.asarray(capacities, dtype=np.float64)
+        if not len(sources) == len(targets) == len(capacities):
+            raise ValueError("The edge arrays must have the same length.")
+        if (capacities < 0).any():
+            raise ValueError("The capacities must be non-negative.")
+        # Every undirected edge gives two residual arcs, 2e and 2e + 1, which
+        # are sorted by tail so the arcs of a vertex are contiguous.
+        tails = np.empty(2 * len(sources), dtype=np.int64)
+        tails[0::2], tails[1::2] = sources, targets
+        heads = np.empty_like(tails)
+        heads[0::2], heads[1::2] = targets, sources
+        order = np.argsort(tails, kind="stable")
+        positions = np.empty_like(order)
+        positions[order] = np.arange(len(order))
+        indptr = np.zeros(vertices_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=vertices_count), out=indptr[1:])
+        self.__vertices_count = vertices_count
+        self.__indptr: List[int] = indptr.tolist()
+        self.__heads: List[int] = heads[order].tolist()
+        self.__reverse: List[int] = positions[order ^ 1].tolist()
+        self.__capacities: List[float] = np.repeat(capacities, 2)[order].tolist()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__vertices_count})"
+
+    @property
+    def vertices_count(self) -> int:
+        return self.__vertices_count
+
+    def __levels(self, residual: List[float], source: int) -> List[int]:
+        indptr, heads = self.__indptr, self.__heads
+        levels = [-1] * self.__vertices_count
+        levels[source] = 0
+        queue = deque([source])
+        while queue:
+            vertex = queue.popleft()
+            level = levels[vertex] + 1
+            for arc in range(indptr[vertex], indptr[vertex + 1]):
+                head = heads[arc]
+                if levels[head] < 0 and residual[arc] > 0:
+                    levels[head] = level
+                    queue.append(head)
+        return levels
+
+    def __blocking_flow(
+        self, residual: List[float], levels: List[int], source: int, sink: int
+    ) -> float:
+        indptr, heads, reverse = self.__indptr, self.__heads, self.__reverse
+        following = indptr[:-1]
+        path: List[int] = []
+        total = 0.0
+        vertex = source
+        while True:
+            if vertex == sink:
+                bottleneck = min(residual[arc] for arc in path)
+                for arc in path:
+                    residual[arc] -= bottleneck
+                    residual[reverse[arc]] += bottleneck
+                total += bottleneck
+                # Retreat to the tail of the first saturated arc.
+                for position, arc in enumerate(path):
+                    if residual[arc] <= 0:
+                        break
+                vertex = heads[reverse[path[position]]]
+                del path[position:]
+                continue
+            end = indptr[vertex + 1]
+            arc = following[vertex]
+            next_level = levels[vertex] + 1
+            while arc < end and (
+                residual[arc] <= 0 or levels[heads[arc]] != next_level
+            ):
+                arc += 1
+            following[vertex] = arc
+            if arc < end:
+                path.append(arc)
+                vertex = heads[arc]
+            else:
+                # Dead end: the vertex is removed from the level graph.
+                levels[vertex] = -1
+                if not path:
+                    return total
+                arc = path.pop()
+                vertex = heads[reverse[arc]]
+                following[vertex] += 1
+
+    def min_cut(self, source: int, sink: int) -> Tuple[float, List[bool]]:
+        if source == sink:
+            raise ValueError("The source and the sink must be different.")
+        residual = list(self.__capacities)
+        value = 0.0
+        while True:
+            levels = self.__levels(residual, source)
+            if levels[sink] < 0:
+                # The vertices still reachable from the source form the
+                # source side of a minimum cut.
+                return value, [level >= 0 for level in levels]
+            value += self.__blocking_flow(residual, levels, source, sink)
+
+    def max_flow(self, source: int, sink: int) -> float:
+        return self.min_cut(source, sink)[0]
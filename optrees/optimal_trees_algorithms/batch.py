@@ -0,0 +1,169 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from optrees.optimal_trees_algorithms.boruvka import (
+    _vertices_count,
+    numpy_boruvka_edges,
+)
+
+PackedInstances = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _pack_instances(instances: Sequence[tuple]) -> PackedInstances:
+    # Every instance gets its own block of vertex ids, so the disjoint union
+    # of all instances is one graph whose spanning forest is the union of
+    # the instance forests.
+    edges_counts = []
+    vertices_counts = []
+    for index, instance in enumerate(instances):
+        if len(instance) not in (3, 4):
+            raise ValueError(f"The instance {index} is not valid.")
+        edges_count = len(instance[2])
+        if not len(instance[0]) == len(instance[1]) == edges_count:
+            raise ValueError(f"The instance {index} arrays have different lengths.")
+        edges_counts.append(edges_count)
+        vertices_counts.append(
+            instance[3]
+            if len(instance) == 4
+            else _vertices_count(np.asarray(instance[0]), np.asarray(instance[1]))
+        )
+    vertex_offsets = np.zeros(len(instances) + 1, dtype=np.int64)
+    np.cumsum(vertices_counts, out=vertex_offsets[1:])
+    edge_offsets = np.zeros(len(instances) + 1, dtype=np.int64)
+    np.cumsum(edges_counts, out=edge_offsets[1:])
+    if not instances:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0), vertex_offsets, edge_offsets
+    shifts = np.repeat(vertex_offsets[:-1], edges_counts)
+    sources = np.concatenate([instance[0] for instance in instances]).astype(np.int64)
+    targets = np.concatenate([instance[1] for instance in instances]).astype(np.int64)
+    weights = np.concatenate([instance[2] for instance in instances]).astype(np.float64)
+    return sources + shifts, targets + shifts, weights, vertex_offsets, edge_offsets
+
+
+def _instance_sorted_edge_ids(
+    weights: np.ndarray, edge_offsets: np.ndarray
+) -> np.ndarray:
+    # Instances are grouped by the power of two of their edge count and padded
+    # with infinite weights, so every group is one row-wise stable sort and
+    # the padding is at most half of a group.
+    lengths = np.diff(edge_offsets)
+    sorted_ids = np.empty(len(weights), dtype=np.int64)
+    buckets = np.ceil(np.log2(np.maximum(lengths, 1))).astype(np.int64)
+    for bucket in np.unique(buckets).tolist():
+        members = np.flatnonzero(buckets == bucket)
+        member_lengths = lengths[members]
+        width = int(member_lengths.max())
+        if width == 0:
+            continue
+        columns = np.arange(width)
+        valid = columns < member_lengths[:, None]
+        positions = edge_offsets[members][:, None] + columns
+        padded = np.full(valid.shape, np.inf)
+        padded[valid] = weights[positions[valid]]
+        # Padding sits after the real edges, so a stable sort keeps it last
+        # even when real weights are infinite.
+        order = np.argsort(padded, axis=1, kind="stable")
+        sorted_ids[positions[valid]] = np.take_along_axis(positions, order, 1)[valid]
+    return sorted_ids
+
+
+def _batch_kruskal(packed: PackedInstances) -> np.ndarray:
+    sources, targets, weights, vertex_offsets, edge_offsets = packed
+    # Every instance is ordered on its own, so each one stops as soon as its
+    # tree is complete. Local vertex ids keep the union-find lists small.
+    order = _instance_sorted_edge_ids(weights, edge_offsets)
+    instance_ids = np.repeat(np.arange(len(edge_offsets) - 1), np.diff(edge_offsets))
+    local_offsets = vertex_offsets[instance_ids]
+    sorted_sources = (sources[order] - local_offsets).tolist()
+    sorted_targets = (targets[order] - local_offsets).tolist()
+    edge_ids = order.tolist()
+    selected: List[int] = []
+    for start, end, vertices_count in zip(
+        edge_offsets[:-1].tolist(),
+        edge_offsets[1:].tolist(),
+        np.diff(vertex_offsets).tolist(),
+    ):
+        parent = list(range(vertices_count))
+        rank = [0] * vertices_count
+        remaining = vertices_count - 1
+        for index, left, right in zip(
+            edge_ids[start:end], sorted_sources[start:end], sorted_targets[start:end]
+        ):
+            while parent[left] != left:
+                parent[left] = parent[parent[left]]
+                left = parent[left]
+            while parent[right] != right:
+                parent[right] = parent[parent[right]]
+                right = parent[right]
+            if left == right:
+                continue
+            if rank[left] < rank[right]:
+                left, right = right, left
+            parent[right] = left
+            if rank[left] == rank[right]:
+                rank[left] += 1
+            selected.append(index)
+            remaining -= 1
+            if remaining <= 0:
+                break
+    return np.sort(np.array(selected, dtype=np.int64))
+
+
+def _batch_boruvka(packed: PackedInstances) -> np.ndarray:
+    sources, targets, weights, vertex_offsets, _ = packed
+    return np.sort(
+        numpy_boruvka_edges(sources, targets, weights, int(vertex_offsets[-1]))
+    )
+
+
+BATCH_ENGINES = {
+    "boruvka": _batch_boruvka,
+    "kruskal": _batch_kruskal,
+}
+
+
+def _solve_batch(instances: Sequence[tuple], algorithm: str) -> List[np.ndarray]:
+    packed = _pack_instances(instances)
+    edge_offsets = packed[4]
+    selected = BATCH_ENGINES[algorithm](packed)
+    bounds = np.searchsorted(selected, edge_offsets)
+    local_ids = selected - np.repeat(edge_offsets[:-1], np.diff(bounds))
+    return np.split(local_ids, bounds[1:-1])
+
+
+def _balanced_groups(instances: Sequence[tuple], groups_count: int) -> List[slice]:
+    sizes = np.fromiter((len(instance[2]) for instance in instances), np.int64)
+    cumulative = np.cumsum(sizes)
+    targets = cumulative[-1] * np.arange(1, groups_count) / groups_count
+    bounds = np.r_[0, np.searchsorted(cumulative, targets, side="right"), len(sizes)]
+    bounds = np.unique(bounds).tolist()
+    return [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def batch_minimum_spanning_trees(
+    instances: Sequence[tuple],
+    algorithm: str = "kruskal",
+    workers: Optional[int] = None,
+) -> List[np.ndarray]:
+    if algorithm not in BATCH_ENGINES:
+        raise ValueError(
+            f"Algorithm {algorithm} not found. "
+            f"Available algorithms: {list(BATCH_ENGINES.keys())}"
+        )
+    instances = list(instances)
+    if not instances:
+        return []
+    if workers is None or workers <= 1 or len(instances) <= 1:
+        return _solve_batch(instances, algorithm)
+    groups = _balanced_groups(instances, min(workers, len(instances)))
+    results: List[np.ndarray] = []
+    with ProcessPoolExecutor(min(workers, len(groups))) as executor:
+        for group_result in executor.map(
+            _solve_batch, (instances[group] for group in groups), repeat(algorithm)
+        ):
+            results.extend(group_result)
+    return results
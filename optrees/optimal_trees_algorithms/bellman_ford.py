@@ -0,0 +1,67 @@
+from collections import deque
+from typing import Iterable, List, Optional, Union
+
+from optrees import Graph, Vertex
+from optrees.graph.csr_graph import (
+    CSRGraph,
+    as_csr_graph,
+    directed_arcs,
+    spanning_subgraph,
+    vertex_id,
+)
+from optrees.optimal_trees_algorithms.dijkstra import (
+    Adjacency,
+    _out_adjacency,
+    _path_tree_arcs,
+    _target_ids,
+)
+
+
+def _spfa_parents(adjacency: Adjacency, source: int) -> List[int]:
+    bounds, arcs, heads, weights = adjacency
+    vertices_count = len(bounds) - 1
+    distances = [float("inf")] * vertices_count
+    parents = [-1] * vertices_count
+    # A shortest path has fewer arcs than vertices; a longer one can only
+    # come from a negative cycle.
+    lengths = [0] * vertices_count
+    queued = [False] * vertices_count
+    distances[source] = 0
+    queue = deque([source])
+    queued[source] = True
+    while queue:
+        vertex = queue.popleft()
+        queued[vertex] = False
+        distance = distances[vertex]
+        for slot in range(bounds[vertex], bounds[vertex + 1]):
+            neighbor = heads[slot]
+            candidate = distance + weights[slot]
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                parents[neighbor] = arcs[slot]
+                lengths[neighbor] = lengths[vertex] + 1
+                if lengths[neighbor] >= vertices_count:
+                    raise ValueError(
+                        "The graph has a negative cycle reachable from the source."
+                    )
+                if not queued[neighbor]:
+                    queued[neighbor] = True
+                    queue.append(neighbor)
+    return parents
+
+
+def bellman_ford(
+    graph: Union[Graph, CSRGraph],
+    source: Union[str, Vertex],
+    targets: Optional[Iterable[Union[str, Vertex]]] = None,
+):
+    csr_graph = as_csr_graph(graph)
+    source_id = vertex_id(csr_graph, source)
+    target_ids = _target_ids(csr_graph, targets)
+    arc_sources, arc_targets, weights, edge_ids = directed_arcs(csr_graph)
+    adjacency = _out_adjacency(
+        csr_graph.vertices_count, arc_sources, arc_targets, weights
+    )
+    parents = _spfa_parents(adjacency, source_id)
+    selected = _path_tree_arcs(parents, arc_sources, source_id, target_ids)
+    return spanning_subgraph(graph, edge_ids[selected].tolist(), "SPT")
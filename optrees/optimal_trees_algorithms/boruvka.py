@@ -1,31 +1,254 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
 import numpy as np
 
 from optrees import Graph
+from optrees.graph.csr_graph import (
+    CSRGraph,
+    as_csr_graph,
+    sort_keys,
+    spanning_subgraph,
+)
+from optrees.helpers.disjoint_set import DisjointSet
+
+
+def _boruvka_edge_ids(
+    vertices_count: int,
+    sources: Sequence[int],
+    targets: Sequence[int],
+    weights: Sequence[float],
+) -> List[int]:
+    components = DisjointSet(vertices_count)
+    selected: List[int] = []
+    while components.components_count > 1:
+        cheapest: dict = {}
+        for index, (left, right) in enumerate(zip(sources, targets)):
+            left_component = components.find(left)
+            right_component = components.find(right)
+            if left_component == right_component:
+                continue
+            # Ties are broken by edge position so every round picks a forest.
+            key = (weights[index], index)
+            for component in (left_component, right_component):
+                if component not in cheapest or key < cheapest[component]:
+                    cheapest[component] = key
+        if not cheapest:
+            break
+        for _, index in cheapest.values():
+            if components.union(sources[index], targets[index]):
+                selected.append(index)
+    return selected
+
+
+def boruvka(graph: Union[Graph, CSRGraph], workers: Optional[int] = None):
+    csr_graph = as_csr_graph(graph)
+    if workers is not None and workers > 1:
+        selected = numpy_boruvka_edges(
+            csr_graph.sources,
+            csr_graph.targets,
+            csr_graph.edge_weights,
+            csr_graph.vertices_count,
+            workers,
+        )
+        return spanning_subgraph(graph, selected.tolist(), "MST")
+    selected = _boruvka_edge_ids(
+        csr_graph.vertices_count,
+        csr_graph.sources.tolist(),
+        csr_graph.targets.tolist(),
+        csr_graph.edge_weights.tolist(),
+    )
+    return spanning_subgraph(graph, selected, "MST")
+
+
+def _cheapest_ranks(
+    left: np.ndarray,
+    right: np.ndarray,
+    ranks: np.ndarray,
+    components_count: int,
+    missing: int,
+) -> np.ndarray:
+    cheapest = np.full(components_count, missing, dtype=np.int64)
+    np.minimum.at(cheapest, left, ranks)
+    np.minimum.at(cheapest, right, ranks)
+    return cheapest
+
+
+def _merge_components(
+    components_count: int, components: np.ndarray, others: np.ndarray
+) -> np.ndarray:
+    identity = np.arange(components_count)
+    parent = identity.copy()
+    parent[components] = others
+    # Two components that picked the same edge point at each other; the
+    # smaller id becomes the root of the merged component.
+    mutual = (parent[parent] == identity) & (identity < parent)
+    parent[mutual] = identity[mutual]
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            break
+        parent = grandparent
+    return np.unique(parent, return_inverse=True)[1].reshape(-1)
+
+
+def _vertices_count(sources: np.ndarray, targets: np.ndarray) -> int:
+    return int(max(sources.max(), targets.max())) + 1 if len(sources) else 0
+
+
+def numpy_boruvka_edges(
+    sources: Sequence[int],
+    targets: Sequence[int],
+    weights: Sequence[float],
+    vertices_count: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> np.ndarray:
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    if vertices_count is None:
+        vertices_count = _vertices_count(sources, targets)
+    edges_count = len(weights)
+    # Ranks in (weight, index) order give every edge a distinct key, which
+    # makes the cheapest edges of a round a forest and the result unique.
+    edge_ids = np.argsort(sort_keys(weights), kind="stable")
+    left = sources[edge_ids]
+    right = targets[edge_ids]
+    if workers is not None and workers > 1:
+        selected = _parallel_boruvka_ranks(left, right, vertices_count, workers)
+        return edge_ids[selected].astype(np.int64)
+    ranks = np.arange(edges_count, dtype=np.int64)
+    loops = left == right
+    left, right, ranks = left[~loops], right[~loops], ranks[~loops]
+    components_count = vertices_count
+    selected = []
+    while len(ranks) > 0:
+        cheapest = _cheapest_ranks(left, right, ranks, components_count, edges_count)
+        components = np.flatnonzero(cheapest < edges_count)
+        chosen_ranks = cheapest[components]
+        selected.append(edge_ids[np.unique(chosen_ranks)])
+        # The edge arrays stay ordered by rank, so positions are a binary search.
+        positions = np.searchsorted(ranks, chosen_ranks)
+        others = np.where(
+            left[positions] == components, right[positions], left[positions]
+        )
+        labels = _merge_components(components_count, components, others)
+        components_count = int(labels.max()) + 1
+        left, right = labels[left], labels[right]
+        keep = left != right
+        left, right, ranks = left[keep], right[keep], ranks[keep]
+        if len(ranks) == 0:
+            break
+        # Contract parallel edges between the same pair of components, keeping
+        # the lowest rank of every group (a segmented minimum).
+        pairs = np.minimum(left, right) * components_count + np.maximum(left, right)
+        order = np.argsort(pairs)
+        pairs = pairs[order]
+        starts = np.flatnonzero(np.r_[True, pairs[1:] != pairs[:-1]])
+        group_ranks = np.minimum.reduceat(ranks[order], starts)
+        by_rank = np.argsort(group_ranks)
+        ranks = group_ranks[by_rank]
+        left, right = np.divmod(pairs[starts][by_rank], components_count)
+    if not selected:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(selected).astype(np.int64)
 
 
-def boruvka(graph: Graph):
-    mst_graph = Graph("MST")
-    components = {vertex: {vertex} for vertex in graph.vertices}
-    while mst_graph.vertices_count < graph.vertices_count:
-        min_edges = {}
-        for vertex in graph.vertices.values():
-            min_weight = np.Infinity
-            min_edge = None
-            for edge in vertex.edges.values():
-                if (
-                    components[edge.right_vertex.label]
-                    != components[edge.left_vertex.label]
+_shared_arrays: Dict[str, Tuple[SharedMemory, np.ndarray]] = {}
+
+
+def _attach_shared_array(name: str, shape: int) -> Tuple[SharedMemory, np.ndarray]:
+    shared_memory = SharedMemory(name=name)
+    return shared_memory, np.ndarray(shape, dtype=np.int64, buffer=shared_memory.buf)
+
+
+def _attach_shard_arrays(specs: Dict[str, Tuple[str, int]]):
+    for key, (name, shape) in specs.items():
+        _shared_arrays[key] = _attach_shared_array(name, shape)
+
+
+def _shard_cheapest_ranks(
+    start: int, end: int, components_count: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    labels = _shared_arrays["labels"][1]
+    left = labels[_shared_arrays["left"][1][start:end]]
+    right = labels[_shared_arrays["right"][1][start:end]]
+    ranks = np.arange(start, end, dtype=np.int64)
+    keep = left != right
+    missing = end
+    cheapest = _cheapest_ranks(
+        left[keep], right[keep], ranks[keep], components_count, missing
+    )
+    components = np.flatnonzero(cheapest < missing)
+    return components, cheapest[components]
+
+
+def _create_shared_array(array: np.ndarray) -> Tuple[SharedMemory, np.ndarray]:
+    shared_memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared_array = np.ndarray(array.shape, dtype=np.int64, buffer=shared_memory.buf)
+    shared_array[:] = array
+    return shared_memory, shared_array
+
+
+def _parallel_boruvka_ranks(
+    left: np.ndarray, right: np.ndarray, vertices_count: int, workers: int
+) -> np.ndarray:
+    edges_count = len(left)
+    shared = {
+        "left": _create_shared_array(left),
+        "right": _create_shared_array(right),
+        "labels": _create_shared_array(np.arange(vertices_count, dtype=np.int64)),
+    }
+    labels = shared["labels"][1]
+    bounds = np.linspace(0, edges_count, workers + 1).astype(np.int64).tolist()
+    starts, ends = bounds[:-1], bounds[1:]
+    selected = []
+    components_count = vertices_count
+    try:
+        specs = {
+            key: (shared_memory.name, len(array))
+            for key, (shared_memory, array) in shared.items()
+        }
+        with ProcessPoolExecutor(
+            workers, initializer=_attach_shard_arrays, initargs=(specs,)
+        ) as executor:
+            while components_count > 1:
+                cheapest = np.full(components_count, edges_count, dtype=np.int64)
+                for components, ranks in executor.map(
+                    _shard_cheapest_ranks, starts, ends, repeat(components_count)
                 ):
-                    if edge.weight < min_weight:
-                        min_weight = edge.weight
-                        min_edge = edge
-            if min_edge is not None:
-                min_edges[min_edge.label] = min_edge
-        for edge in min_edges.values():
-            mst_graph.add_edge(edge)
-            new_components = components[edge.left_vertex.label].union(
-                components[edge.right_vertex.label]
-            )
-            for vertex in new_components:
-                components[vertex] = new_components
-    return mst_graph
+                    np.minimum.at(cheapest, components, ranks)
+                components = np.flatnonzero(cheapest < edges_count)
+                if len(components) == 0:
+                    break
+                chosen_ranks = cheapest[components]
+                selected.append(np.unique(chosen_ranks))
+                left_components = labels[left[chosen_ranks]]
+                right_components = labels[right[chosen_ranks]]
+                others = np.where(
+                    left_components == components, right_components, left_components
+                )
+                merged = _merge_components(components_count, components, others)
+                labels[:] = merged[labels]
+                components_count = int(merged.max()) + 1
+    finally:
+        for shared_memory, _ in shared.values():
+            shared_memory.close()
+            shared_memory.unlink()
+    if not selected:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(selected)
+
+
+def numpy_boruvka(graph: Union[Graph, CSRGraph], workers: Optional[int] = None):
+    csr_graph = as_csr_graph(graph)
+    selected = numpy_boruvka_edges(
+        csr_graph.sources,
+        csr_graph.targets,
+        csr_graph.edge_weights,
+        csr_graph.vertices_count,
+        workers,
+    )
+    return spanning_subgraph(graph, selected.tolist(), "MST")
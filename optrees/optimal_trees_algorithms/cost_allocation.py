@@ -0,0 +1,395 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from math import factorial
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from optrees import Graph, Vertex
+from optrees.graph.csr_graph import CSRGraph, as_csr_graph, vertex_id
+from optrees.helpers.disjoint_set import DisjointSet
+
+SHAPLEY_PLAYERS_LIMIT = 24
+COALITIONS_CHUNK_SIZE = 1 << 15
+
+_worker_matrix: Optional[np.ndarray] = None
+
+
+def _cost_matrix(csr_graph: CSRGraph, source: int) -> Tuple[np.ndarray, List[str]]:
+    # The source takes index 0 and the players follow in vertex order.
+    # Orientations are ignored and parallel edges keep the cheapest weight.
+    order = np.r_[source, np.delete(np.arange(csr_graph.vertices_count), source)]
+    positions = np.empty_like(order)
+    positions[order] = np.arange(len(order))
+    matrix = np.full((len(order), len(order)), np.inf)
+    sources = positions[csr_graph.sources]
+    targets = positions[csr_graph.targets]
+    np.minimum.at(matrix, (sources, targets), csr_graph.edge_weights)
+    np.minimum.at(matrix, (targets, sources), csr_graph.edge_weights)
+    np.fill_diagonal(matrix, 0)
+    labels = csr_graph.labels
+    return matrix, [labels[vertex] for vertex in order[1:].tolist()]
+
+
+def _prim_parents(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Dense Prim from the source; returns the order in which the players
+    # join the tree and the tree vertex each one joins through.
+    vertices_count = len(matrix)
+    distances = matrix[0].copy()
+    parents = np.zeros(vertices_count, dtype=np.int64)
+    in_tree = np.zeros(vertices_count, dtype=bool)
+    in_tree[0] = True
+    order = np.empty(vertices_count - 1, dtype=np.int64)
+    for step in range(vertices_count - 1):
+        candidates = np.where(in_tree, np.inf, distances)
+        vertex = int(np.argmin(candidates))
+        if not np.isfinite(candidates[vertex]):
+            raise ValueError("Some players are not connected to the source.")
+        in_tree[vertex] = True
+        order[step] = vertex
+        closer = ~in_tree & (matrix[vertex] < distances)
+        distances[closer] = matrix[vertex][closer]
+        parents[closer] = vertex
+    return order, parents
+
+
+def _popcounts(players_count: int) -> np.ndarray:
+    popcounts = np.zeros(1, dtype=np.int64)
+    for _ in range(players_count):
+        popcounts = np.concatenate((popcounts, popcounts + 1))
+    return popcounts
+
+
+def _batch_prim_costs(matrix: np.ndarray, masks: np.ndarray, size: int) -> np.ndarray:
+    # Prim runs on many coalitions of the same size at once: each row is one
+    # bitmask and each step adds the closest remaining member of every row.
+    excluded = np.where(masks[:, None] >> np.arange(len(matrix) - 1) & 1, 0, np.inf)
+    distances = matrix[0, 1:] + excluded
+    rows = np.arange(len(masks))
+    totals = np.zeros(len(masks))
+    for _ in range(size):
+        chosen = distances.argmin(axis=1)
+        totals += distances[rows, chosen]
+        excluded[rows, chosen] = np.inf
+        distances = np.minimum(distances, matrix[chosen + 1, 1:]) + excluded
+    return totals
+
+
+def _coalition_costs(matrix: np.ndarray) -> np.ndarray:
+    players_count = len(matrix) - 1
+    costs = np.zeros(1 << players_count)
+    popcounts = _popcounts(players_count)
+    by_size = np.argsort(popcounts, kind="stable")
+    bounds = np.searchsorted(popcounts[by_size], np.arange(players_count + 2))
+    for size in range(1, players_count + 1):
+        for start in range(bounds[size], bounds[size + 1], COALITIONS_CHUNK_SIZE):
+            end = min(start + COALITIONS_CHUNK_SIZE, bounds[size + 1])
+            costs[by_size[start:end]] = _batch_prim_costs(
+                matrix, by_size[start:end], size
+            )
+    return costs
+
+
+class MSTGame:
+    def __init__(
+        self,
+        graph: Union[Graph, CSRGraph],
+        source: Union[str, Vertex],
+        cache_size: Optional[int] = 1 << 16,
+    ):
+        csr_graph = as_csr_graph(graph)
+        source_id = vertex_id(csr_graph, source)
+        self.__source = csr_graph.labels[source_id]
+        self.__matrix, self.__players = _cost_matrix(csr_graph, source_id)
+        self.__player_ids = {label: index for index, label in enumerate(self.__players)}
+        self.__costs: Optional[np.ndarray] = None
+        # Coalitions are cached by bitmask, so repeated evaluations of the
+        # same coalition cost one dictionary lookup.
+        self.__mask_cost = lru_cache(maxsize=cache_size)(self.__compute_mask_cost)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__source}, {len(self.__players)})"
+
+    @property
+    def source(self) -> str:
+        return self.__source
+
+    @property
+    def players(self) -> List[str]:
+        return self.__players
+
+    @property
+    def cost_matrix(self) -> np.ndarray:
+        return self.__matrix
+
+    def mask(self, coalition: Iterable[Union[str, Vertex]]) -> int:
+        mask = 0
+        for player in coalition:
+            label = player.label if isinstance(player, Vertex) else player
+            if label not in self.__player_ids:
+                raise ValueError(f"The player {label} is not in the game.")
+            mask |= 1 << self.__player_ids[label]
+        return mask
+
+    def cost(self, coalition: Iterable[Union[str, Vertex]]) -> float:
+        return self.mask_cost(self.mask(coalition))
+
+    def mask_cost(self, mask: int) -> float:
+        if self.__costs is not None:
+            return float(self.__costs[mask])
+        return self.__mask_cost(mask)
+
+    def cache_info(self):
+        return self.__mask_cost.cache_info()
+
+    def __compute_mask_cost(self, mask: int) -> float:
+        members = [0] + [
+            index + 1 for index in range(len(self.__players)) if mask >> index & 1
+        ]
+        submatrix = self.__matrix[np.ix_(members, members)]
+        distances = submatrix[0].copy()
+        in_tree = np.zeros(len(members), dtype=bool)
+        in_tree[0] = True
+        total = 0.0
+        for _ in range(len(members) - 1):
+            vertex = int(np.argmin(np.where(in_tree, np.inf, distances)))
+            total += distances[vertex]
+            in_tree[vertex] = True
+            np.minimum(distances, submatrix[vertex], out=distances)
+        return float(total)
+
+    def coalition_costs(self) -> np.ndarray:
+        if len(self.__players) > SHAPLEY_PLAYERS_LIMIT:
+            raise ValueError(
+                f"The game has more than {SHAPLEY_PLAYERS_LIMIT} players; "
+                "its coalitions can not be enumerated."
+            )
+        if self.__costs is None:
+            self.__costs = _coalition_costs(self.__matrix)
+        return self.__costs
+
+
+def _allocation(game: MSTGame, shares: np.ndarray) -> Dict[str, float]:
+    return dict(zip(game.players, shares.tolist()))
+
+
+def _check_complete(game: MSTGame, rule: str):
+    off_diagonal = ~np.eye(len(game.cost_matrix), dtype=bool)
+    if not np.isfinite(game.cost_matrix[off_diagonal]).all():
+        raise ValueError(f"The {rule} rule requires a complete graph.")
+
+
+def bird(graph: Union[Graph, CSRGraph], source: Union[str, Vertex]) -> Dict[str, float]:
+    game = MSTGame(graph, source)
+    matrix = game.cost_matrix
+    order, parents = _prim_parents(matrix)
+    # Every player pays the edge through which Prim's algorithm reaches it.
+    shares = np.empty(len(game.players))
+    shares[order - 1] = matrix[order, parents[order]]
+    return _allocation(game, shares)
+
+
+def folk(graph: Union[Graph, CSRGraph], source: Union[str, Vertex]) -> Dict[str, float]:
+    game = MSTGame(graph, source)
+    matrix = game.cost_matrix
+    order, parents = _prim_parents(matrix)
+    # The folk rule is the Shapley value of the irreducible game, whose costs
+    # are the bottleneck costs of the minimum spanning tree. It is computed
+    # with the obligation rule: tree edges are merged in increasing order and
+    # every merge is paid by the drop of its members' obligations, 1 / |S|
+    # for a component without the source and 0 for the one with it.
+    weights = matrix[order, parents[order]]
+    vertices_count = len(matrix)
+    components = DisjointSet(vertices_count)
+    sizes = [1] * vertices_count
+    # The source has no obligation from the start.
+    obligations = [0.0] + [1.0] * (vertices_count - 1)
+    nodes = list(range(vertices_count))
+    tree_parent = [-1] * (2 * vertices_count - 1)
+    amounts = [0.0] * (2 * vertices_count - 1)
+    next_node = vertices_count
+    for edge in np.argsort(weights, kind="stable").tolist():
+        left = components.find(int(order[edge]))
+        right = components.find(int(parents[order[edge]]))
+        components.union(left, right)
+        root = components.find(left)
+        size = sizes[left] + sizes[right]
+        with_source = obligations[left] == 0 or obligations[right] == 0
+        obligation = 0.0 if with_source else 1 / size
+        for child in (left, right):
+            tree_parent[nodes[child]] = next_node
+            amounts[nodes[child]] = weights[edge] * (obligations[child] - obligation)
+        sizes[root], obligations[root], nodes[root] = size, obligation, next_node
+        next_node += 1
+    # Each player pays the amounts of every merge on its way to the root.
+    totals = [0.0] * next_node
+    for merge in range(next_node - 2, -1, -1):
+        totals[merge] = amounts[merge] + totals[tree_parent[merge]]
+    return _allocation(game, np.array(totals[1:vertices_count]))
+
+
+def kar(graph: Union[Graph, CSRGraph], source: Union[str, Vertex]) -> Dict[str, float]:
+    game = MSTGame(graph, source)
+    _check_complete(game, "Kar")
+    players_count = len(game.players)
+    costs = game.coalition_costs()
+    # Shapley value: every coalition without a player is weighted by the
+    # number of orders in which the player joins right after it.
+    popcounts = _popcounts(players_count)
+    coefficients = np.array(
+        [
+            factorial(size) * factorial(players_count - size - 1)
+            for size in range(players_count)
+        ],
+        dtype=np.float64,
+    ) / factorial(players_count)
+    masks = np.arange(len(costs))
+    shares = np.empty(players_count)
+    for player in range(players_count):
+        without = masks[(masks >> player & 1) == 0]
+        shares[player] = np.dot(
+            coefficients[popcounts[without]],
+            costs[without | 1 << player] - costs[without],
+        )
+    return _allocation(game, shares)
+
+
+def _permutation_marginals(matrix: np.ndarray, permutation: List[int]) -> List[float]:
+    # Players join one at a time. The new tree only needs the previous tree
+    # edges and the edges of the new player, which are merged in weight order
+    # and filtered with one union-find reused along the permutation.
+    parent = list(range(len(matrix)))
+    members = [0]
+    tree: List[Tuple[float, int, int]] = []
+    total = 0.0
+    marginals = [0.0] * len(permutation)
+    for player in permutation:
+        vertex = player + 1
+        weights = matrix[vertex, members].tolist()
+        candidates = sorted(tree + list(zip(weights, [vertex] * len(members), members)))
+        members.append(vertex)
+        for member in members:
+            parent[member] = member
+        tree = []
+        new_total = 0.0
+        for candidate in candidates:
+            left, right = candidate[1], candidate[2]
+            while parent[left] != left:
+                parent[left] = parent[parent[left]]
+                left = parent[left]
+            while parent[right] != right:
+                parent[right] = parent[parent[right]]
+                right = parent[right]
+            if left == right:
+                continue
+            parent[right] = left
+            tree.append(candidate)
+            new_total += candidate[0]
+            if len(tree) == len(members) - 1:
+                break
+        marginals[player] = new_total - total
+        total = new_total
+    return marginals
+
+
+def _sample_batch(
+    matrix: np.ndarray, seed: np.random.SeedSequence, samples: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    generator = np.random.default_rng(seed)
+    sums = np.zeros(len(matrix) - 1)
+    squares = np.zeros(len(matrix) - 1)
+    for _ in range(samples):
+        permutation = generator.permutation(len(matrix) - 1).tolist()
+        marginals = np.array(_permutation_marginals(matrix, permutation))
+        sums += marginals
+        squares += marginals * marginals
+    return sums, squares
+
+
+def _start_worker(matrix: np.ndarray):
+    global _worker_matrix
+    _worker_matrix = matrix
+
+
+def _worker_sample_batch(
+    seed: np.random.SeedSequence, samples: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    return _sample_batch(_worker_matrix, seed, samples)
+
+
+def _batch_results(
+    matrix: np.ndarray,
+    seeds: List[np.random.SeedSequence],
+    sizes: List[int],
+    workers: Optional[int],
+):
+    if workers is None or workers <= 1:
+        for seed, size in zip(seeds, sizes):
+            yield _sample_batch(matrix, seed, size)
+        return
+    with ProcessPoolExecutor(
+        workers, initializer=_start_worker, initargs=(matrix,)
+    ) as executor:
+        # Batches are submitted a few at a time and the pending ones are
+        # cancelled when the caller stops early.
+        futures = []
+        try:
+            for index, (seed, size) in enumerate(zip(seeds, sizes)):
+                futures.append(executor.submit(_worker_sample_batch, seed, size))
+                if index >= 2 * workers:
+                    yield futures.pop(0).result()
+            while futures:
+                yield futures.pop(0).result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def monte_carlo_shapley(
+    graph: Union[Graph, CSRGraph],
+    source: Union[str, Vertex],
+    samples: int = 1000,
+    tolerance: Optional[float] = None,
+    confidence: float = 0.95,
+    batch_size: int = 100,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    return_intervals: bool = False,
+):
+    game = MSTGame(graph, source)
+    _check_complete(game, "Shapley")
+    players_count = len(game.players)
+    if players_count == 0:
+        raise ValueError("The game has no players.")
+    if samples < 2:
+        raise ValueError("At least two samples are needed.")
+    if batch_size < 1:
+        raise ValueError("The batch size must be at least 1.")
+    # Every batch has its own seed, so the estimate only depends on the seed
+    # and not on the number of workers.
+    sizes = [batch_size] * (samples // batch_size)
+    if samples % batch_size:
+        sizes.append(samples % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    quantile = NormalDist().inv_cdf((1 + confidence) / 2)
+    sums = np.zeros(players_count)
+    squares = np.zeros(players_count)
+    count = 0
+    half_widths = np.full(players_count, np.inf)
+    for index, (batch_sums, batch_squares) in enumerate(
+        _batch_results(game.cost_matrix, seeds, sizes, workers)
+    ):
+        sums += batch_sums
+        squares += batch_squares
+        count += sizes[index]
+        means = sums / count
+        if count > 1:
+            variances = np.maximum(squares - count * means * means, 0) / (count - 1)
+            half_widths = quantile * np.sqrt(variances / count)
+        if tolerance is not None and half_widths.max() <= tolerance:
+            break
+    shares = _allocation(game, sums / count)
+    if return_intervals:
+        return shares, _allocation(game, half_widths)
+    return shares
@@ -0,0 +1,157 @@
+from heapq import heappop, heappush
+from typing import Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from optrees import Graph, Vertex
+from optrees.graph.csr_graph import (
+    CSRGraph,
+    as_csr_graph,
+    directed_arcs,
+    spanning_subgraph,
+    vertex_id,
+)
+from optrees.helpers.heaps import RadixHeap
+
+Adjacency = Tuple[List[int], List[int], List[int], list]
+
+
+def _out_adjacency(
+    vertices_count: int, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray
+) -> Adjacency:
+    # Flat out-arc lists; the arcs of a vertex sit between two offsets, so
+    # only the vertices a search settles are ever looked at.
+    order = np.argsort(sources, kind="stable")
+    indptr = np.zeros(vertices_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=vertices_count), out=indptr[1:])
+    return (
+        indptr.tolist(),
+        order.tolist(),
+        targets[order].tolist(),
+        weights[order].tolist(),
+    )
+
+
+def _binary_heap_dijkstra(
+    adjacency: Adjacency, source: int, targets: Optional[Set[int]]
+) -> List[int]:
+    bounds, arcs, heads, weights = adjacency
+    vertices_count = len(bounds) - 1
+    distances = [float("inf")] * vertices_count
+    parents = [-1] * vertices_count
+    settled = [False] * vertices_count
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        distance, vertex = heappop(heap)
+        if settled[vertex]:
+            continue
+        settled[vertex] = True
+        if targets is not None:
+            targets.discard(vertex)
+            if not targets:
+                break
+        for slot in range(bounds[vertex], bounds[vertex + 1]):
+            neighbor = heads[slot]
+            candidate = distance + weights[slot]
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                parents[neighbor] = arcs[slot]
+                heappush(heap, (candidate, neighbor))
+    return parents
+
+
+def _radix_heap_dijkstra(
+    adjacency: Adjacency, source: int, targets: Optional[Set[int]]
+) -> List[int]:
+    bounds, arcs, heads, weights = adjacency
+    vertices_count = len(bounds) - 1
+    distances = [-1] * vertices_count
+    parents = [-1] * vertices_count
+    settled = [False] * vertices_count
+    distances[source] = 0
+    heap = RadixHeap()
+    heap.push(source, 0)
+    while len(heap) > 0:
+        vertex, distance = heap.pop()
+        if settled[vertex]:
+            continue
+        settled[vertex] = True
+        if targets is not None:
+            targets.discard(vertex)
+            if not targets:
+                break
+        for slot in range(bounds[vertex], bounds[vertex + 1]):
+            neighbor = heads[slot]
+            candidate = distance + weights[slot]
+            if distances[neighbor] < 0 or candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                parents[neighbor] = arcs[slot]
+                heap.push(neighbor, candidate)
+    return parents
+
+
+DIJKSTRA_HEAPS = {
+    "binary": _binary_heap_dijkstra,
+    "radix": _radix_heap_dijkstra,
+}
+
+
+def _target_ids(
+    csr_graph: CSRGraph, targets: Optional[Iterable[Union[str, Vertex]]]
+) -> Optional[Set[int]]:
+    if targets is None:
+        return None
+    return {vertex_id(csr_graph, target) for target in targets}
+
+
+def _path_tree_arcs(
+    parents: List[int],
+    arc_sources: np.ndarray,
+    source: int,
+    targets: Optional[Set[int]],
+) -> List[int]:
+    if targets is None:
+        return [arc for arc in parents if arc >= 0]
+    # Only the paths to the requested targets are kept.
+    sources = arc_sources.tolist()
+    on_tree = [False] * len(parents)
+    on_tree[source] = True
+    selected = []
+    for target in targets:
+        vertex = target
+        while not on_tree[vertex] and parents[vertex] >= 0:
+            on_tree[vertex] = True
+            selected.append(parents[vertex])
+            vertex = sources[parents[vertex]]
+    return selected
+
+
+def dijkstra(
+    graph: Union[Graph, CSRGraph],
+    source: Union[str, Vertex],
+    targets: Optional[Iterable[Union[str, Vertex]]] = None,
+    heap: str = "binary",
+):
+    if heap not in DIJKSTRA_HEAPS:
+        raise ValueError(
+            f"Heap {heap} not found. Available heaps: {list(DIJKSTRA_HEAPS.keys())}"
+        )
+    csr_graph = as_csr_graph(graph)
+    source_id = vertex_id(csr_graph, source)
+    target_ids = _target_ids(csr_graph, targets)
+    arc_sources, arc_targets, weights, edge_ids = directed_arcs(csr_graph)
+    if (weights < 0).any():
+        raise ValueError("Dijkstra's algorithm requires non-negative weights.")
+    if heap == "radix":
+        if not np.array_equal(weights, np.floor(weights)):
+            raise ValueError("The radix heap requires integer weights.")
+        weights = weights.astype(np.int64)
+    adjacency = _out_adjacency(
+        csr_graph.vertices_count, arc_sources, arc_targets, weights
+    )
+    parents = DIJKSTRA_HEAPS[heap](
+        adjacency, source_id, None if target_ids is None else set(target_ids)
+    )
+    selected = _path_tree_arcs(parents, arc_sources, source_id, target_ids)
+    return spanning_subgraph(graph, edge_ids[selected].tolist(), "SPT")
@@ -0,0 +1,202 @@
+from itertools import count
+from typing import Dict, List, Optional, Set, Tuple
+
+from optrees import Edge, Graph
+from optrees.graph.csr_graph import CSRGraph
+from optrees.helpers.link_cut_tree import LinkCutTree
+from optrees.optimal_trees_algorithms.kruskal import _kruskal_edge_ids
+
+VERTEX_KEY = (float("-inf"), -1)
+
+
+def _other_label(edge: Edge, label: str) -> str:
+    left_label = edge.left_vertex.label
+    return edge.right_vertex.label if left_label == label else left_label
+
+
+class DynamicMST:
+    def __init__(self, graph: Graph):
+        self.__graph = graph
+        self.__tree = Graph("MSF")
+        self.__forest = LinkCutTree()
+        self.__order = count()
+        self.__keys: Dict[str, Tuple[float, int]] = {}
+        self.__vertex_nodes: Dict[str, int] = {}
+        self.__edge_nodes: Dict[str, int] = {}
+        self.__node_edges: Dict[int, Edge] = {}
+        self.__free_nodes: List[int] = []
+        self.__tree_edges: Dict[str, Dict[str, Edge]] = {}
+        self.__non_tree_edges: Dict[str, Dict[str, Edge]] = {}
+        for vertex in graph.vertices.values():
+            self.__add_vertex(vertex)
+        edges = list(graph.edges.values())
+        for edge in edges:
+            self.__keys[edge.label] = self.__new_key(edge)
+        csr_graph = CSRGraph.from_graph(graph)
+        selected = set(
+            _kruskal_edge_ids(
+                csr_graph.vertices_count,
+                csr_graph.sources.tolist(),
+                csr_graph.targets.tolist(),
+                csr_graph.edge_weights,
+            )
+        )
+        for index, edge in enumerate(edges):
+            if index in selected:
+                self.__link(edge)
+            else:
+                self.__add_non_tree_edge(edge)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__graph.label})"
+
+    @property
+    def graph(self) -> Graph:
+        return self.__graph
+
+    @property
+    def tree(self) -> Graph:
+        return self.__tree
+
+    @property
+    def weight_sum(self) -> float:
+        return self.__tree.weight_sum
+
+    def is_tree_edge(self, edge: Edge) -> bool:
+        return edge.label in self.__edge_nodes
+
+    def add_edge(self, edge: Edge):
+        self.__graph.add_edge(edge)
+        for vertex in (edge.left_vertex, edge.right_vertex):
+            if vertex.label not in self.__vertex_nodes:
+                self.__add_vertex(vertex)
+        self.__keys[edge.label] = self.__new_key(edge)
+        self.__insert(edge)
+
+    def remove_edge(self, edge: Edge):
+        self.__graph.remove_edge(edge)
+        if self.is_tree_edge(edge):
+            self.__cut(edge)
+            self.__reconnect(edge.left_vertex.label, edge.right_vertex.label)
+        else:
+            self.__remove_non_tree_edge(edge)
+        del self.__keys[edge.label]
+
+    def update_weight(self, edge: Edge, weight: float):
+        old_key = self.__keys[edge.label]
+        tree_edge = self.is_tree_edge(edge)
+        if tree_edge:
+            self.__cut(edge)
+        # The graphs keep a running weight sum, so the edge is re-added with
+        # the new weight; its tie-breaking order is kept.
+        self.__graph.remove_edge(edge)
+        edge.weight = weight
+        self.__graph.add_edge(edge)
+        new_key = (self.__weight(edge), old_key[1])
+        self.__keys[edge.label] = new_key
+        if tree_edge:
+            if new_key < old_key:
+                self.__link(edge)
+            else:
+                self.__add_non_tree_edge(edge)
+                self.__reconnect(edge.left_vertex.label, edge.right_vertex.label)
+        elif new_key < old_key:
+            self.__remove_non_tree_edge(edge)
+            self.__insert(edge)
+
+    @staticmethod
+    def __weight(edge: Edge) -> float:
+        return edge.weight if edge.weight is not None else 0
+
+    def __new_key(self, edge: Edge) -> Tuple[float, int]:
+        # Ties are broken by insertion order, which keeps the forest unique.
+        return self.__weight(edge), next(self.__order)
+
+    def __add_vertex(self, vertex):
+        self.__vertex_nodes[vertex.label] = self.__forest.add(VERTEX_KEY)
+        self.__tree_edges[vertex.label] = {}
+        self.__non_tree_edges[vertex.label] = {}
+        if vertex.label not in self.__tree.vertices:
+            self.__tree.add_vertex(vertex)
+
+    def __insert(self, edge: Edge):
+        left_node = self.__vertex_nodes[edge.left_vertex.label]
+        right_node = self.__vertex_nodes[edge.right_vertex.label]
+        if left_node == right_node:
+            self.__add_non_tree_edge(edge)
+        elif not self.__forest.connected(left_node, right_node):
+            self.__link(edge)
+        else:
+            # Cycle property: the new edge replaces the heaviest edge on the
+            # tree path between its endpoints when it is lighter.
+            heaviest = self.__node_edges[self.__forest.path_max(left_node, right_node)]
+            if self.__keys[edge.label] < self.__keys[heaviest.label]:
+                self.__cut(heaviest)
+                self.__add_non_tree_edge(heaviest)
+                self.__link(edge)
+            else:
+                self.__add_non_tree_edge(edge)
+
+    def __link(self, edge: Edge):
+        key = self.__keys[edge.label]
+        if self.__free_nodes:
+            node = self.__free_nodes.pop()
+            self.__forest.set_value(node, key)
+        else:
+            node = self.__forest.add(key)
+        self.__forest.link(node, self.__vertex_nodes[edge.left_vertex.label])
+        self.__forest.link(node, self.__vertex_nodes[edge.right_vertex.label])
+        self.__edge_nodes[edge.label] = node
+        self.__node_edges[node] = edge
+        self.__tree_edges[edge.left_vertex.label][edge.label] = edge
+        self.__tree_edges[edge.right_vertex.label][edge.label] = edge
+        self.__tree.add_edge(edge)
+
+    def __cut(self, edge: Edge):
+        node = self.__edge_nodes.pop(edge.label)
+        del self.__node_edges[node]
+        self.__forest.cut(node, self.__vertex_nodes[edge.left_vertex.label])
+        self.__forest.cut(node, self.__vertex_nodes[edge.right_vertex.label])
+        self.__free_nodes.append(node)
+        del self.__tree_edges[edge.left_vertex.label][edge.label]
+        del self.__tree_edges[edge.right_vertex.label][edge.label]
+        self.__tree.remove_edge(edge)
+
+    def __add_non_tree_edge(self, edge: Edge):
+        self.__non_tree_edges[edge.left_vertex.label][edge.label] = edge
+        self.__non_tree_edges[edge.right_vertex.label][edge.label] = edge
+
+    def __remove_non_tree_edge(self, edge: Edge):
+        del self.__non_tree_edges[edge.left_vertex.label][edge.label]
+        self.__non_tree_edges[edge.right_vertex.label].pop(edge.label, None)
+
+    def __smaller_side(self, left_label: str, right_label: str) -> Set[str]:
+        # Both sides are explored one vertex at a time, so the search stops
+        # after visiting about twice the smaller component.
+        searches = [([left_label], {left_label}), ([right_label], {right_label})]
+        while True:
+            for stack, seen in searches:
+                if not stack:
+                    return seen
+                label = stack.pop()
+                for edge in self.__tree_edges[label].values():
+                    other = _other_label(edge, label)
+                    if other not in seen:
+                        seen.add(other)
+                        stack.append(other)
+
+    def __reconnect(self, left_label: str, right_label: str):
+        side = self.__smaller_side(left_label, right_label)
+        replacement: Optional[Edge] = None
+        for label in side:
+            for edge in self.__non_tree_edges[label].values():
+                if _other_label(edge, label) in side:
+                    continue
+                if (
+                    replacement is None
+                    or self.__keys[edge.label] < self.__keys[replacement.label]
+                ):
+                    replacement = edge
+        if replacement is not None:
+            self.__remove_non_tree_edge(replacement)
+            self.__link(replacement)
@@ -0,0 +1,258 @@
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from optrees import Graph, Vertex
+from optrees.graph.csr_graph import (
+    CSRGraph,
+    as_csr_graph,
+    directed_arcs,
+    spanning_subgraph,
+    vertex_id,
+)
+
+
+def _cheapest_in_arcs(
+    targets: np.ndarray, weights: np.ndarray, vertices_count: int
+) -> np.ndarray:
+    order = np.argsort(weights, kind="stable")
+    heads, first = np.unique(targets[order], return_index=True)
+    in_arcs = np.full(vertices_count, -1, dtype=np.int64)
+    in_arcs[heads] = order[first]
+    return in_arcs
+
+
+def _cycle_labels(parents: List[int]) -> Tuple[np.ndarray, int]:
+    # The cheapest in-arcs form a functional graph; every vertex is walked
+    # once and a walk that meets its own trail has closed a cycle.
+    labels = [-1] * len(parents)
+    trail = [0] * len(parents)
+    cycles_count = 0
+    for start in range(len(parents)):
+        vertex = start
+        while vertex >= 0 and trail[vertex] == 0:
+            trail[vertex] = start + 1
+            vertex = parents[vertex]
+        if vertex >= 0 and trail[vertex] == start + 1:
+            while labels[vertex] < 0:
+                labels[vertex] = cycles_count
+                vertex = parents[vertex]
+            cycles_count += 1
+    return np.array(labels, dtype=np.int64), cycles_count
+
+
+def _edmonds_arc_ids(
+    vertices_count: int,
+    root: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    kept = np.flatnonzero((sources != targets) & (targets != root))
+    sources, targets, weights = sources[kept], targets[kept], weights[kept]
+    levels = []
+    while True:
+        in_arcs = _cheapest_in_arcs(targets, weights, vertices_count)
+        missing = in_arcs < 0
+        missing[root] = False
+        if missing.any():
+            raise ValueError("Some vertices are not reachable from the root.")
+        # The root has no in-arc, so its -1 must not be used as an index.
+        parents = np.full(vertices_count, -1, dtype=np.int64)
+        has_in_arc = in_arcs >= 0
+        parents[has_in_arc] = sources[in_arcs[has_in_arc]]
+        labels, cycles_count = _cycle_labels(parents.tolist())
+        if cycles_count == 0:
+            selected = in_arcs[in_arcs >= 0]
+            break
+        # Every cycle becomes one vertex; arcs entering it are charged the
+        # difference to the cycle arc they would replace.
+        in_cycle = labels >= 0
+        components = labels.copy()
+        components[~in_cycle] = cycles_count + np.arange(np.count_nonzero(~in_cycle))
+        reduced_weights = weights - weights[in_arcs[targets]]
+        component_sources = components[sources]
+        component_targets = components[targets]
+        next_arcs = np.flatnonzero(component_sources != component_targets)
+        levels.append((targets, in_arcs, in_cycle, next_arcs))
+        sources = component_sources[next_arcs]
+        targets = component_targets[next_arcs]
+        weights = reduced_weights[next_arcs]
+        root = int(components[root])
+        vertices_count = cycles_count + np.count_nonzero(~in_cycle)
+    for targets, in_arcs, in_cycle, next_arcs in reversed(levels):
+        selected = next_arcs[selected]
+        # Inside a cycle, only the vertex entered from outside drops its
+        # cycle arc.
+        entered = np.zeros(len(in_arcs), dtype=bool)
+        entered[targets[selected]] = True
+        selected = np.concatenate((selected, in_arcs[in_cycle & ~entered]))
+    return kept[selected]
+
+
+class _SkewHeaps:
+    def __init__(self, keys: List[float]):
+        self.keys = keys
+        self.left = [-1] * len(keys)
+        self.right = [-1] * len(keys)
+        self.delta = [0.0] * len(keys)
+
+    def push(self, node: int):
+        delta = self.delta[node]
+        if delta:
+            self.keys[node] += delta
+            for child in (self.left[node], self.right[node]):
+                if child >= 0:
+                    self.delta[child] += delta
+            self.delta[node] = 0.0
+
+    def merge(self, first: int, second: int) -> int:
+        if first < 0 or second < 0:
+            return first if first >= 0 else second
+        keys, left, right = self.keys, self.left, self.right
+        self.push(first)
+        self.push(second)
+        # Ties are broken by arc id, which keeps the result deterministic.
+        if (keys[first], first) > (keys[second], second):
+            first, second = second, first
+        root = node = first
+        while True:
+            # Skew merge: the merged path goes left and the old left
+            # subtree moves right.
+            old_right = right[node]
+            right[node] = left[node]
+            if old_right < 0:
+                left[node] = second
+                return root
+            self.push(old_right)
+            self.push(second)
+            if (keys[old_right], old_right) > (keys[second], second):
+                old_right, second = second, old_right
+            left[node] = old_right
+            node = old_right
+
+    def pop(self, node: int) -> int:
+        self.push(node)
+        return self.merge(self.left[node], self.right[node])
+
+
+class _RollbackDisjointSet:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+        self.history: List[int] = []
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            item = parent[item]
+        return item
+
+    def union(self, left: int, right: int) -> bool:
+        left, right = self.find(left), self.find(right)
+        if left == right:
+            return False
+        if self.size[left] < self.size[right]:
+            left, right = right, left
+        self.parent[right] = left
+        self.size[left] += self.size[right]
+        self.history.append(right)
+        return True
+
+    def rollback(self, time: int):
+        while len(self.history) > time:
+            right = self.history.pop()
+            self.size[self.parent[right]] -= self.size[right]
+            self.parent[right] = right
+
+
+def _tarjan_arc_ids(
+    vertices_count: int,
+    root: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    heaps = _SkewHeaps(weights.astype(np.float64).tolist())
+    heap_roots = [-1] * vertices_count
+    # Arcs sorted by weight form a left chain, which is already a valid
+    # skew heap for their target.
+    order = np.argsort(weights, kind="stable")
+    order = order[np.argsort(targets[order], kind="stable")]
+    order = order[(sources[order] != targets[order]) & (targets[order] != root)]
+    ordered_targets = targets[order]
+    chain = order.tolist()
+    starts = np.flatnonzero(np.r_[True, ordered_targets[1:] != ordered_targets[:-1]])
+    for start, end in zip(starts.tolist(), np.r_[starts[1:], len(chain)].tolist()):
+        for position in range(start, end - 1):
+            heaps.left[chain[position]] = chain[position + 1]
+        if start < end:
+            heap_roots[int(ordered_targets[start])] = chain[start]
+    arc_sources = sources.tolist()
+    arc_targets = targets.tolist()
+    components = _RollbackDisjointSet(vertices_count)
+    seen = [-1] * vertices_count
+    seen[root] = root
+    in_arcs = [-1] * vertices_count
+    path = [0] * vertices_count
+    queue = [0] * vertices_count
+    cycles = []
+    for start in range(vertices_count):
+        vertex = start
+        length = 0
+        while seen[vertex] < 0:
+            arc = heap_roots[vertex]
+            if arc < 0:
+                raise ValueError("Some vertices are not reachable from the root.")
+            heaps.push(arc)
+            # Taking the cheapest arc lowers every other arc into the same
+            # component by its weight.
+            heaps.delta[arc] -= heaps.keys[arc]
+            heap_roots[vertex] = heaps.pop(arc)
+            queue[length] = arc
+            path[length] = vertex
+            length += 1
+            seen[vertex] = start
+            vertex = components.find(arc_sources[arc])
+            if seen[vertex] == start:
+                cycle_heap = -1
+                end = length
+                time = len(components.history)
+                while True:
+                    length -= 1
+                    member = path[length]
+                    cycle_heap = heaps.merge(cycle_heap, heap_roots[member])
+                    if not components.union(vertex, member):
+                        break
+                vertex = components.find(vertex)
+                heap_roots[vertex] = cycle_heap
+                seen[vertex] = -1
+                cycles.append((vertex, time, queue[length:end]))
+        for arc in queue[:length]:
+            in_arcs[components.find(arc_targets[arc])] = arc
+    # Cycles are expanded from the last contraction back to the first.
+    for vertex, time, cycle_arcs in reversed(cycles):
+        components.rollback(time)
+        entering = in_arcs[vertex]
+        for arc in cycle_arcs:
+            in_arcs[components.find(arc_targets[arc])] = arc
+        in_arcs[components.find(arc_targets[entering])] = entering
+    return np.array(
+        [arc for vertex, arc in enumerate(in_arcs) if vertex != root], dtype=np.int64
+    )
+
+
+def _arborescence(graph: Union[Graph, CSRGraph], root: Union[str, Vertex], engine):
+    csr_graph = as_csr_graph(graph)
+    root_id = vertex_id(csr_graph, root)
+    sources, targets, weights, edge_ids = directed_arcs(csr_graph)
+    selected = engine(csr_graph.vertices_count, root_id, sources, targets, weights)
+    return spanning_subgraph(graph, edge_ids[selected].tolist(), "MCA")
+
+
+def edmonds(graph: Union[Graph, CSRGraph], root: Union[str, Vertex]):
+    return _arborescence(graph, root, _edmonds_arc_ids)
+
+
+def tarjan(graph: Union[Graph, CSRGraph], root: Union[str, Vertex]):
+    return _arborescence(graph, root, _tarjan_arc_ids)
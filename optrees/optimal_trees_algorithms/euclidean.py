@@ -0,0 +1,56 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from optrees.graph.csr_graph import CSRGraph
+from optrees.helpers.disjoint_set import DisjointSet
+from optrees.helpers.kd_tree import KDTree
+
+
+def euclidean_mst_edges(
+    points: Sequence[Sequence[float]], leaf_size: int = 16
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    tree = KDTree(points, leaf_size)
+    points_count = len(tree)
+    labels = np.arange(points_count)
+    components_count = points_count
+    lower_bounds = np.zeros(points_count)
+    sources, targets, weights = [], [], []
+    # Boruvka rounds: the closest pair leaving every component is an edge of
+    # the tree, and the k-d tree finds them all without the complete graph.
+    while components_count > 1:
+        left, right, distances = tree.closest_pairs(labels, lower_bounds)
+        # Components may pick pairs of the same length that close a cycle,
+        # so a pair is only kept when it joins two different components.
+        components = DisjointSet(components_count)
+        kept = np.array(
+            [
+                components.union(source, target)
+                for source, target in zip(labels[left].tolist(), labels[right].tolist())
+            ],
+            dtype=bool,
+        )
+        sources.append(left[kept])
+        targets.append(right[kept])
+        weights.append(distances[kept])
+        roots = np.array([components.find(label) for label in range(components_count)])
+        _, roots = np.unique(roots, return_inverse=True)
+        labels = roots[labels]
+        components_count = components.components_count
+    if not sources:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+    return np.concatenate(sources), np.concatenate(targets), np.concatenate(weights)
+
+
+def euclidean_mst(
+    points: Sequence[Sequence[float]],
+    labels: Optional[Sequence[str]] = None,
+    leaf_size: int = 16,
+) -> CSRGraph:
+    points_count = len(points)
+    if labels is None:
+        labels = [str(point) for point in range(points_count)]
+    elif len(labels) != points_count:
+        raise ValueError("There must be one label for every point.")
+    sources, targets, weights = euclidean_mst_edges(points, leaf_size)
+    return CSRGraph("MST", labels, sources, targets, weights)
@@ -0,0 +1,312 @@
+import os
+from itertools import chain, zip_longest
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from optrees.graph.binary_format import MAGIC, read_binary
+from optrees.graph.csr_graph import CSRGraph
+from optrees.graph.graph import GraphReader, parse_weight
+from optrees.optimal_trees_algorithms.kruskal import _component_roots, _union_batch
+
+EDGE_RECORD = np.dtype(
+    [("weight", "<f8"), ("edge", "<i8"), ("source", "<i8"), ("target", "<i8")]
+)
+DEFAULT_MEMORY_LIMIT = 1 << 28
+# Sorting a chunk needs the records, their sort keys, the permutation and the
+# sorted copy, so a chunk takes a fraction of the memory limit.
+SORT_OVERHEAD = 8
+# Merging more runs at once than this many blocks of records would make the
+# blocks too small, so the runs are merged in several passes instead.
+MERGE_BLOCK_SIZE = 1 << 10
+
+
+class _EdgeFile:
+    def __init__(self, file_path: str, edges_count: int = 0):
+        self.file_path = file_path
+        self.edges_count = edges_count
+
+    def append(self, records: np.ndarray):
+        with open(self.file_path, "ab") as file:
+            records.tofile(file)
+        self.edges_count += len(records)
+
+    def read(self, start: int, size: int) -> np.ndarray:
+        size = min(size, self.edges_count - start)
+        if size <= 0:
+            return np.zeros(0, dtype=EDGE_RECORD)
+        return np.fromfile(
+            self.file_path, EDGE_RECORD, size, offset=start * EDGE_RECORD.itemsize
+        )
+
+    def chunks(self, size: int) -> Iterator[np.ndarray]:
+        for start in range(0, self.edges_count, size):
+            yield self.read(start, size)
+
+
+def _records(
+    edges: np.ndarray, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    records = np.empty(len(edges), dtype=EDGE_RECORD)
+    records["weight"] = weights
+    records["edge"] = edges
+    records["source"] = sources
+    records["target"] = targets
+    return records
+
+
+def _is_binary(file_path: str) -> bool:
+    with open(file_path, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def _binary_records(file_path: str, chunk_size: int) -> Tuple[List[str], Iterator]:
+    # The edge arrays of a binary graph are memory-mapped, so every chunk is
+    # paged in from the file on its own.
+    csr_graph = read_binary(file_path)
+
+    def chunks() -> Iterator[np.ndarray]:
+        for start in range(0, csr_graph.edges_count, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            yield _records(
+                np.arange(chunk.start, min(chunk.stop, csr_graph.edges_count)),
+                csr_graph.sources[chunk],
+                csr_graph.targets[chunk],
+                csr_graph.edge_weights[chunk],
+            )
+
+    return csr_graph.labels, chunks()
+
+
+def _text_records(
+    file_path: str, chunk_size: int, vertex_ids: Dict[str, int]
+) -> Iterator[np.ndarray]:
+    # Vertex labels are interned as they appear; only the labels stay in
+    # memory, the edges go to disk chunk by chunk.
+    edges_count = 0
+    reader = GraphReader(file_path, chunk_size * EDGE_RECORD.itemsize)
+    for edges_tuples in reader.iter_chunks():
+        columns = list(zip_longest(*edges_tuples))
+        ids = np.fromiter(
+            (
+                vertex_ids.setdefault(label, len(vertex_ids))
+                for label in chain.from_iterable(zip(columns[0], columns[1]))
+            ),
+            np.int64,
+            2 * len(edges_tuples),
+        )
+        weights = (
+            [0.0 if weight is None else parse_weight(weight) for weight in columns[2]]
+            if len(columns) > 2
+            else np.zeros(len(edges_tuples))
+        )
+        yield _records(
+            np.arange(edges_count, edges_count + len(edges_tuples)),
+            ids[0::2],
+            ids[1::2],
+            weights,
+        )
+        edges_count += len(edges_tuples)
+
+
+def _sort_records(records: np.ndarray) -> np.ndarray:
+    # Ties are broken by the edge index, so every run and every merge sees
+    # the same total order as a stable sort of the whole edge list.
+    return records[np.lexsort((records["edge"], records["weight"]))]
+
+
+def _boruvka_round(
+    edge_file: _EdgeFile,
+    chunk_size: int,
+    parent: List[int],
+    rank: List[int],
+    selected: List[np.ndarray],
+    remaining: int,
+) -> int:
+    roots = _component_roots(parent)
+    vertices_count = len(parent)
+    best_weights = np.full(vertices_count, np.inf)
+    best_edges = np.full(vertices_count, -1, dtype=np.int64)
+    best_records = np.zeros(vertices_count, dtype=EDGE_RECORD)
+    for records in edge_file.chunks(chunk_size):
+        left = roots[records["source"]]
+        right = roots[records["target"]]
+        leaving = left != right
+        records = np.concatenate((records[leaving], records[leaving]))
+        components = np.concatenate((left[leaving], right[leaving]))
+        order = np.lexsort((records["edge"], records["weight"], components))
+        components, records = components[order], records[order]
+        first = np.flatnonzero(np.diff(components, prepend=-1) != 0)
+        components, records = components[first], records[first]
+        better = (records["weight"] < best_weights[components]) | (
+            (records["weight"] == best_weights[components])
+            & (records["edge"] < best_edges[components])
+        )
+        components, records = components[better], records[better]
+        best_weights[components] = records["weight"]
+        best_edges[components] = records["edge"]
+        best_records[components] = records
+    # The lightest edge leaving every component belongs to the forest; the
+    # edge index breaks ties, so the chosen edges never close a cycle.
+    _, first = np.unique(best_edges, return_index=True)
+    chosen = best_records[first[best_edges[first] >= 0]]
+    chosen = _sort_records(chosen)
+    added: List[int] = []
+    remaining = _union_batch(
+        parent,
+        rank,
+        np.arange(len(chosen)),
+        chosen["source"],
+        chosen["target"],
+        added,
+        remaining,
+    )
+    selected.append(chosen[added])
+    return remaining
+
+
+def _contract(
+    edge_file: _EdgeFile, chunk_size: int, parent: List[int], file_path: str
+) -> _EdgeFile:
+    # Edges inside one component can never join the forest, so they are
+    # dropped from the edge file before the next round.
+    roots = _component_roots(parent)
+    contracted = _EdgeFile(file_path)
+    open(file_path, "wb").close()
+    for records in edge_file.chunks(chunk_size):
+        contracted.append(records[roots[records["source"]] != roots[records["target"]]])
+    os.remove(edge_file.file_path)
+    return contracted
+
+
+def _sorted_runs(
+    edge_file: _EdgeFile, chunk_size: int, directory: str
+) -> List[_EdgeFile]:
+    runs = []
+    for index, records in enumerate(edge_file.chunks(chunk_size)):
+        run = _EdgeFile(os.path.join(directory, f"run0_{index}.bin"))
+        run.append(_sort_records(records))
+        runs.append(run)
+    fan_in = max(2, chunk_size // MERGE_BLOCK_SIZE)
+    level = 0
+    while len(runs) > fan_in:
+        level += 1
+        merged_runs = []
+        for index, start in enumerate(range(0, len(runs), fan_in)):
+            stop = start + fan_in
+            merged = _EdgeFile(os.path.join(directory, f"run{level}_{index}.bin"))
+            for batch in _merged_batches(runs[start:stop], chunk_size):
+                merged.append(batch)
+            for run in runs[start:stop]:
+                os.remove(run.file_path)
+            merged_runs.append(merged)
+        runs = merged_runs
+    return runs
+
+
+def _merged_batches(runs: List[_EdgeFile], chunk_size: int) -> Iterator[np.ndarray]:
+    # Every run keeps a block in memory. All the records up to the smallest
+    # last record among the blocks of the runs with data left on disk are in
+    # their final order, so they are merged and handed out together.
+    block_size = max(1, chunk_size // (len(runs) + 1))
+    positions = [0] * len(runs)
+    blocks = []
+    for index, run in enumerate(runs):
+        blocks.append(run.read(0, block_size))
+        positions[index] = len(blocks[-1])
+    while any(len(block) for block in blocks):
+        limits = [
+            (block["weight"][-1], block["edge"][-1])
+            for block, position, run in zip(blocks, positions, runs)
+            if len(block) and position < run.edges_count
+        ]
+        limit = min(limits) if limits else (np.inf, np.iinfo(np.int64).max)
+        batch = []
+        for index, block in enumerate(blocks):
+            taken = (block["weight"] < limit[0]) | (
+                (block["weight"] == limit[0]) & (block["edge"] <= limit[1])
+            )
+            batch.append(block[taken])
+            # Blocks are topped up, so the next limit moves a whole block on.
+            refill = runs[index].read(positions[index], int(taken.sum()))
+            positions[index] += len(refill)
+            blocks[index] = np.concatenate((block[~taken], refill))
+        yield _sort_records(np.concatenate(batch))
+
+
+def external_mst(
+    file_path: str,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    contraction_rounds: int = 0,
+    temporary_directory: Optional[str] = None,
+) -> CSRGraph:
+    chunk_size = memory_limit // (SORT_OVERHEAD * EDGE_RECORD.itemsize)
+    if chunk_size < MERGE_BLOCK_SIZE:
+        raise ValueError(
+            f"The memory limit must be at least "
+            f"{SORT_OVERHEAD * EDGE_RECORD.itemsize * MERGE_BLOCK_SIZE} bytes."
+        )
+    if contraction_rounds < 0:
+        raise ValueError("The number of contraction rounds must not be negative.")
+    with TemporaryDirectory(dir=temporary_directory) as directory:
+        edge_file = _EdgeFile(os.path.join(directory, "edges0.bin"))
+        open(edge_file.file_path, "wb").close()
+        if _is_binary(file_path):
+            labels, chunks = _binary_records(file_path, chunk_size)
+            for records in chunks:
+                edge_file.append(records)
+        else:
+            vertex_ids: Dict[str, int] = {}
+            for records in _text_records(file_path, chunk_size, vertex_ids):
+                edge_file.append(records)
+            labels = list(vertex_ids)
+        vertices_count = len(labels)
+        parent = list(range(vertices_count))
+        rank = [0] * vertices_count
+        selected: List[np.ndarray] = []
+        remaining = vertices_count - 1
+        # Optional Boruvka rounds at least halve the components of the graph
+        # and shrink the edge file before the external sort.
+        for round_index in range(contraction_rounds):
+            if remaining <= 0 or not edge_file.edges_count:
+                break
+            before = remaining
+            remaining = _boruvka_round(
+                edge_file, chunk_size, parent, rank, selected, remaining
+            )
+            edge_file = _contract(
+                edge_file,
+                chunk_size,
+                parent,
+                os.path.join(directory, f"edges{round_index + 1}.bin"),
+            )
+            if before == remaining:
+                break
+        # Kruskal over the k-way merge of the sorted runs stops as soon as
+        # the forest is complete, leaving the heaviest edges unread.
+        if remaining > 0 and edge_file.edges_count:
+            runs = _sorted_runs(edge_file, chunk_size, directory)
+            os.remove(edge_file.file_path)
+            for batch in _merged_batches(runs, chunk_size):
+                added_ids: List[int] = []
+                remaining = _union_batch(
+                    parent,
+                    rank,
+                    np.arange(len(batch)),
+                    batch["source"],
+                    batch["target"],
+                    added_ids,
+                    remaining,
+                )
+                selected.append(batch[added_ids])
+                if remaining <= 0:
+                    break
+    tree = np.concatenate(selected) if selected else np.zeros(0, dtype=EDGE_RECORD)
+    return CSRGraph(
+        "MSF",
+        labels,
+        tree["source"],
+        tree["target"],
+        tree["weight"],
+    )
@@ -0,0 +1,216 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from optrees import Graph
+from optrees.graph.csr_graph import CSRGraph, as_csr_graph, connected_components
+from optrees.optimal_trees_algorithms.boruvka import (
+    _boruvka_edge_ids,
+    numpy_boruvka_edges,
+)
+from optrees.optimal_trees_algorithms.kruskal import (
+    _kruskal_edge_ids,
+    filter_kruskal_edges,
+    numpy_kruskal_edges,
+)
+from optrees.optimal_trees_algorithms.prim import PRIM_HEAPS, _prim_edge_ids
+
+
+def _boruvka_forest(csr_graph: CSRGraph) -> List[int]:
+    return _boruvka_edge_ids(
+        csr_graph.vertices_count,
+        csr_graph.sources.tolist(),
+        csr_graph.targets.tolist(),
+        csr_graph.edge_weights.tolist(),
+    )
+
+
+def _kruskal_forest(csr_graph: CSRGraph) -> List[int]:
+    return _kruskal_edge_ids(
+        csr_graph.vertices_count,
+        csr_graph.sources.tolist(),
+        csr_graph.targets.tolist(),
+        csr_graph.edge_weights,
+    )
+
+
+def _filter_kruskal_forest(csr_graph: CSRGraph) -> List[int]:
+    return filter_kruskal_edges(
+        csr_graph.sources,
+        csr_graph.targets,
+        csr_graph.edge_weights,
+        csr_graph.vertices_count,
+    ).tolist()
+
+
+def _numpy_boruvka_forest(csr_graph: CSRGraph) -> List[int]:
+    return numpy_boruvka_edges(
+        csr_graph.sources,
+        csr_graph.targets,
+        csr_graph.edge_weights,
+        csr_graph.vertices_count,
+    ).tolist()
+
+
+def _numpy_kruskal_forest(
+    csr_graph: CSRGraph, batch_size: Optional[int] = None
+) -> List[int]:
+    return numpy_kruskal_edges(
+        csr_graph.sources,
+        csr_graph.targets,
+        csr_graph.edge_weights,
+        csr_graph.vertices_count,
+        batch_size,
+    ).tolist()
+
+
+def _prim_forest(csr_graph: CSRGraph, heap: str = "lazy") -> List[int]:
+    if heap not in PRIM_HEAPS:
+        raise ValueError(
+            f"Heap {heap} not found. Available heaps: {list(PRIM_HEAPS.keys())}"
+        )
+    return _prim_edge_ids(csr_graph, heap)
+
+
+FOREST_ENGINES = {
+    "boruvka": _boruvka_forest,
+    "filter_kruskal": _filter_kruskal_forest,
+    "kruskal": _kruskal_forest,
+    "numpy_boruvka": _numpy_boruvka_forest,
+    "numpy_kruskal": _numpy_kruskal_forest,
+    "prim": _prim_forest,
+}
+
+
+def _component_slices(
+    csr_graph: CSRGraph, components: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Vertices and edges are grouped by component; the bounds give the slice
+    # of every component in both orders.
+    components_count = int(components.max()) + 1 if len(components) else 0
+    ids = np.arange(components_count + 1)
+    vertex_order = np.argsort(components, kind="stable")
+    vertex_bounds = np.searchsorted(components[vertex_order], ids)
+    edge_components = components[csr_graph.sources]
+    edge_order = np.argsort(edge_components, kind="stable")
+    edge_bounds = np.searchsorted(edge_components[edge_order], ids)
+    return vertex_order, vertex_bounds, edge_order, edge_bounds
+
+
+def _component_graphs(csr_graph: CSRGraph) -> List[Tuple[np.ndarray, CSRGraph]]:
+    components = connected_components(csr_graph)
+    vertex_order, vertex_bounds, edge_order, edge_bounds = _component_slices(
+        csr_graph, components
+    )
+    local_ids = np.empty(csr_graph.vertices_count, dtype=np.int64)
+    local_ids[vertex_order] = (
+        np.arange(csr_graph.vertices_count) - vertex_bounds[components[vertex_order]]
+    )
+    labels = csr_graph.labels
+    edge_labels = csr_graph.edge_labels
+    component_graphs = []
+    for index, (vertex_start, vertex_end, edge_start, edge_end) in enumerate(
+        zip(
+            vertex_bounds[:-1].tolist(),
+            vertex_bounds[1:].tolist(),
+            edge_bounds[:-1].tolist(),
+            edge_bounds[1:].tolist(),
+        )
+    ):
+        vertices = vertex_order[vertex_start:vertex_end]
+        edges = edge_order[edge_start:edge_end]
+        component_graph = CSRGraph(
+            f"MST{index}",
+            [labels[vertex] for vertex in vertices.tolist()],
+            local_ids[csr_graph.sources[edges]],
+            local_ids[csr_graph.targets[edges]],
+            csr_graph.edge_weights[edges],
+            csr_graph.orientations[edges],
+            (
+                {
+                    position: edge_labels[edge]
+                    for position, edge in enumerate(edges.tolist())
+                    if edge in edge_labels
+                }
+                if edge_labels
+                else None
+            ),
+            validate=False,
+        )
+        component_graphs.append((edges, component_graph))
+    return component_graphs
+
+
+def _solve_components(
+    component_graphs: Sequence[CSRGraph], algorithm: str, kwargs: dict
+) -> List[List[int]]:
+    engine = FOREST_ENGINES[algorithm]
+    return [
+        engine(component_graph, **kwargs) if component_graph.edges_count else []
+        for component_graph in component_graphs
+    ]
+
+
+def _balanced_groups(
+    component_graphs: Sequence[CSRGraph], groups_count: int
+) -> List[slice]:
+    sizes = np.fromiter((graph.edges_count + 1 for graph in component_graphs), np.int64)
+    cumulative = np.cumsum(sizes)
+    targets = cumulative[-1] * np.arange(1, groups_count) / groups_count
+    bounds = np.r_[0, np.searchsorted(cumulative, targets, side="right"), len(sizes)]
+    bounds = np.unique(bounds).tolist()
+    return [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _component_trees(
+    graph: Union[Graph, CSRGraph],
+    component_graphs: List[Tuple[np.ndarray, CSRGraph]],
+    selected: List[List[int]],
+) -> list:
+    if isinstance(graph, CSRGraph):
+        return [
+            component_graph.edge_subgraph(ids, component_graph.label)
+            for (_, component_graph), ids in zip(component_graphs, selected)
+        ]
+    vertices = graph.vertices
+    edges = list(graph.edges.values())
+    trees = []
+    for (edge_ids, component_graph), ids in zip(component_graphs, selected):
+        tree = Graph(component_graph.label)
+        # Isolated vertices have no edges, so the vertices are added first.
+        tree.add_vertices([vertices[label] for label in component_graph.labels])
+        tree.add_edges([edges[edge_id] for edge_id in edge_ids[ids].tolist()])
+        trees.append(tree)
+    return trees
+
+
+def minimum_spanning_forest(
+    graph: Union[Graph, CSRGraph],
+    algorithm: str = "boruvka",
+    workers: Optional[int] = None,
+    **kwargs,
+) -> Tuple[list, float]:
+    if algorithm not in FOREST_ENGINES:
+        raise ValueError(
+            f"Algorithm {algorithm} not found. "
+            f"Available algorithms: {list(FOREST_ENGINES.keys())}"
+        )
+    component_graphs = _component_graphs(as_csr_graph(graph))
+    graphs = [component_graph for _, component_graph in component_graphs]
+    if workers is None or workers <= 1 or len(graphs) <= 1:
+        selected = _solve_components(graphs, algorithm, kwargs)
+    else:
+        groups = _balanced_groups(graphs, min(workers, len(graphs)))
+        selected = []
+        with ProcessPoolExecutor(min(workers, len(groups))) as executor:
+            for group_selected in executor.map(
+                _solve_components,
+                (graphs[group] for group in groups),
+                repeat(algorithm),
+                repeat(kwargs),
+            ):
+                selected.extend(group_selected)
+    trees = _component_trees(graph, component_graphs, selected)
+    return trees, float(sum(tree.weight_sum for tree in trees))
@@ -0,0 +1,113 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from optrees import Edge, Graph, Vertex
+from optrees.graph.csr_graph import CSRGraph, as_csr_graph
+from optrees.helpers.max_flow import FlowNetwork
+
+MinCut = Tuple[float, List[bool]]
+
+_worker_network: Optional[FlowNetwork] = None
+
+
+def _flow_network(csr_graph: CSRGraph) -> FlowNetwork:
+    return FlowNetwork(
+        csr_graph.vertices_count,
+        csr_graph.sources,
+        csr_graph.targets,
+        csr_graph.edge_weights,
+    )
+
+
+def _start_worker(csr_graph: CSRGraph):
+    global _worker_network
+    _worker_network = _flow_network(csr_graph)
+
+
+def _worker_min_cut(source: int, sink: int) -> MinCut:
+    return _worker_network.min_cut(source, sink)
+
+
+def _gusfield_step(parents: List[int], values: List[float], source: int, cut: MinCut):
+    sink = parents[source]
+    value, side = cut
+    values[source] = value
+    for vertex in range(len(parents)):
+        if vertex != source and side[vertex] and parents[vertex] == sink:
+            parents[vertex] = source
+    # The sink's parent moved to the source side, so the source takes the
+    # sink's place in the tree.
+    if side[parents[sink]]:
+        parents[source] = parents[sink]
+        parents[sink] = source
+        values[source] = values[sink]
+        values[sink] = value
+
+
+def _sequential_gusfield(csr_graph: CSRGraph, parents: List[int], values: List[float]):
+    min_cut: Callable[[int, int], MinCut] = _flow_network(csr_graph).min_cut
+    for source in range(1, len(parents)):
+        _gusfield_step(parents, values, source, min_cut(source, parents[source]))
+
+
+def _parallel_gusfield(
+    csr_graph: CSRGraph, parents: List[int], values: List[float], workers: int
+):
+    # Each cut depends on the parents left by the previous ones, so the
+    # next cuts are computed speculatively with the current parents and
+    # recomputed when a parent changes before their turn.
+    window = 2 * workers
+    pending: Dict[int, tuple] = {}
+    with ProcessPoolExecutor(
+        workers, initializer=_start_worker, initargs=(csr_graph,)
+    ) as executor:
+        for source in range(1, len(parents)):
+            for candidate in range(source, min(source + window, len(parents))):
+                sink = parents[candidate]
+                if candidate not in pending or pending[candidate][0] != sink:
+                    pending[candidate] = (
+                        sink,
+                        executor.submit(_worker_min_cut, candidate, sink),
+                    )
+            _, future = pending.pop(source)
+            _gusfield_step(parents, values, source, future.result())
+
+
+def _cut_tree(
+    graph: Union[Graph, CSRGraph],
+    csr_graph: CSRGraph,
+    parents: List[int],
+    values: List[float],
+):
+    children = list(range(1, len(parents)))
+    if isinstance(graph, CSRGraph):
+        return CSRGraph(
+            "MCT",
+            csr_graph.labels,
+            np.array(children, dtype=np.int64),
+            np.array([parents[child] for child in children], dtype=np.int64),
+            np.array([values[child] for child in children], dtype=np.float64),
+        )
+    # Cut tree edges are not edges of the graph, so the tree gets its own
+    # vertices instead of linking new edges to the graph's ones.
+    vertices = [Vertex(label) for label in csr_graph.labels]
+    tree = Graph("MCT")
+    tree.add_vertices(vertices)
+    for child in children:
+        tree.add_edge(Edge(vertices[child], vertices[parents[child]], values[child]))
+    return tree
+
+
+def gusfield(graph: Union[Graph, CSRGraph], workers: Optional[int] = None):
+    csr_graph = as_csr_graph(graph)
+    if (csr_graph.edge_weights < 0).any():
+        raise ValueError("The capacities must be non-negative.")
+    parents = [0] * csr_graph.vertices_count
+    values = [0.0] * csr_graph.vertices_count
+    if workers is None or workers <= 1 or csr_graph.vertices_count <= 2:
+        _sequential_gusfield(csr_graph, parents, values)
+    else:
+        _parallel_gusfield(csr_graph, parents, values, workers)
+    return _cut_tree(graph, csr_graph, parents, values)
@@ -1,21 +1,214 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
 from optrees import Graph
+from optrees.graph.csr_graph import (
+    CSRGraph,
+    as_csr_graph,
+    sort_keys,
+    spanning_subgraph,
+)
+from optrees.helpers.disjoint_set import DisjointSet
+
+FILTER_KRUSKAL_BASE_SIZE = 1 << 12
 
 
-def kruskal(graph: Graph):
-    mst_graph = Graph("MSF")
-    components = {vertex: {vertex} for vertex in graph.vertices}
-    edges = sorted(
-        graph.edges.values(),
-        key=lambda edge: edge.weight if edge.weight is not None else 0,
-        reverse=True,
+def _kruskal_edge_ids(
+    vertices_count: int,
+    sources: Sequence[int],
+    targets: Sequence[int],
+    weights: np.ndarray,
+) -> List[int]:
+    components = DisjointSet(vertices_count)
+    selected: List[int] = []
+    for index in np.argsort(sort_keys(weights), kind="stable").tolist():
+        if len(selected) >= vertices_count - 1:
+            break
+        if components.union(sources[index], targets[index]):
+            selected.append(index)
+    return selected
+
+
+def kruskal(graph: Union[Graph, CSRGraph], filtered: bool = False):
+    csr_graph = as_csr_graph(graph)
+    if filtered:
+        selected = filter_kruskal_edges(
+            csr_graph.sources,
+            csr_graph.targets,
+            csr_graph.edge_weights,
+            csr_graph.vertices_count,
+        )
+        return spanning_subgraph(graph, selected.tolist(), "MSF")
+    selected = _kruskal_edge_ids(
+        csr_graph.vertices_count,
+        csr_graph.sources.tolist(),
+        csr_graph.targets.tolist(),
+        csr_graph.edge_weights,
     )
-    while mst_graph.edges_count < graph.vertices_count and len(edges) > 0:
-        edge = edges.pop()
-        if components[edge.right_vertex.label] != components[edge.left_vertex.label]:
-            mst_graph.add_edge(edge)
-            new_components = components[edge.left_vertex.label].union(
-                components[edge.right_vertex.label]
+    return spanning_subgraph(graph, selected, "MSF")
+
+
+def _sorted_batches(weights: np.ndarray, batch_size: Optional[int]):
+    weights = sort_keys(weights)
+    if batch_size is None or batch_size >= len(weights):
+        yield np.argsort(weights, kind="stable")
+        return
+    remaining = np.arange(len(weights))
+    while len(remaining) > batch_size:
+        remaining_weights = weights[remaining]
+        threshold = remaining_weights[
+            np.argpartition(remaining_weights, batch_size - 1)[batch_size - 1]
+        ]
+        # Every edge tied with the threshold joins the batch, so the overall
+        # order is the same (weight, index) order as a full stable sort.
+        light = remaining_weights <= threshold
+        batch = remaining[light]
+        yield batch[np.argsort(weights[batch], kind="stable")]
+        remaining = remaining[~light]
+    if len(remaining):
+        yield remaining[np.argsort(weights[remaining], kind="stable")]
+
+
+def _union_batch(
+    parent: List[int],
+    rank: List[int],
+    batch: np.ndarray,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    selected: List[int],
+    remaining: int,
+) -> int:
+    for index, left, right in zip(
+        batch.tolist(), sources[batch].tolist(), targets[batch].tolist()
+    ):
+        while parent[left] != left:
+            parent[left] = parent[parent[left]]
+            left = parent[left]
+        while parent[right] != right:
+            parent[right] = parent[parent[right]]
+            right = parent[right]
+        if left == right:
+            continue
+        if rank[left] < rank[right]:
+            left, right = right, left
+        parent[right] = left
+        if rank[left] == rank[right]:
+            rank[left] += 1
+        selected.append(index)
+        remaining -= 1
+        if remaining <= 0:
+            break
+    return remaining
+
+
+def _edge_arrays(
+    sources: Sequence[int],
+    targets: Sequence[int],
+    weights: Sequence[float],
+    vertices_count: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    sources = np.asarray(sources)
+    targets = np.asarray(targets)
+    weights = np.asarray(weights, dtype=np.float64)
+    if vertices_count is None:
+        vertices_count = (
+            int(max(sources.max(), targets.max())) + 1 if len(sources) else 0
+        )
+    return sources, targets, weights, vertices_count
+
+
+def numpy_kruskal_edges(
+    sources: Sequence[int],
+    targets: Sequence[int],
+    weights: Sequence[float],
+    vertices_count: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> np.ndarray:
+    sources, targets, weights, vertices_count = _edge_arrays(
+        sources, targets, weights, vertices_count
+    )
+    parent = list(range(vertices_count))
+    rank = [0] * vertices_count
+    selected: List[int] = []
+    remaining = vertices_count - 1
+    for batch in _sorted_batches(weights, batch_size):
+        if remaining <= 0:
+            break
+        remaining = _union_batch(
+            parent, rank, batch, sources, targets, selected, remaining
+        )
+    return np.array(selected, dtype=np.int64)
+
+
+def _component_roots(parent: List[int]) -> np.ndarray:
+    roots = np.array(parent, dtype=np.int64)
+    while True:
+        grandparents = roots[roots]
+        if np.array_equal(grandparents, roots):
+            return roots
+        roots = grandparents
+
+
+def filter_kruskal_edges(
+    sources: Sequence[int],
+    targets: Sequence[int],
+    weights: Sequence[float],
+    vertices_count: Optional[int] = None,
+    base_size: int = FILTER_KRUSKAL_BASE_SIZE,
+) -> np.ndarray:
+    if base_size < 1:
+        raise ValueError("The base size must be at least 1.")
+    sources, targets, weights, vertices_count = _edge_arrays(
+        sources, targets, weights, vertices_count
+    )
+    keys = sort_keys(weights)
+    parent = list(range(vertices_count))
+    rank = [0] * vertices_count
+    selected: List[int] = []
+    remaining = vertices_count - 1
+    # Edge groups still to be joined, lightest on top; the indices of every
+    # group stay increasing, so ties keep the order of a stable sort.
+    pending = [np.arange(len(weights))]
+    filtered_count = 0
+    while pending and remaining > 0:
+        group = pending.pop()
+        if len(group) > base_size and len(selected) > filtered_count:
+            # Edges inside one component can never join the tree, so they
+            # are dropped before paying for their partition and sort.
+            roots = _component_roots(parent)
+            group = group[roots[sources[group]] != roots[targets[group]]]
+            filtered_count = len(selected)
+        if len(group) <= base_size:
+            batch = group[np.argsort(keys[group], kind="stable")]
+            remaining = _union_batch(
+                parent, rank, batch, sources, targets, selected, remaining
+            )
+            continue
+        group_keys = keys[group]
+        pivot = np.partition(group_keys, len(group) // 2)[len(group) // 2]
+        lighter = group_keys < pivot
+        heavier = group_keys > pivot
+        tied = ~(lighter | heavier)
+        if tied.all():
+            # Edges of equal weight are already in stable order.
+            remaining = _union_batch(
+                parent, rank, group, sources, targets, selected, remaining
             )
-            for vertex in new_components:
-                components[vertex] = new_components
-    return mst_graph
+            continue
+        pending.append(group[heavier])
+        pending.append(group[tied])
+        pending.append(group[lighter])
+    return np.array(selected, dtype=np.int64)
+
+
+def numpy_kruskal(graph: Union[Graph, CSRGraph], batch_size: Optional[int] = None):
+    csr_graph = as_csr_graph(graph)
+    selected = numpy_kruskal_edges(
+        csr_graph.sources,
+        csr_graph.targets,
+        csr_graph.edge_weights,
+        csr_graph.vertices_count,
+        batch_size,
+    )
+    return spanning_subgraph(graph, selected.tolist(), "MSF")
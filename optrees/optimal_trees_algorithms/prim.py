@@ -1,31 +1,156 @@
+from heapq import heappop, heappush
+from typing import List, Tuple, Union
+
 import numpy as np
 
 from optrees import Graph
+from optrees.graph.csr_graph import (
+    CSRGraph,
+    as_csr_graph,
+    index_dtype,
+    spanning_subgraph,
+)
+from optrees.helpers.heaps import IndexedHeap
+
+
+def _lazy_heap_prim(adjacency: List[List[Tuple[float, int, int]]]) -> List[int]:
+    vertices_count = len(adjacency)
+    visited = [False] * vertices_count
+    visited[0] = True
+    selected: List[int] = []
+    heap = [(weight, index, neighbor) for weight, index, neighbor in adjacency[0]]
+    heap.sort()
+    while heap and len(selected) < vertices_count - 1:
+        _, index, vertex = heappop(heap)
+        if visited[vertex]:
+            continue
+        visited[vertex] = True
+        selected.append(index)
+        for entry in adjacency[vertex]:
+            if not visited[entry[2]]:
+                heappush(heap, entry)
+    return selected
+
+
+def _indexed_heap_prim(adjacency: List[List[Tuple[float, int, int]]]) -> List[int]:
+    vertices_count = len(adjacency)
+    visited = [False] * vertices_count
+    heap = IndexedHeap(vertices_count)
+    heap.push(0, (0, -1))
+    selected: List[int] = []
+    while len(heap) > 0:
+        vertex, (_, index) = heap.pop()
+        visited[vertex] = True
+        if index >= 0:
+            selected.append(index)
+        for weight, edge_index, neighbor in adjacency[vertex]:
+            if visited[neighbor]:
+                continue
+            key = (weight, edge_index)
+            if neighbor not in heap:
+                heap.push(neighbor, key)
+            elif key < heap.priority(neighbor):
+                heap.decrease_key(neighbor, key)
+    return selected
+
+
+PRIM_HEAPS = {
+    "lazy": _lazy_heap_prim,
+    "indexed": _indexed_heap_prim,
+}
+
+
+def _prim_edge_ids(csr_graph: CSRGraph, heap: str) -> List[int]:
+    vertices_count = csr_graph.vertices_count
+    if vertices_count == 0:
+        return []
+    indptr = csr_graph.indptr.tolist()
+    neighbors = csr_graph.indices.tolist()
+    weights = csr_graph.weights.tolist()
+    edge_ids = csr_graph.edge_ids.tolist()
+    adjacency = [
+        [
+            (weights[slot], edge_ids[slot], neighbors[slot])
+            for slot in range(indptr[vertex], indptr[vertex + 1])
+            if neighbors[slot] != vertex
+        ]
+        for vertex in range(vertices_count)
+    ]
+    return PRIM_HEAPS[heap](adjacency)
+
+
+def dense_prim_edges(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("The weight matrix must be square.")
+    vertices_count = len(matrix)
+    children = np.zeros(max(vertices_count - 1, 0), dtype=np.int64)
+    parents = np.zeros(max(vertices_count - 1, 0), dtype=np.int64)
+    if vertices_count < 2:
+        return children, parents
+    # Every vertex outside the tree keeps its distance to the tree and the
+    # tree vertex at that distance; adding a vertex only needs its row.
+    distances = np.array(matrix[0], dtype=np.float64)
+    closest = np.zeros(vertices_count, dtype=np.int64)
+    outside = np.ones(vertices_count, dtype=bool)
+    outside[0] = False
+    distances[0] = np.inf
+    edges_count = 0
+    for _ in range(vertices_count - 1):
+        vertex = int(np.argmin(distances))
+        if distances[vertex] < np.inf:
+            children[edges_count] = vertex
+            parents[edges_count] = closest[vertex]
+            edges_count += 1
+        else:
+            # No edge leaves the tree, so the next vertex outside it starts
+            # the tree of another component.
+            vertex = int(np.argmax(outside))
+        outside[vertex] = False
+        distances[vertex] = np.inf
+        row = matrix[vertex]
+        closer = (row < distances) & outside
+        distances[closer] = row[closer]
+        closest[closer] = vertex
+    return children[:edges_count], parents[:edges_count]
+
+
+def _dense_prim_edge_ids(csr_graph: CSRGraph) -> List[int]:
+    vertices_count = csr_graph.vertices_count
+    edges_count = csr_graph.edges_count
+    sources, targets = csr_graph.sources, csr_graph.targets
+    weights = csr_graph.edge_weights
+    edge_ids = np.arange(edges_count, dtype=index_dtype(edges_count))
+    ids = np.full((vertices_count, vertices_count), -1, dtype=edge_ids.dtype)
+    ids[sources, targets] = edge_ids
+    ids[targets, sources] = edge_ids
+    # Parallel edges overwrite each other, so the pairs where some edge lost
+    # are settled again in favour of their lightest edge.
+    lost = ids[sources, targets] != edge_ids
+    if lost.any():
+        keys = np.minimum(sources, targets) * vertices_count + np.maximum(
+            sources, targets
+        )
+        rivals = np.flatnonzero(np.isin(keys, keys[lost]))
+        order = rivals[np.lexsort((weights[rivals], keys[rivals]))]
+        lightest = order[np.r_[True, keys[order][1:] != keys[order][:-1]]]
+        ids[sources[lightest], targets[lightest]] = lightest
+        ids[targets[lightest], sources[lightest]] = lightest
+    # The missing pairs hold -1, which picks the infinite weight at the end.
+    matrix = np.append(weights, np.inf)[ids]
+    children, parents = dense_prim_edges(matrix)
+    return ids[children, parents].tolist()
 
 
-def prim(graph: Graph):
-    mst_graph = Graph("MST")
-    while mst_graph.vertices_count < graph.vertices_count:
-        for vertex in graph.vertices.values():
-            if vertex not in mst_graph:
-                min_weight = np.Infinity
-                min_edge = None
-                for edge in vertex.edges.values():
-                    if mst_graph.vertices_count > 0:
-                        is_the_vertex_connected_to_mst_graph = (
-                            edge.right_vertex in mst_graph
-                            or edge.left_vertex in mst_graph
-                        )
-                    else:
-                        is_the_vertex_connected_to_mst_graph = True
-                    if (
-                        edge.weight < min_weight
-                        and is_the_vertex_connected_to_mst_graph
-                    ):
-                        min_weight = edge.weight
-                        min_edge = edge
-                if min_edge is not None:
-                    mst_graph.add_edge(min_edge)
-                else:
-                    raise ValueError("The graph is not connected.")
-    return mst_graph
+def prim(graph: Union[Graph, CSRGraph], heap: str = "lazy", dense: bool = False):
+    if heap not in PRIM_HEAPS:
+        raise ValueError(
+            f"Heap {heap} not found. Available heaps: {list(PRIM_HEAPS.keys())}"
+        )
+    csr_graph = as_csr_graph(graph)
+    if dense:
+        return spanning_subgraph(graph, _dense_prim_edge_ids(csr_graph), "MST")
+    selected = _prim_edge_ids(csr_graph, heap)
+    if len(selected) < csr_graph.vertices_count - 1:
+        raise ValueError("The graph is not connected.")
+    return spanning_subgraph(graph, selected, "MST")
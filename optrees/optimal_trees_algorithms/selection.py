@@ -0,0 +1,40 @@
+from typing import Union
+
+from optrees import Graph
+from optrees.graph.csr_graph import CSRGraph
+
+DENSE_GRAPH_DENSITY = 0.25
+DENSE_PRIM_VERTICES_LIMIT = 1 << 13
+LARGE_GRAPH_EDGES = 1 << 17
+SPARSE_GRAPH_DEGREE = 4
+
+
+def density(graph: Union[Graph, CSRGraph]) -> float:
+    vertices_count = graph.vertices_count
+    if vertices_count < 2:
+        return 0.0
+    return 2 * graph.edges_count / (vertices_count * (vertices_count - 1))
+
+
+def select_mst_algorithm(graph: Union[Graph, CSRGraph]) -> str:
+    vertices_count = graph.vertices_count
+    edges_count = graph.edges_count
+    if vertices_count < 2 or edges_count == 0:
+        return "kruskal"
+    # Near-complete graphs fit the O(V^2) array Prim while its weight matrix
+    # is small; past that, Filter-Kruskal drops the heavy edges inside one
+    # component before sorting them.
+    if density(graph) >= DENSE_GRAPH_DENSITY:
+        if vertices_count <= DENSE_PRIM_VERTICES_LIMIT:
+            return "dense_prim"
+        return "filter_kruskal"
+    # Large graphs with few edges per vertex contract quickly, so the
+    # vectorized Boruvka rounds beat the union-find loop of Kruskal.
+    if (
+        edges_count >= LARGE_GRAPH_EDGES
+        and edges_count < SPARSE_GRAPH_DEGREE * vertices_count
+    ):
+        return "numpy_boruvka"
+    if edges_count >= LARGE_GRAPH_EDGES:
+        return "filter_kruskal"
+    return "numpy_kruskal"
@@ -0,0 +1,135 @@
+import math
+from itertools import count
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from optrees import Graph, Vertex
+from optrees.helpers.disjoint_set import DisjointSet
+from optrees.helpers.link_cut_tree import LinkCutTree
+
+VERTEX_KEY = (float("-inf"), -1)
+
+EdgeTuple = Tuple[Hashable, Hashable, float, str, Optional[str]]
+
+
+class StreamingMST:
+    def __init__(self, edges: Optional[Iterable[tuple]] = None, label: str = "MSF"):
+        self.__label = label
+        self.__forest = LinkCutTree()
+        # Replacements never split a tree, so the components only merge and
+        # a union-find answers the connectivity queries.
+        self.__components = DisjointSet()
+        self.__order = count()
+        self.__vertex_nodes: Dict[Hashable, int] = {}
+        self.__vertex_components: Dict[int, int] = {}
+        self.__node_edges: Dict[int, EdgeTuple] = {}
+        self.__free_nodes: List[int] = []
+        self.__processed_count = 0
+        if edges is not None:
+            self.add_edges(edges)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.__label}, "
+            f"{len(self.__vertex_nodes)} vertices, {len(self.__node_edges)} edges)"
+        )
+
+    @property
+    def label(self) -> str:
+        return self.__label
+
+    @property
+    def vertices_count(self) -> int:
+        return len(self.__vertex_nodes)
+
+    @property
+    def edges_count(self) -> int:
+        return len(self.__node_edges)
+
+    @property
+    def processed_count(self) -> int:
+        return self.__processed_count
+
+    @property
+    def weight_sum(self) -> float:
+        # Summed exactly on demand, since a running sum of the link and cut
+        # weights drifts over a long stream.
+        return math.fsum(edge[2] for edge in self.__node_edges.values())
+
+    @property
+    def edges(self) -> List[EdgeTuple]:
+        return list(self.__node_edges.values())
+
+    @property
+    def tree(self) -> Graph:
+        tree = Graph(self.__label)
+        for vertex_label in self.__vertex_nodes:
+            tree.add_vertex(Vertex(vertex_label))
+        tree.from_list(self.edges)
+        return tree
+
+    def add_edge(self, edge_tuple: tuple) -> bool:
+        edge_dict = Graph.get_edges_dicts_list([edge_tuple])[0]
+        left_label = edge_dict["left_vertex"]
+        right_label = edge_dict["right_vertex"]
+        weight = edge_dict["weight"] if edge_dict["weight"] is not None else 0
+        edge = (
+            left_label,
+            right_label,
+            weight,
+            edge_dict["orientation"],
+            edge_dict["label"],
+        )
+        self.__processed_count += 1
+        left_node = self.__vertex_node(left_label)
+        right_node = self.__vertex_node(right_label)
+        if left_node == right_node:
+            return False
+        # Ties are broken by arrival order, so an edge never replaces an
+        # earlier edge of the same weight.
+        key = (weight, next(self.__order))
+        if self.__components.union(
+            self.__vertex_components[left_node], self.__vertex_components[right_node]
+        ):
+            self.__link(edge, key, left_node, right_node)
+            return True
+        # Cycle property: the new edge replaces the heaviest edge on the tree
+        # path between its endpoints when it is lighter, and is dropped
+        # otherwise, so only the forest edges are ever kept.
+        heaviest = self.__forest.path_max(left_node, right_node)
+        if key >= self.__forest.value(heaviest):
+            return False
+        self.__cut(heaviest)
+        self.__link(edge, key, left_node, right_node)
+        return True
+
+    def add_edges(self, edges: Iterable[tuple]) -> int:
+        added_count = 0
+        for edge_tuple in edges:
+            added_count += self.add_edge(edge_tuple)
+        return added_count
+
+    def __vertex_node(self, vertex_label: Hashable) -> int:
+        node = self.__vertex_nodes.get(vertex_label)
+        if node is None:
+            node = self.__forest.add(VERTEX_KEY)
+            self.__vertex_nodes[vertex_label] = node
+            self.__vertex_components[node] = self.__components.add()
+        return node
+
+    def __link(self, edge: EdgeTuple, key: tuple, left_node: int, right_node: int):
+        # Freed edge nodes are reused, so the link-cut tree never holds more
+        # than one node per vertex and one per forest edge.
+        if self.__free_nodes:
+            node = self.__free_nodes.pop()
+            self.__forest.set_value(node, key)
+        else:
+            node = self.__forest.add(key)
+        self.__forest.link(node, left_node)
+        self.__forest.link(node, right_node)
+        self.__node_edges[node] = edge
+
+    def __cut(self, node: int):
+        edge = self.__node_edges.pop(node)
+        self.__forest.cut(node, self.__vertex_nodes[edge[0]])
+        self.__forest.cut(node, self.__vertex_nodes[edge[1]])
+        self.__free_nodes.append(node)
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from optrees import Graph
@@ -128,3 +130,23 @@ def disconnected_graph():
     graph = Graph("G")
     graph.from_list(graph_tuples_list)
     return graph
+
+
+@pytest.fixture
+def random_connected_graph():
+    generator = random.Random(42)
+    vertices_count = 60
+    graph_tuples_list = [
+        (f"v{vertex}", f"v{generator.randrange(vertex)}", generator.randint(1, 50))
+        for vertex in range(1, vertices_count)
+    ]
+    pairs = {tuple(sorted(edge_tuple[:2])) for edge_tuple in graph_tuples_list}
+    while len(graph_tuples_list) < 4 * vertices_count:
+        left, right = generator.sample(range(vertices_count), 2)
+        pair = tuple(sorted((f"v{left}", f"v{right}")))
+        if pair not in pairs:
+            pairs.add(pair)
+            graph_tuples_list.append((*pair, generator.randint(1, 50)))
+    graph = Graph("G")
+    graph.from_list(graph_tuples_list)
+    return graph
@@ -0,0 +1,57 @@
+import random
+
+import numpy as np
+import pytest
+
+from optrees import batch_minimum_spanning_trees, numpy_kruskal_edges
+
+
+def random_instances(count: int, seed: int = 0):
+    generator = random.Random(seed)
+    instances = []
+    for _ in range(count):
+        vertices_count = generator.randint(2, 30)
+        edges_count = generator.randint(1, 3 * vertices_count)
+        sources = [generator.randrange(vertices_count) for _ in range(edges_count)]
+        targets = [generator.randrange(vertices_count) for _ in range(edges_count)]
+        weights = [generator.randint(1, 10) for _ in range(edges_count)]
+        instances.append((sources, targets, weights, vertices_count))
+    return instances
+
+
+@pytest.mark.parametrize("algorithm", ["kruskal", "boruvka"])
+def test_batch_matches_single_instances(algorithm):
+    instances = random_instances(50)
+    results = batch_minimum_spanning_trees(instances, algorithm=algorithm)
+    assert len(results) == len(instances)
+    for (sources, targets, weights, vertices_count), selected in zip(
+        instances, results
+    ):
+        expected = numpy_kruskal_edges(sources, targets, weights, vertices_count)
+        assert selected.tolist() == sorted(expected.tolist())
+
+
+def test_batch_with_workers():
+    instances = random_instances(20, seed=1)
+    assert [
+        selected.tolist()
+        for selected in batch_minimum_spanning_trees(instances, workers=2)
+    ] == [selected.tolist() for selected in batch_minimum_spanning_trees(instances)]
+
+
+def test_batch_infers_vertices_count_and_handles_empty_instances():
+    results = batch_minimum_spanning_trees(
+        [([0, 1, 0], [1, 2, 2], [1.0, 2.0, 0.5]), ([], [], []), ([0], [1], [3.0])]
+    )
+    assert [selected.tolist() for selected in results] == [[0, 2], [], [0]]
+    assert batch_minimum_spanning_trees([]) == []
+
+
+def test_batch_invalid_input():
+    with pytest.raises(ValueError):
+        batch_minimum_spanning_trees([([0], [1], [1.0])], algorithm="prim")
+    with pytest.raises(ValueError):
+        batch_minimum_spanning_trees([([0], [1])])
+    with pytest.raises(ValueError):
+        batch_minimum_spanning_trees([([0, 1], [1], [1.0])])
+    assert isinstance(batch_minimum_spanning_trees([([0], [1], [1.0])])[0], np.ndarray)
@@ -1,4 +1,13 @@
-from optrees import boruvka
+import numpy as np
+import pytest
+
+from optrees import (
+    boruvka,
+    getMinimumSpanningTree,
+    kruskal,
+    numpy_boruvka,
+    numpy_boruvka_edges,
+)
 
 
 def test_boruvka_with_connected_graph_with_single_mst(connected_graph_with_single_mst):
@@ -17,3 +26,52 @@ def test_boruvka_with_connected_graph_with_multiple_mst(
     assert min_spanning_tree.vertices_count == mst_graph.vertices_count
     assert min_spanning_tree.edges_count == mst_graph.edges_count
     assert min_spanning_tree.weight_sum == mst_graph.weight_sum
+
+
+def test_numpy_boruvka_with_connected_graph_with_single_mst(
+    connected_graph_with_single_mst,
+):
+    graph, mst_graph = connected_graph_with_single_mst
+    min_spanning_tree = getMinimumSpanningTree(graph, algorithm="numpy_boruvka")
+    assert min_spanning_tree == mst_graph
+
+
+@pytest.mark.parametrize(
+    "fixture", ["connected_graph_with_multiple_mst", "random_connected_graph"]
+)
+def test_numpy_boruvka_matches_boruvka(request, fixture):
+    graph = request.getfixturevalue(fixture)
+    if isinstance(graph, tuple):
+        graph = graph[0]
+    assert numpy_boruvka(graph) == boruvka(graph)
+    assert numpy_boruvka(graph) == kruskal(graph)
+
+
+def test_numpy_boruvka_edges_breaks_ties_by_position():
+    sources = np.array([0, 1, 2, 3, 0, 1])
+    targets = np.array([1, 2, 3, 0, 2, 3])
+    weights = np.ones(6)
+    selected = numpy_boruvka_edges(sources, targets, weights)
+    assert sorted(selected.tolist()) == [0, 1, 2]
+
+
+def test_numpy_boruvka_edges_with_forest():
+    selected = numpy_boruvka_edges([0, 0, 3], [1, 1, 4], [2.0, 1.0, 1.0], 6)
+    assert sorted(selected.tolist()) == [1, 2]
+    assert numpy_boruvka_edges([], [], [], 3).tolist() == []
+
+
+def test_boruvka_with_workers(random_connected_graph):
+    min_spanning_tree = boruvka(random_connected_graph, workers=2)
+    assert min_spanning_tree == boruvka(random_connected_graph)
+
+
+def test_numpy_boruvka_edges_with_workers_and_forest():
+    sources = np.array([0, 1, 1, 3, 4, 3])
+    targets = np.array([1, 2, 0, 4, 5, 5])
+    weights = np.array([3.0, 1.0, 2.0, 1.0, 1.0, 1.0])
+    selected = numpy_boruvka_edges(sources, targets, weights, 7, workers=3)
+    assert sorted(selected.tolist()) == sorted(
+        numpy_boruvka_edges(sources, targets, weights, 7).tolist()
+    )
+    assert sorted(selected.tolist()) == [1, 2, 3, 4]
@@ -0,0 +1,237 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from optrees import (
+    CSRGraph,
+    Graph,
+    MSTGame,
+    Vertex,
+    bird,
+    folk,
+    getCostAllocation,
+    kar,
+    monte_carlo_shapley,
+)
+
+
+@pytest.fixture
+def game_graph():
+    graph = Graph("G")
+    graph.from_list(
+        [
+            ("0", "a", 6, "-"),
+            ("0", "b", 8, "-"),
+            ("0", "c", 9, "-"),
+            ("a", "b", 3, "-"),
+            ("a", "c", 5, "-"),
+            ("b", "c", 4, "-"),
+        ]
+    )
+    return graph
+
+
+def mst_cost(matrix, members):
+    vertices = [0] + [member + 1 for member in members]
+    in_tree = {0}
+    total = 0
+    while len(in_tree) < len(vertices):
+        weight, vertex = min(
+            (matrix[tree_vertex][vertex], vertex)
+            for tree_vertex in in_tree
+            for vertex in vertices
+            if vertex not in in_tree
+        )
+        total += weight
+        in_tree.add(vertex)
+    return total
+
+
+def permutation_shapley(players_count, cost):
+    shares = [0.0] * players_count
+    permutations = list(itertools.permutations(range(players_count)))
+    for permutation in permutations:
+        members = []
+        for player in permutation:
+            before = cost(members)
+            members.append(player)
+            shares[player] += (cost(members) - before) / len(permutations)
+    return shares
+
+
+def irreducible_matrix(matrix):
+    # Bottleneck costs: the cheapest possible maximum edge between each pair.
+    irreducible = np.array(matrix, dtype=float)
+    for middle in range(len(irreducible)):
+        irreducible = np.minimum(
+            irreducible,
+            np.maximum(irreducible[:, middle, None], irreducible[None, middle, :]),
+        )
+    return irreducible
+
+
+def random_complete_graph(players_count):
+    graph = Graph("G")
+    labels = ["0"] + [f"p{player}" for player in range(players_count)]
+    for left, right in itertools.combinations(labels, 2):
+        graph.from_list([(left, right, random.randint(1, 20), "-")])
+    return graph
+
+
+def test_bird(game_graph):
+    assert bird(game_graph, "0") == {"a": 6, "b": 3, "c": 4}
+
+
+def test_folk(game_graph):
+    shares = folk(game_graph, "0")
+    assert shares == pytest.approx({"a": 25 / 6, "b": 25 / 6, "c": 14 / 3})
+
+
+def test_kar(game_graph):
+    game = MSTGame(game_graph, "0")
+    expected = permutation_shapley(
+        3, lambda members: mst_cost(game.cost_matrix, members)
+    )
+    shares = kar(game_graph, "0")
+    assert [shares[player] for player in game.players] == pytest.approx(expected)
+    assert sum(shares.values()) == pytest.approx(13)
+
+
+@pytest.mark.parametrize("rule", [bird, folk, kar])
+def test_budget_balance(rule):
+    random.seed(11)
+    for players_count in range(1, 7):
+        graph = random_complete_graph(players_count)
+        game = MSTGame(graph, "0")
+        total = game.cost(game.players)
+        assert sum(rule(graph, "0").values()) == pytest.approx(total)
+
+
+def test_random_games_against_permutations():
+    random.seed(4)
+    for players_count in range(1, 6):
+        graph = random_complete_graph(players_count)
+        game = MSTGame(graph, "0")
+        matrix = game.cost_matrix
+        shares = kar(graph, "0")
+        expected = permutation_shapley(
+            players_count, lambda members: mst_cost(matrix, members)
+        )
+        assert [shares[player] for player in game.players] == pytest.approx(expected)
+        irreducible = irreducible_matrix(matrix)
+        shares = folk(graph, "0")
+        expected = permutation_shapley(
+            players_count, lambda members: mst_cost(irreducible, members)
+        )
+        assert [shares[player] for player in game.players] == pytest.approx(expected)
+
+
+def test_game(game_graph):
+    game = MSTGame(game_graph, Vertex("0"))
+    assert game.__repr__() == "MSTGame(0, 3)"
+    assert game.source == "0"
+    assert game.players == ["a", "b", "c"]
+    assert game.cost([]) == 0
+    assert game.cost(["a"]) == 6
+    assert game.cost(["b", "c"]) == 12
+    assert game.cost(["c", "b"]) == 12
+    assert game.cache_info().hits == 1
+    costs = game.coalition_costs()
+    assert costs.tolist() == [0, 6, 8, 9, 9, 11, 12, 13]
+    assert game.cost(["a", "b", "c"]) == 13
+    with pytest.raises(ValueError):
+        game.cost(["0"])
+
+
+def test_csr_graph_input(game_graph):
+    csr_graph = CSRGraph.from_graph(game_graph)
+    assert folk(csr_graph, "0") == pytest.approx(folk(game_graph, "0"))
+    assert bird(csr_graph, "a") == {"0": 6, "b": 3, "c": 4}
+
+
+def test_incomplete_graph(game_graph):
+    game_graph.from_list([("c", "d", 2, "-")])
+    assert bird(game_graph, "0")["d"] == 2
+    assert sum(folk(game_graph, "0").values()) == pytest.approx(15)
+    with pytest.raises(ValueError):
+        kar(game_graph, "0")
+    game_graph.add_vertex(Vertex("e"))
+    with pytest.raises(ValueError):
+        bird(game_graph, "0")
+
+
+def test_twenty_players():
+    random.seed(8)
+    graph = random_complete_graph(16)
+    shares = kar(graph, "0")
+    assert sum(shares.values()) == pytest.approx(
+        MSTGame(graph, "0").cost([f"p{player}" for player in range(16)])
+    )
+
+
+def test_monte_carlo_shapley(game_graph):
+    exact = kar(game_graph, "0")
+    shares, half_widths = monte_carlo_shapley(
+        game_graph, "0", samples=3000, seed=1, return_intervals=True
+    )
+    assert set(shares) == {"a", "b", "c"}
+    for player, share in shares.items():
+        assert abs(share - exact[player]) <= 2 * half_widths[player]
+    assert sum(shares.values()) == pytest.approx(13)
+
+
+def test_monte_carlo_shapley_random_games():
+    random.seed(6)
+    for players_count in range(2, 7):
+        graph = random_complete_graph(players_count)
+        exact = kar(graph, "0")
+        shares, half_widths = monte_carlo_shapley(
+            graph, "0", samples=2000, seed=players_count, return_intervals=True
+        )
+        for player, share in shares.items():
+            assert abs(share - exact[player]) <= 2 * half_widths[player] + 1e-9
+
+
+def test_monte_carlo_shapley_is_reproducible(game_graph):
+    first = monte_carlo_shapley(game_graph, "0", samples=250, seed=5, batch_size=40)
+    second = monte_carlo_shapley(
+        game_graph, "0", samples=250, seed=5, batch_size=40, workers=2
+    )
+    assert first == second
+
+
+def test_monte_carlo_shapley_tolerance():
+    random.seed(9)
+    graph = random_complete_graph(8)
+    shares, half_widths = monte_carlo_shapley(
+        graph, "0", samples=100000, tolerance=1.0, seed=2, return_intervals=True
+    )
+    assert max(half_widths.values()) <= 1.0
+    assert sum(shares.values()) == pytest.approx(MSTGame(graph, "0").cost(list(shares)))
+
+
+def test_monte_carlo_shapley_errors(game_graph):
+    with pytest.raises(ValueError):
+        monte_carlo_shapley(game_graph, "0", samples=1)
+    with pytest.raises(ValueError):
+        monte_carlo_shapley(game_graph, "0", batch_size=0)
+    graph = Graph("G")
+    graph.add_vertex(Vertex("0"))
+    with pytest.raises(ValueError):
+        monte_carlo_shapley(graph, "0", tolerance=0.1)
+    game_graph.from_list([("c", "d", 2, "-")])
+    with pytest.raises(ValueError):
+        monte_carlo_shapley(game_graph, "0")
+
+
+def test_getCostAllocation(game_graph):
+    assert getCostAllocation(game_graph, "0", "bird") == bird(game_graph, "0")
+    assert getCostAllocation(game_graph, "0") == folk(game_graph, "0")
+    assert getCostAllocation(game_graph, "0", "shapley") == kar(game_graph, "0")
+    assert getCostAllocation(
+        game_graph, "0", "monte_carlo", samples=10, seed=0
+    ) == monte_carlo_shapley(game_graph, "0", samples=10, seed=0)
+    with pytest.raises(ValueError):
+        getCostAllocation(game_graph, "0", rule="nucleolus")
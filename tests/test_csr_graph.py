@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from optrees import CSRGraph, Edge, Graph, Vertex, boruvka, kruskal, prim
+from optrees.graph.csr_graph import connected_components
+
+
+def test_from_arrays():
+    csr_graph = CSRGraph.from_arrays([0, 1, 2], [1, 2, 0], [1.0, 2.0, 3.0])
+    assert csr_graph.label == "G"
+    assert csr_graph.labels == ["0", "1", "2"]
+    assert csr_graph.vertices_count == 3
+    assert csr_graph.edges_count == 3
+    assert csr_graph.weight_sum == 6.0
+
+
+def test_repr():
+    csr_graph = CSRGraph.from_arrays([0], [1], label="H")
+    assert csr_graph.__repr__() == "CSRGraph(H)"
+
+
+def test_invalid_endpoints():
+    with pytest.raises(ValueError):
+        CSRGraph("G", ["a", "b"], np.array([0]), np.array([2]))
+    with pytest.raises(ValueError):
+        CSRGraph("G", ["a", "a"], np.array([0]), np.array([1]))
+
+
+def test_adjacency_arrays():
+    csr_graph = CSRGraph.from_arrays([0, 0, 1], [1, 2, 2], [5.0, 6.0, 7.0])
+    assert csr_graph.indptr.tolist() == [0, 2, 4, 6]
+    assert csr_graph.indices.tolist() == [1, 2, 0, 2, 0, 1]
+    assert csr_graph.weights.tolist() == [5.0, 6.0, 5.0, 7.0, 6.0, 7.0]
+    assert csr_graph.edge_ids.tolist() == [0, 1, 0, 2, 1, 2]
+    assert csr_graph.degree(1) == 2
+    assert csr_graph.neighbors(2).tolist() == [0, 1]
+
+
+def test_from_graph_and_to_graph_round_trip():
+    graph = Graph("G")
+    graph.from_list(
+        [
+            ("a", "b", 1),
+            ("b", "c", 2.5, "->"),
+            ("c", "a", 3, "<-", "ca"),
+        ]
+    )
+    graph.add_vertex(Vertex("d"))
+    csr_graph = CSRGraph.from_graph(graph)
+    assert csr_graph.labels == ["a", "b", "c", "d"]
+    assert csr_graph.edge_label(0) == "a - b"
+    assert csr_graph.edge_label(2) == "ca"
+    restored_graph = csr_graph.to_graph()
+    assert restored_graph.label == graph.label
+    assert restored_graph == graph
+    assert restored_graph.vertices_count == 4
+    assert restored_graph.weight_sum == graph.weight_sum
+    for edge_label, edge in graph.edges.items():
+        restored_edge = restored_graph.edges[edge_label]
+        assert restored_edge.orientation == edge.orientation
+        assert restored_edge.weight == edge.weight
+        assert restored_edge.left_vertex.label == edge.left_vertex.label
+
+
+def test_edge_subgraph_keeps_vertices_and_labels():
+    graph = Graph("G")
+    graph.add_edge(Edge(Vertex("a"), Vertex("b"), 1, label="ab"))
+    graph.from_list([("b", "c", 2)])
+    csr_graph = CSRGraph.from_graph(graph)
+    subgraph = csr_graph.edge_subgraph([0], "S")
+    assert subgraph.vertices_count == 3
+    assert subgraph.edges_count == 1
+    assert subgraph.edge_label(0) == "ab"
+
+
+@pytest.mark.parametrize("algorithm", [boruvka, kruskal, prim])
+def test_algorithms_accept_csr_graph(connected_graph_with_single_mst, algorithm):
+    graph, mst_graph = connected_graph_with_single_mst
+    min_spanning_tree = algorithm(CSRGraph.from_graph(graph))
+    assert isinstance(min_spanning_tree, CSRGraph)
+    assert min_spanning_tree.edges_count == mst_graph.edges_count
+    assert min_spanning_tree.weight_sum == mst_graph.weight_sum
+    assert min_spanning_tree.to_graph() == mst_graph
+
+
+def test_connected_components():
+    csr_graph = CSRGraph.from_arrays([4, 1, 5, 3], [2, 0, 5, 1], labels=list("abcdefg"))
+    assert connected_components(csr_graph).tolist() == [0, 0, 1, 0, 1, 2, 3]
+    assert connected_components(CSRGraph("E", [], [], [])).tolist() == []
@@ -0,0 +1,54 @@
+from optrees import DisjointSet
+
+
+def test_default_initial_disjoint_set():
+    components = DisjointSet(3)
+    assert len(components) == 3
+    assert components.components_count == 3
+    assert components.find(0) == 0
+    assert components.find(2) == 2
+
+
+def test_repr():
+    components = DisjointSet(3)
+    assert components.__repr__() == "DisjointSet(3)"
+
+
+def test_union():
+    components = DisjointSet(4)
+    assert components.union(0, 1) is True
+    assert components.union(2, 3) is True
+    assert components.components_count == 2
+    assert components.union(1, 0) is False
+    assert components.components_count == 2
+
+
+def test_connected():
+    components = DisjointSet(5)
+    components.union(0, 1)
+    components.union(1, 2)
+    assert components.connected(0, 2)
+    assert not components.connected(0, 3)
+    components.union(3, 2)
+    assert components.connected(3, 0)
+    assert not components.connected(4, 0)
+
+
+def test_add():
+    components = DisjointSet()
+    assert components.add() == 0
+    assert components.add() == 1
+    assert components.components_count == 2
+    components.union(0, 1)
+    assert components.components_count == 1
+    assert components.connected(0, 1)
+
+
+def test_find_compresses_long_chains():
+    size = 10000
+    components = DisjointSet(size)
+    for item in range(1, size):
+        components.union(item - 1, item)
+    root = components.find(size - 1)
+    assert all(components.find(item) == root for item in range(size))
+    assert components.components_count == 1
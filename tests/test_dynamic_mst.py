@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from optrees import DynamicMST, Edge, Graph, Vertex, kruskal
+
+
+def test_initial_tree(connected_graph_with_single_mst):
+    graph, mst_graph = connected_graph_with_single_mst
+    dynamic_mst = DynamicMST(graph)
+    assert dynamic_mst.__repr__() == f"DynamicMST({graph.label})"
+    assert dynamic_mst.tree.edges.keys() == mst_graph.edges.keys()
+    assert dynamic_mst.weight_sum == mst_graph.weight_sum
+
+
+def test_insert_replaces_heaviest_cycle_edge():
+    graph = Graph("G")
+    graph.from_list([("a", "b", 1), ("b", "c", 5), ("c", "d", 2)])
+    dynamic_mst = DynamicMST(graph)
+    assert dynamic_mst.weight_sum == 8
+    edge_ac = Edge(graph.vertices["a"], graph.vertices["c"], 3)
+    dynamic_mst.add_edge(edge_ac)
+    assert dynamic_mst.is_tree_edge(edge_ac)
+    assert not dynamic_mst.is_tree_edge(graph.edges["b - c"])
+    assert dynamic_mst.weight_sum == 6
+    dynamic_mst.add_edge(Edge(graph.vertices["d"], Vertex("e"), 4))
+    assert dynamic_mst.weight_sum == 10
+    assert graph.edges_count == 5
+
+
+def test_remove_finds_replacement():
+    graph = Graph("G")
+    graph.from_list([("a", "b", 1), ("b", "c", 2), ("a", "c", 3), ("c", "d", 4)])
+    dynamic_mst = DynamicMST(graph)
+    dynamic_mst.remove_edge(graph.edges["b - c"])
+    assert dynamic_mst.is_tree_edge(graph.edges["a - c"])
+    assert dynamic_mst.weight_sum == 8
+    dynamic_mst.remove_edge(graph.edges["c - d"])
+    assert dynamic_mst.weight_sum == 4
+    assert graph.edges_count == 2
+    assert graph.weight_sum == 4
+    with pytest.raises(ValueError):
+        dynamic_mst.remove_edge(Edge(Vertex("x"), Vertex("y"), 1))
+
+
+def test_update_weight():
+    graph = Graph("G")
+    graph.from_list([("a", "b", 1), ("b", "c", 2), ("a", "c", 3)])
+    dynamic_mst = DynamicMST(graph)
+    dynamic_mst.update_weight(graph.edges["a - b"], 10)
+    assert dynamic_mst.weight_sum == 5
+    assert graph.weight_sum == 15
+    dynamic_mst.update_weight(graph.edges["a - b"], 0.5)
+    assert dynamic_mst.weight_sum == 2.5
+    dynamic_mst.update_weight(graph.edges["b - c"], 2.5)
+    assert dynamic_mst.weight_sum == 3
+
+
+def test_random_updates_match_kruskal():
+    generator = random.Random(3)
+    graph = Graph("G")
+    vertices = [Vertex(f"v{index}") for index in range(25)]
+    graph.add_vertices(vertices)
+    for _ in range(40):
+        left, right = generator.sample(vertices, 2)
+        edge = Edge(left, right, generator.randint(1, 20), label=f"e{len(graph.edges)}")
+        graph.add_edge(edge)
+    dynamic_mst = DynamicMST(graph)
+    labels = iter(range(1000, 2000))
+    for _ in range(300):
+        operation = generator.random()
+        edges = list(graph.edges.values())
+        if operation < 0.4 or not edges:
+            left, right = generator.sample(vertices, 2)
+            dynamic_mst.add_edge(
+                Edge(left, right, generator.randint(1, 20), label=f"e{next(labels)}")
+            )
+        elif operation < 0.7:
+            dynamic_mst.remove_edge(generator.choice(edges))
+        else:
+            dynamic_mst.update_weight(generator.choice(edges), generator.randint(1, 20))
+        assert dynamic_mst.weight_sum == kruskal(graph).weight_sum
+        assert dynamic_mst.tree.edges_count == kruskal(graph).edges_count
@@ -0,0 +1,129 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from optrees import (
+    CSRGraph,
+    Graph,
+    Vertex,
+    edmonds,
+    getMinimumArborescence,
+    tarjan,
+)
+
+
+@pytest.fixture
+def directed_graph():
+    graph = Graph("D")
+    graph.from_list(
+        [
+            ("r", "a", 5, "->"),
+            ("r", "b", 1, "->"),
+            ("a", "b", 1, "->"),
+            ("b", "c", 1, "->"),
+            ("c", "a", 1, "->"),
+            ("c", "d", 3, "-"),
+            ("d", "a", 8, "<-"),
+        ]
+    )
+    return graph
+
+
+def brute_force_cost(vertices_count, root, sources, targets, weights):
+    in_arcs = [
+        [arc for arc, target in enumerate(targets) if target == vertex]
+        for vertex in range(vertices_count)
+    ]
+    vertices = [vertex for vertex in range(vertices_count) if vertex != root]
+    best = None
+    for choice in itertools.product(*(in_arcs[vertex] for vertex in vertices)):
+        parents = {vertex: sources[arc] for vertex, arc in zip(vertices, choice)}
+        acyclic = True
+        for vertex in vertices:
+            visited = set()
+            while vertex != root and acyclic:
+                acyclic = vertex not in visited
+                visited.add(vertex)
+                vertex = parents[vertex]
+        if acyclic:
+            cost = sum(weights[arc] for arc in choice)
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+@pytest.mark.parametrize("algorithm", [edmonds, tarjan])
+def test_arborescence_with_cycle(directed_graph, algorithm):
+    arborescence = algorithm(directed_graph, "r")
+    assert arborescence.label == "MCA"
+    assert set(arborescence.edges) == {"r -> b", "b -> c", "c -> a", "c - d"}
+    assert arborescence.weight_sum == 6
+
+
+@pytest.mark.parametrize("algorithm", ["edmonds", "tarjan"])
+def test_random_graphs_match_brute_force(algorithm):
+    generator = random.Random(5)
+    for _ in range(100):
+        vertices_count = generator.randint(2, 6)
+        edges = [
+            (
+                str(generator.randrange(vertices_count)),
+                str(generator.randrange(vertices_count)),
+                float(generator.randint(1, 9)),
+            )
+            for _ in range(generator.randint(vertices_count, 12))
+        ]
+        csr_graph = CSRGraph.from_arrays(
+            [int(left) for left, _, _ in edges],
+            [int(right) for _, right, _ in edges],
+            [weight for _, _, weight in edges],
+            labels=[str(vertex) for vertex in range(vertices_count)],
+        )
+        root = str(generator.randrange(vertices_count))
+        # Undirected edges may be used in both directions.
+        sources = csr_graph.sources.tolist() + csr_graph.targets.tolist()
+        targets = csr_graph.targets.tolist() + csr_graph.sources.tolist()
+        weights = csr_graph.edge_weights.tolist() * 2
+        expected = brute_force_cost(
+            vertices_count, int(root), sources, targets, weights
+        )
+        if expected is None:
+            with pytest.raises(ValueError):
+                getMinimumArborescence(csr_graph, root, algorithm)
+            continue
+        arborescence = getMinimumArborescence(csr_graph, root, algorithm)
+        assert isinstance(arborescence, CSRGraph)
+        assert arborescence.edges_count == vertices_count - 1
+        assert np.isclose(arborescence.weight_sum, expected)
+
+
+def test_unreachable_vertex():
+    graph = Graph("D")
+    graph.from_list([("b", "r", 2, "->"), ("r", "a", 1, "->"), ("b", "a", 1, "->")])
+    for algorithm in (edmonds, tarjan):
+        with pytest.raises(ValueError):
+            algorithm(graph, "r")
+        assert algorithm(graph, "b").weight_sum == 3
+
+
+def test_invalid_root_and_algorithm(directed_graph):
+    with pytest.raises(ValueError):
+        getMinimumArborescence(directed_graph, "z")
+    with pytest.raises(ValueError):
+        getMinimumArborescence(directed_graph, "r", algorithm="prim")
+    assert (
+        getMinimumArborescence(directed_graph, directed_graph.vertices["r"]).weight_sum
+        == 6
+    )
+
+
+@pytest.mark.parametrize("algorithm", ["edmonds", "tarjan"])
+def test_single_vertex(algorithm):
+    graph = Graph("D")
+    graph.add_vertex(Vertex("a"))
+    arborescence = getMinimumArborescence(graph, "a", algorithm=algorithm)
+    assert arborescence.edges_count == 0
+    assert arborescence.weight_sum == 0
+    graph.from_list([("a", "a", 1, "->")])
+    assert getMinimumArborescence(graph, "a", algorithm=algorithm).edges_count == 0
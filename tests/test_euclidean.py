@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from optrees import CSRGraph, dense_prim_edges, euclidean_mst, euclidean_mst_edges
+
+
+def complete_graph_weight(points):
+    matrix = np.sqrt(((points[:, None] - points[None, :]) ** 2).sum(axis=2))
+    children, parents = dense_prim_edges(matrix)
+    return matrix[children, parents].sum()
+
+
+@pytest.mark.parametrize("dimensions", [1, 2, 3])
+def test_euclidean_mst_matches_complete_graph(dimensions):
+    points = np.random.default_rng(dimensions).random((400, dimensions))
+    sources, targets, weights = euclidean_mst_edges(points, leaf_size=4)
+    assert len(sources) == 399
+    assert weights.sum() == pytest.approx(complete_graph_weight(points))
+    assert np.allclose(
+        np.linalg.norm(points[sources] - points[targets], axis=1), weights
+    )
+
+
+def test_euclidean_mst_with_ties():
+    grid = np.stack(np.meshgrid(np.arange(12), np.arange(12)), axis=-1).reshape(-1, 2)
+    sources, targets, weights = euclidean_mst_edges(grid)
+    assert len(sources) == 143
+    assert weights.sum() == 143
+
+
+def test_euclidean_mst_with_repeated_points():
+    points = np.array([[0.0, 0.0], [0.0, 0.0], [3.0, 4.0], [3.0, 4.0]])
+    _, _, weights = euclidean_mst_edges(points)
+    assert sorted(weights.tolist()) == [0.0, 0.0, 5.0]
+
+
+def test_euclidean_mst_graph():
+    tree = euclidean_mst([[0, 0], [0, 1], [5, 1]], labels=["a", "b", "c"])
+    assert isinstance(tree, CSRGraph)
+    assert tree.label == "MST"
+    assert tree.labels == ["a", "b", "c"]
+    assert tree.weight_sum == pytest.approx(6.0)
+    assert tree.to_graph().edges_count == 2
+
+
+def test_euclidean_mst_small_inputs():
+    assert euclidean_mst(np.zeros((0, 2))).edges_count == 0
+    assert euclidean_mst([[1.0, 2.0]]).edges_count == 0
+    with pytest.raises(ValueError):
+        euclidean_mst([[0, 0], [1, 1]], labels=["a"])
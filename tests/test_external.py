@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+import pytest
+
+from optrees import CSRGraph, GraphReader, external_mst, kruskal, numpy_kruskal_edges
+
+
+@pytest.fixture
+def binary_graph_file(tmp_path):
+    generator = np.random.default_rng(7)
+    sources = generator.integers(0, 500, 20000)
+    targets = generator.integers(0, 500, 20000)
+    weights = generator.integers(0, 100, 20000).astype(float)
+    file_path = str(tmp_path / "graph.bin")
+    GraphReader(file_path).write_binary(CSRGraph.from_arrays(sources, targets, weights))
+    return file_path, sources, targets, weights
+
+
+@pytest.mark.parametrize("contraction_rounds", [0, 1, 5])
+def test_external_mst_text_file(tmp_path, random_connected_graph, contraction_rounds):
+    file_path = str(tmp_path / "graph.txt")
+    GraphReader(file_path).write(random_connected_graph)
+    tree = external_mst(file_path, contraction_rounds=contraction_rounds)
+    assert tree.to_graph() == kruskal(random_connected_graph)
+
+
+@pytest.mark.parametrize("contraction_rounds", [0, 2])
+def test_external_mst_many_runs(binary_graph_file, contraction_rounds):
+    file_path, sources, targets, weights = binary_graph_file
+    directory = os.path.dirname(file_path)
+    tree = external_mst(file_path, 1 << 18, contraction_rounds, directory)
+    selected = numpy_kruskal_edges(sources, targets, weights, 500)
+    assert os.listdir(directory) == ["graph.bin"]
+    assert tree.edges_count == 499
+    assert sorted(zip(tree.sources.tolist(), tree.targets.tolist())) == sorted(
+        zip(sources[selected].tolist(), targets[selected].tolist())
+    )
+
+
+def test_external_mst_disconnected_graph(tmp_path, disconnected_graph):
+    file_path = str(tmp_path / "graph.txt")
+    GraphReader(file_path).write(disconnected_graph)
+    tree = external_mst(file_path, contraction_rounds=3)
+    forest = kruskal(disconnected_graph)
+    assert tree.edges_count == forest.edges_count
+    assert tree.weight_sum == forest.weight_sum
+
+
+def test_external_mst_rejects_memory_limit(binary_graph_file):
+    with pytest.raises(ValueError):
+        external_mst(binary_graph_file[0], memory_limit=1 << 10)
+    with pytest.raises(ValueError):
+        external_mst(binary_graph_file[0], contraction_rounds=-1)
@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from optrees import (
+    CSRGraph,
+    Graph,
+    Vertex,
+    getMinimumSpanningForest,
+    kruskal,
+    minimum_spanning_forest,
+)
+
+ALGORITHMS = [
+    "boruvka",
+    "filter_kruskal",
+    "kruskal",
+    "numpy_boruvka",
+    "numpy_kruskal",
+    "prim",
+]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_forest_of_disconnected_graph(disconnected_graph, algorithm):
+    trees, weight_sum = minimum_spanning_forest(disconnected_graph, algorithm)
+    assert [tree.label for tree in trees] == ["MST0", "MST1"]
+    assert [tree.vertices_count for tree in trees] == [17, 2]
+    assert [tree.edges_count for tree in trees] == [16, 1]
+    assert weight_sum == kruskal(disconnected_graph).weight_sum
+    assert set(trees[1].edges) == {"r - s"}
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_forest_of_connected_graph(random_connected_graph, algorithm):
+    trees, weight_sum = minimum_spanning_forest(random_connected_graph, algorithm)
+    assert len(trees) == 1
+    assert trees[0].edges == kruskal(random_connected_graph).edges
+    assert weight_sum == trees[0].weight_sum
+
+
+def test_isolated_vertices(disconnected_graph):
+    disconnected_graph.add_vertex(Vertex("z"))
+    trees, weight_sum = minimum_spanning_forest(disconnected_graph, "prim")
+    assert len(trees) == 3
+    assert set(trees[2].vertices) == {"z"}
+    assert trees[2].edges_count == 0
+    assert weight_sum == kruskal(disconnected_graph).weight_sum
+
+
+def test_csr_graph_input(disconnected_graph):
+    csr_graph = CSRGraph.from_graph(disconnected_graph)
+    trees, weight_sum = minimum_spanning_forest(csr_graph, "kruskal")
+    assert all(isinstance(tree, CSRGraph) for tree in trees)
+    assert trees[1].labels == ["r", "s"]
+    assert trees[1].edge_label(0) == "r - s"
+    assert weight_sum == kruskal(csr_graph).weight_sum
+
+
+def test_edge_labels_are_kept():
+    graph = Graph("G")
+    graph.from_list([("a", "b", 1, "-", "ab"), ("c", "d", 2, "-", "cd")])
+    trees, _ = minimum_spanning_forest(CSRGraph.from_graph(graph), "boruvka")
+    assert [tree.edge_label(0) for tree in trees] == ["ab", "cd"]
+
+
+def test_many_components_with_workers():
+    generator = random.Random(3)
+    graph = Graph("G")
+    for component in range(40):
+        for vertex in range(1, 8):
+            graph.from_list(
+                [
+                    (
+                        f"{component}-{vertex}",
+                        f"{component}-{generator.randrange(vertex)}",
+                        generator.randint(1, 9),
+                    )
+                ]
+            )
+    sequential, sequential_sum = minimum_spanning_forest(graph, "kruskal")
+    parallel, parallel_sum = minimum_spanning_forest(graph, "kruskal", workers=3)
+    assert len(parallel) == 40
+    assert parallel_sum == sequential_sum == kruskal(graph).weight_sum
+    assert [tree.edges for tree in parallel] == [tree.edges for tree in sequential]
+
+
+def test_empty_graph():
+    assert minimum_spanning_forest(Graph("G")) == ([], 0.0)
+
+
+def test_getMinimumSpanningForest(disconnected_graph):
+    trees, weight_sum = getMinimumSpanningForest(
+        disconnected_graph, "numpy_kruskal", batch_size=4
+    )
+    assert len(trees) == 2
+    assert weight_sum == kruskal(disconnected_graph).weight_sum
+    _, heap_sum = getMinimumSpanningForest(disconnected_graph, "prim", heap="indexed")
+    assert heap_sum == weight_sum
+    with pytest.raises(ValueError):
+        getMinimumSpanningForest(disconnected_graph, algorithm="reverse_delete")
+    with pytest.raises(ValueError):
+        getMinimumSpanningForest(disconnected_graph, algorithm="prim", heap="pairing")
@@ -0,0 +1,215 @@
+import itertools
+import random
+
+import pytest
+
+from optrees import (
+    CSRGraph,
+    FlowNetwork,
+    Graph,
+    Vertex,
+    getMinimumCutTree,
+    gusfield,
+)
+
+
+@pytest.fixture
+def network_graph():
+    graph = Graph("N")
+    graph.from_list(
+        [
+            ("a", "b", 10, "-"),
+            ("a", "f", 8, "-"),
+            ("b", "c", 4, "-"),
+            ("b", "e", 2, "-"),
+            ("b", "f", 3, "-"),
+            ("c", "d", 5, "-"),
+            ("c", "e", 4, "-"),
+            ("c", "f", 2, "-"),
+            ("d", "e", 7, "-"),
+            ("e", "f", 3, "-"),
+        ]
+    )
+    return graph
+
+
+def cut_value(sources, targets, weights, side):
+    return sum(
+        weight
+        for source, target, weight in zip(sources, targets, weights)
+        if side[source] != side[target]
+    )
+
+
+def brute_force_min_cut(vertices_count, sources, targets, weights, left, right):
+    best = None
+    for mask in range(1 << vertices_count):
+        side = [bool(mask >> vertex & 1) for vertex in range(vertices_count)]
+        if side[left] and not side[right]:
+            value = cut_value(sources, targets, weights, side)
+            best = value if best is None else min(best, value)
+    return best
+
+
+def tree_arrays(tree, labels):
+    vertex_ids = {label: index for index, label in enumerate(labels)}
+    edges = list(tree.edges.values())
+    return (
+        [vertex_ids[edge.left_vertex.label] for edge in edges],
+        [vertex_ids[edge.right_vertex.label] for edge in edges],
+        [edge.weight for edge in edges],
+    )
+
+
+def tree_side(vertices_count, sources, targets, removed):
+    adjacency = [[] for _ in range(vertices_count)]
+    for index, (source, target) in enumerate(zip(sources, targets)):
+        if index != removed:
+            adjacency[source].append(target)
+            adjacency[target].append(source)
+    side = [False] * vertices_count
+    stack = [sources[removed]]
+    side[sources[removed]] = True
+    while stack:
+        for neighbor in adjacency[stack.pop()]:
+            if not side[neighbor]:
+                side[neighbor] = True
+                stack.append(neighbor)
+    return side
+
+
+def assert_cut_tree(graph, tree):
+    csr_graph = CSRGraph.from_graph(graph)
+    labels = csr_graph.labels
+    count = csr_graph.vertices_count
+    sources = csr_graph.sources.tolist()
+    targets = csr_graph.targets.tolist()
+    weights = csr_graph.edge_weights.tolist()
+    tree_sources, tree_targets, tree_weights = tree_arrays(tree, labels)
+    assert len(tree_weights) == count - 1
+    # Every tree edge is a minimum cut of the graph between its endpoints.
+    for index, weight in enumerate(tree_weights):
+        side = tree_side(count, tree_sources, tree_targets, index)
+        assert cut_value(sources, targets, weights, side) == pytest.approx(weight)
+        assert weight == pytest.approx(
+            brute_force_min_cut(
+                count,
+                sources,
+                targets,
+                weights,
+                tree_sources[index],
+                tree_targets[index],
+            )
+        )
+
+
+def test_cut_tree(network_graph):
+    degrees = {
+        label: len(vertex.edges) for label, vertex in network_graph.vertices.items()
+    }
+    tree = gusfield(network_graph)
+    assert tree.label == "MCT"
+    assert set(tree.vertices) == set(network_graph.vertices)
+    assert tree.edges_count == 5
+    assert_cut_tree(network_graph, tree)
+    assert degrees == {
+        label: len(vertex.edges) for label, vertex in network_graph.vertices.items()
+    }
+
+
+def test_all_pairs_min_cuts(network_graph):
+    tree = getMinimumCutTree(network_graph)
+    csr_graph = CSRGraph.from_graph(network_graph)
+    labels = csr_graph.labels
+    tree_sources, tree_targets, tree_weights = tree_arrays(tree, labels)
+    for left, right in itertools.combinations(range(len(labels)), 2):
+        expected = brute_force_min_cut(
+            len(labels),
+            csr_graph.sources.tolist(),
+            csr_graph.targets.tolist(),
+            csr_graph.edge_weights.tolist(),
+            left,
+            right,
+        )
+        sides = [
+            tree_side(len(labels), tree_sources, tree_targets, index)
+            for index in range(len(tree_weights))
+        ]
+        path_min = min(
+            weight
+            for weight, side in zip(tree_weights, sides)
+            if side[left] != side[right]
+        )
+        assert path_min == expected
+
+
+def test_disconnected_graph(network_graph):
+    network_graph.from_list([("x", "y", 3, "-")])
+    network_graph.add_vertex(Vertex("z"))
+    tree = gusfield(network_graph)
+    assert tree.edges_count == network_graph.vertices_count - 1
+    assert_cut_tree(network_graph, tree)
+
+
+def test_csr_graph_input(network_graph):
+    csr_graph = CSRGraph.from_graph(network_graph)
+    tree = gusfield(csr_graph)
+    assert isinstance(tree, CSRGraph)
+    assert tree.labels == csr_graph.labels
+    assert tree.weight_sum == gusfield(network_graph).weight_sum
+
+
+def test_single_vertex():
+    graph = Graph("G")
+    graph.add_vertex(Vertex("a"))
+    tree = gusfield(graph)
+    assert set(tree.vertices) == {"a"}
+    assert tree.edges_count == 0
+
+
+def test_random_graphs():
+    random.seed(3)
+    for _ in range(10):
+        graph = Graph("G")
+        graph.add_vertices([Vertex(str(vertex)) for vertex in range(7)])
+        for left, right in itertools.combinations(range(7), 2):
+            if random.random() < 0.5:
+                graph.from_list([(str(left), str(right), random.randint(0, 9), "-")])
+        assert_cut_tree(graph, gusfield(graph))
+
+
+def test_parallel_matches_sequential():
+    random.seed(5)
+    graph = Graph("G")
+    graph.add_vertices([Vertex(str(vertex)) for vertex in range(30)])
+    for left, right in itertools.combinations(range(30), 2):
+        if random.random() < 0.2:
+            graph.from_list([(str(left), str(right), random.randint(1, 9), "-")])
+    sequential = gusfield(graph)
+    parallel = gusfield(graph, workers=2)
+    assert {label: edge.weight for label, edge in parallel.edges.items()} == {
+        label: edge.weight for label, edge in sequential.edges.items()
+    }
+
+
+def test_flow_network():
+    network = FlowNetwork(4, [0, 0, 1, 2], [1, 2, 3, 3], [3.0, 2.0, 1.0, 5.0])
+    assert network.__repr__() == "FlowNetwork(4)"
+    assert network.max_flow(0, 3) == 3.0
+    value, side = network.min_cut(0, 3)
+    assert value == 3.0
+    assert side == [True, True, False, False]
+    with pytest.raises(ValueError):
+        network.min_cut(1, 1)
+    with pytest.raises(ValueError):
+        FlowNetwork(2, [0], [1], [-1.0])
+    with pytest.raises(ValueError):
+        FlowNetwork(2, [0], [1, 0], [1.0])
+
+
+def test_errors(network_graph):
+    network_graph.from_list([("a", "c", -1, "-")])
+    with pytest.raises(ValueError):
+        gusfield(network_graph)
+    with pytest.raises(ValueError):
+        getMinimumCutTree(network_graph, algorithm="karger")
@@ -1,4 +1,15 @@
-from optrees import Edge, Graph, Vertex
+import gc
+
+import numpy as np
+
+from optrees import (
+    Edge,
+    Graph,
+    SparseMatrix,
+    Vertex,
+    disable_deletion_messages,
+    enable_deletion_messages,
+)
 
 
 def test_default_initial_graph():
@@ -176,3 +187,79 @@ def test_from_list():
     graph.from_list(edges_tuples)
     assert graph.edges_count == 3
     assert graph.vertices_count == 3
+
+
+def test_objects_have_no_instance_dict():
+    graph = Graph("G")
+    graph.from_list([("a", "b", 1)])
+    edge = graph.edges["a - b"]
+    for item in (graph, edge, edge.left_vertex):
+        assert not hasattr(item, "__dict__")
+
+
+def test_deletion_messages(capsys):
+    graph = Graph("G")
+    graph.from_list([("a", "b", 1)])
+    del graph
+    gc.collect()
+    assert capsys.readouterr().out == ""
+    enable_deletion_messages()
+    try:
+        graph = Graph("H")
+        graph.from_list([("a", "b", 1)])
+        del graph
+        gc.collect()
+    finally:
+        disable_deletion_messages()
+    output = capsys.readouterr().out
+    assert "Graph H is deleted." in output
+    assert "Edge a - b is deleted." in output
+    assert "Vertex a is deleted." in output
+
+
+def test_vertex_indices_cache():
+    graph = Graph("G")
+    graph.from_list([("a", "b", 1), ("b", "c", 2)])
+    vertex_indices = graph.vertex_indices
+    assert vertex_indices == {"a": 0, "b": 1, "c": 2}
+    assert graph.vertex_indices is vertex_indices
+    graph.add_edge(Edge(graph.vertices["c"], Vertex("d"), 3))
+    assert graph.vertex_indices is not vertex_indices
+    assert graph.vertex_indices["d"] == 3
+    vertex_indices = graph.vertex_indices
+    graph.remove_edge(graph.edges["c - d"])
+    assert graph.vertex_indices is not vertex_indices
+
+
+def test_adjacency_matrix_dense():
+    graph = Graph("G")
+    graph.from_list(
+        [
+            ("a", "b", 1),
+            ("b", "c", 2, "->"),
+            ("c", "a", 3, "<-"),
+            ("a", "b", 0.5, "-", "ab"),
+        ]
+    )
+    matrix = graph.adjacency_matrix()
+    assert isinstance(matrix, np.ndarray)
+    assert matrix.tolist() == [
+        [0.0, 0.5, 3.0],
+        [0.5, 0.0, 2.0],
+        [0.0, 0.0, 0.0],
+    ]
+    matrix = graph.adjacency_matrix(fill_value=np.inf)
+    assert matrix[2, 0] == np.inf
+    assert matrix[0, 2] == 3.0
+
+
+def test_adjacency_matrix_sparse():
+    graph = Graph("G")
+    graph.from_list([("a", "b", 1), ("b", "c", 2, "->"), ("c", "a", 3, "<-")])
+    matrix = graph.adjacency_matrix(sparse=True)
+    assert isinstance(matrix, SparseMatrix)
+    assert matrix.shape == (3, 3)
+    assert matrix.nnz == 4
+    assert matrix.get(1, 2) == 2.0
+    assert matrix.get(2, 1) == 0.0
+    assert matrix.toarray().tolist() == graph.adjacency_matrix(sparse=False).tolist()
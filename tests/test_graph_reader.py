@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from optrees import CSRGraph, Graph, GraphReader, prim
+
+
+@pytest.fixture
+def graph_file(tmp_path):
+    file_path = tmp_path / "graph.txt"
+    lines = ["G", "a b 1", "a c 2.5 ->", "", "b c 3 <- bc", "c d", "d e None - d - e"]
+    file_path.write_text("\n".join(lines) + "\n")
+    return str(file_path)
+
+
+def test_read_label(graph_file):
+    assert GraphReader(graph_file).read_label() == "G"
+
+
+def test_iter_edges_parses_numeric_weights(graph_file):
+    edges = list(GraphReader(graph_file).iter_edges())
+    assert edges == [
+        ("a", "b", 1.0, "-", None),
+        ("a", "c", 2.5, "->", None),
+        ("b", "c", 3.0, "<-", "bc"),
+        ("c", "d", 0.0, "-", None),
+        ("d", "e", 0.0, "-", "d - e"),
+    ]
+    graph = Graph("G")
+    graph.from_list(edges)
+    assert graph.edges_count == 5
+
+
+def test_read(graph_file):
+    graph = GraphReader(graph_file, chunk_size=8).read()
+    assert graph.label == "G"
+    assert graph.vertices_count == 5
+    assert graph.edges_count == 5
+    assert graph.weight_sum == 6.5
+    assert graph.edges["bc"].orientation == "<-"
+    assert graph.edges["a -> c"].weight == 2.5
+
+
+def test_read_csr(graph_file):
+    csr_graph = GraphReader(graph_file, chunk_size=8).read_csr()
+    assert isinstance(csr_graph, CSRGraph)
+    assert csr_graph.label == "G"
+    assert csr_graph.labels == ["a", "b", "c", "d", "e"]
+    assert csr_graph.sources.tolist() == [0, 0, 1, 2, 3]
+    assert csr_graph.targets.tolist() == [1, 2, 2, 3, 4]
+    assert csr_graph.edge_weights.tolist() == [1.0, 2.5, 3.0, 0.0, 0.0]
+    assert csr_graph.edge_labels == {2: "bc"}
+    assert csr_graph.to_graph() == GraphReader(graph_file).read()
+
+
+def test_write_and_read_round_trip(tmp_path, connected_graph_with_multiple_mst):
+    graph, _ = connected_graph_with_multiple_mst
+    file_path = str(tmp_path / "graph.txt")
+    GraphReader(file_path).write(graph)
+    read_graph = GraphReader(file_path).read()
+    assert read_graph == graph
+    assert read_graph.weight_sum == graph.weight_sum
+    assert GraphReader(file_path).read_csr().to_graph() == graph
+
+
+def test_read_invalid_edge(tmp_path):
+    file_path = tmp_path / "graph.txt"
+    file_path.write_text("G\na b 1\nc\n")
+    with pytest.raises(ValueError):
+        GraphReader(str(file_path)).read()
+    with pytest.raises(ValueError):
+        GraphReader(str(file_path)).read_csr()
+
+
+def test_binary_round_trip_against_text(tmp_path, graph_file):
+    binary_path = str(tmp_path / "graph.bin")
+    text_graph = GraphReader(graph_file).read_csr()
+    GraphReader(binary_path).write_binary(text_graph)
+    binary_graph = GraphReader(binary_path).read_binary()
+    assert binary_graph.label == text_graph.label
+    assert binary_graph.labels == text_graph.labels
+    assert binary_graph.sources.tolist() == text_graph.sources.tolist()
+    assert binary_graph.targets.tolist() == text_graph.targets.tolist()
+    assert binary_graph.edge_weights.tolist() == text_graph.edge_weights.tolist()
+    assert binary_graph.orientations.tolist() == text_graph.orientations.tolist()
+    assert binary_graph.edge_labels == text_graph.edge_labels
+    assert binary_graph.to_graph() == GraphReader(graph_file).read()
+
+
+def test_binary_loading_is_memory_mapped(tmp_path, random_connected_graph):
+    text_path = str(tmp_path / "graph.txt")
+    binary_path = str(tmp_path / "graph.bin")
+    GraphReader(text_path).write(random_connected_graph)
+    GraphReader(binary_path).write_binary(random_connected_graph)
+    binary_graph = GraphReader(binary_path).read_binary()
+    for array in (
+        binary_graph.sources,
+        binary_graph.targets,
+        binary_graph.edge_weights,
+        binary_graph.orientations,
+    ):
+        assert isinstance(array.base, np.memmap)
+        assert not array.flags.writeable
+    text_graph = GraphReader(text_path).read_csr()
+    assert binary_graph.labels == text_graph.labels
+    assert binary_graph.edge_weights.tolist() == text_graph.edge_weights.tolist()
+    assert binary_graph.to_graph() == random_connected_graph
+    assert prim(binary_graph).weight_sum == prim(random_connected_graph).weight_sum
+
+
+def test_binary_empty_graph(tmp_path):
+    binary_path = str(tmp_path / "graph.bin")
+    GraphReader(binary_path).write_binary(Graph("E"))
+    binary_graph = GraphReader(binary_path).read_binary()
+    assert binary_graph.label == "E"
+    assert binary_graph.vertices_count == 0
+    assert binary_graph.edges_count == 0
+
+
+def test_read_binary_invalid_file(graph_file):
+    with pytest.raises(ValueError):
+        GraphReader(graph_file).read_binary()
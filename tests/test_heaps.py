@@ -0,0 +1,110 @@
+import random
+
+import pytest
+
+from optrees import IndexedHeap, RadixHeap
+
+
+def test_default_initial_indexed_heap():
+    heap = IndexedHeap(4)
+    assert len(heap) == 0
+    assert 0 not in heap
+
+
+def test_repr():
+    heap = IndexedHeap(4)
+    heap.push(1, 2.0)
+    assert heap.__repr__() == "IndexedHeap(1)"
+
+
+def test_push_and_pop():
+    heap = IndexedHeap(4)
+    heap.push(0, 3.0)
+    heap.push(1, 1.0)
+    heap.push(2, 2.0)
+    assert 1 in heap
+    assert heap.pop() == (1, 1.0)
+    assert heap.pop() == (2, 2.0)
+    assert heap.pop() == (0, 3.0)
+    assert len(heap) == 0
+    assert 1 not in heap
+
+
+def test_push_existing_item():
+    heap = IndexedHeap(2)
+    heap.push(0, 1.0)
+    try:
+        heap.push(0, 2.0)
+        check_exists = True
+    except ValueError:
+        check_exists = False
+    assert check_exists is False
+
+
+def test_decrease_key():
+    heap = IndexedHeap(3)
+    heap.push(0, 3.0)
+    heap.push(1, 2.0)
+    heap.push(2, 5.0)
+    heap.decrease_key(2, 1.0)
+    assert heap.priority(2) == 1.0
+    assert heap.pop() == (2, 1.0)
+    try:
+        heap.decrease_key(0, 4.0)
+        check_exists = True
+    except ValueError:
+        check_exists = False
+    assert check_exists is False
+
+
+def test_pop_order_matches_sorted_priorities():
+    generator = random.Random(7)
+    size = 500
+    heap = IndexedHeap(size)
+    priorities = {}
+    for item in range(size):
+        priorities[item] = generator.random()
+        heap.push(item, priorities[item])
+    for item in generator.sample(range(size), 100):
+        priorities[item] /= 2
+        heap.decrease_key(item, priorities[item])
+    popped = [heap.pop()[1] for _ in range(size)]
+    assert popped == sorted(priorities.values())
+
+
+def test_radix_heap_push_and_pop():
+    heap = RadixHeap()
+    for item, priority in enumerate([5, 3, 9, 3, 0, 17]):
+        heap.push(item, priority)
+    assert len(heap) == 6
+    assert heap.__repr__() == "RadixHeap(6)"
+    assert [heap.pop()[1] for _ in range(6)] == [0, 3, 3, 5, 9, 17]
+    assert len(heap) == 0
+
+
+def test_radix_heap_is_monotone():
+    heap = RadixHeap()
+    heap.push(0, 4)
+    assert heap.pop() == (0, 4)
+    heap.push(1, 4)
+    with pytest.raises(ValueError):
+        heap.push(2, 3)
+    assert heap.pop() == (1, 4)
+    with pytest.raises(IndexError):
+        heap.pop()
+
+
+def test_radix_heap_random_sequence():
+    random.seed(2)
+    heap = RadixHeap()
+    popped = []
+    last = 0
+    for item in range(2000):
+        heap.push(item, last + random.randint(0, 1000))
+        if random.random() < 0.4:
+            last = heap.pop()[1]
+            popped.append(last)
+    while len(heap) > 0:
+        popped.append(heap.pop()[1])
+    assert popped == sorted(popped)
+    assert len(popped) == 2000
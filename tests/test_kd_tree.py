@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from optrees import KDTree
+
+
+def brute_force_distances(points):
+    distances = np.sqrt(((points[:, None] - points[None, :]) ** 2).sum(axis=2))
+    np.fill_diagonal(distances, np.inf)
+    return distances
+
+
+@pytest.mark.parametrize("dimensions", [1, 2, 3])
+def test_closest_pairs_are_nearest_neighbors(dimensions):
+    points = np.random.default_rng(dimensions).random((300, dimensions))
+    sources, targets, distances = KDTree(points, 4).closest_pairs(np.arange(300))
+    expected = brute_force_distances(points)
+    assert sorted(sources.tolist()) == list(range(300))
+    assert np.allclose(distances, expected.min(axis=1)[sources])
+    assert np.allclose(expected[sources, targets], distances)
+
+
+def test_closest_pairs_between_labels():
+    generator = np.random.default_rng(7)
+    points = generator.random((500, 2))
+    labels = generator.integers(0, 6, 500)
+    sources, targets, distances = KDTree(points).closest_pairs(labels)
+    expected = brute_force_distances(points)
+    expected[labels[:, None] == labels[None, :]] = np.inf
+    assert sorted(labels[sources].tolist()) == list(range(6))
+    assert (labels[sources] != labels[targets]).all()
+    for source, distance in zip(sources.tolist(), distances.tolist()):
+        assert distance == pytest.approx(expected[labels == labels[source]].min())
+
+
+def test_closest_pairs_with_lower_bounds():
+    points = np.random.default_rng(1).random((400, 2))
+    tree = KDTree(points, 8)
+    lower_bounds = np.zeros(400)
+    _, _, distances = tree.closest_pairs(np.arange(400), lower_bounds)
+    nearest = brute_force_distances(points).min(axis=1)
+    assert (lower_bounds <= nearest + 1e-12).all()
+    labels = np.arange(400) // 100
+    _, _, bounded = tree.closest_pairs(labels, lower_bounds)
+    _, _, unbounded = tree.closest_pairs(labels)
+    assert np.allclose(bounded, unbounded)
+
+
+def test_single_label_has_no_pairs():
+    sources, targets, distances = KDTree([[0.0, 0.0], [1.0, 1.0]]).closest_pairs([0, 0])
+    assert len(sources) == len(targets) == len(distances) == 0
+
+
+def test_invalid_points():
+    with pytest.raises(ValueError):
+        KDTree([1.0, 2.0])
+    with pytest.raises(ValueError):
+        KDTree([[0.0, np.nan]])
+    with pytest.raises(ValueError):
+        KDTree([[0.0, 0.0]]).closest_pairs([0, 1])
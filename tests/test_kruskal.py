@@ -1,4 +1,14 @@
-from optrees import kruskal
+import numpy as np
+import pytest
+
+from optrees import (
+    CSRGraph,
+    filter_kruskal_edges,
+    getMinimumSpanningTree,
+    kruskal,
+    numpy_kruskal,
+    numpy_kruskal_edges,
+)
 
 
 def test_kruskal_graph_with_single_mst(connected_graph_with_single_mst):
@@ -15,3 +25,74 @@ def test_kruskal_graph_with_multiple_mst(connected_graph_with_multiple_mst):
     assert min_spanning_tree.vertices_count == mst_graph.vertices_count
     assert min_spanning_tree.edges_count == mst_graph.edges_count
     assert min_spanning_tree.weight_sum == mst_graph.weight_sum
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 7, 1000])
+def test_numpy_kruskal_matches_kruskal(random_connected_graph, batch_size):
+    min_spanning_tree = numpy_kruskal(random_connected_graph, batch_size=batch_size)
+    assert min_spanning_tree == kruskal(random_connected_graph)
+
+
+def test_numpy_kruskal_graph_with_single_mst(connected_graph_with_single_mst):
+    graph, mst_graph = connected_graph_with_single_mst
+    min_spanning_tree = getMinimumSpanningTree(graph, algorithm="numpy_kruskal")
+    assert min_spanning_tree == mst_graph
+
+
+def test_numpy_kruskal_edges_returns_index_arrays():
+    sources = np.array([0, 1, 2, 0, 1])
+    targets = np.array([1, 2, 3, 3, 3])
+    weights = np.array([4.0, 1.0, 2.0, 1.0, 5.0])
+    selected = numpy_kruskal_edges(sources, targets, weights, batch_size=2)
+    assert isinstance(selected, np.ndarray)
+    assert selected.tolist() == [1, 3, 2]
+    assert weights[selected].sum() == 4.0
+
+
+def test_numpy_kruskal_edges_with_forest():
+    selected = numpy_kruskal_edges([0, 2], [1, 3], [1.0, 2.0], vertices_count=5)
+    assert selected.tolist() == [0, 1]
+    csr_graph = CSRGraph.from_arrays([0, 2], [1, 3], [1.0, 2.0])
+    assert csr_graph.edge_subgraph(selected, "MSF").to_graph().edges_count == 2
+
+
+def test_numpy_kruskal_edges_integer_weights():
+    generator = np.random.default_rng(3)
+    sources = generator.integers(0, 200, 2000)
+    targets = generator.integers(0, 200, 2000)
+    weights = generator.permutation(2000) - 1000.0
+    assert np.array_equal(
+        numpy_kruskal_edges(sources, targets, weights, 200),
+        numpy_kruskal_edges(sources, targets, weights + 0.5, 200),
+    )
+
+
+@pytest.mark.parametrize("base_size", [1, 5, 4096])
+def test_filter_kruskal_matches_numpy_kruskal(base_size):
+    generator = np.random.default_rng(5)
+    sources = generator.integers(0, 300, 5000)
+    targets = generator.integers(0, 300, 5000)
+    weights = generator.integers(0, 20, 5000).astype(float)
+    assert np.array_equal(
+        filter_kruskal_edges(sources, targets, weights, 300, base_size),
+        numpy_kruskal_edges(sources, targets, weights, 300),
+    )
+
+
+def test_filter_kruskal_equal_weights():
+    sources, targets = np.triu_indices(40, 1)
+    weights = np.ones(len(sources))
+    selected = filter_kruskal_edges(sources, targets, weights, base_size=8)
+    assert selected.tolist() == list(range(39))
+
+
+def test_filter_kruskal_graph(random_connected_graph):
+    min_spanning_tree = getMinimumSpanningTree(
+        random_connected_graph, algorithm="filter_kruskal"
+    )
+    assert min_spanning_tree == kruskal(random_connected_graph)
+
+
+def test_filter_kruskal_rejects_base_size():
+    with pytest.raises(ValueError):
+        filter_kruskal_edges([0], [1], [1.0], base_size=0)
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from optrees import DisjointSet, LinkCutTree
+
+
+def test_link_cut_and_connected():
+    tree = LinkCutTree()
+    nodes = [tree.add(value) for value in range(4)]
+    assert len(tree) == 4
+    assert tree.__repr__() == "LinkCutTree(4)"
+    tree.link(nodes[0], nodes[1])
+    tree.link(nodes[1], nodes[2])
+    assert tree.connected(nodes[0], nodes[2])
+    assert not tree.connected(nodes[0], nodes[3])
+    with pytest.raises(ValueError):
+        tree.link(nodes[2], nodes[0])
+    tree.cut(nodes[1], nodes[2])
+    assert not tree.connected(nodes[0], nodes[2])
+    with pytest.raises(ValueError):
+        tree.cut(nodes[0], nodes[2])
+
+
+def test_path_max():
+    tree = LinkCutTree()
+    nodes = [tree.add(value) for value in [3, 9, 1, 7, 5]]
+    for left, right in [(0, 1), (1, 2), (2, 3), (3, 4)]:
+        tree.link(nodes[left], nodes[right])
+    assert tree.path_max(nodes[2], nodes[4]) == nodes[3]
+    assert tree.path_max(nodes[4], nodes[0]) == nodes[1]
+    tree.set_value(nodes[1], 0)
+    assert tree.path_max(nodes[0], nodes[2]) == nodes[0]
+    with pytest.raises(ValueError):
+        tree.path_max(nodes[0], tree.add(10))
+
+
+def test_random_forest_matches_disjoint_set():
+    generator = random.Random(7)
+    tree = LinkCutTree()
+    nodes = [tree.add(generator.random()) for _ in range(40)]
+    edges = set()
+    for _ in range(400):
+        left, right = generator.sample(nodes, 2)
+        if (min(left, right), max(left, right)) in edges:
+            tree.cut(left, right)
+            edges.remove((min(left, right), max(left, right)))
+        elif not tree.connected(left, right):
+            tree.link(left, right)
+            edges.add((min(left, right), max(left, right)))
+        components = DisjointSet(len(nodes))
+        for edge_left, edge_right in edges:
+            components.union(edge_left, edge_right)
+        probe_left, probe_right = generator.sample(nodes, 2)
+        assert tree.connected(probe_left, probe_right) == components.connected(
+            probe_left, probe_right
+        )
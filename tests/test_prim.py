@@ -1,27 +1,112 @@
-from optrees import prim
+import numpy as np
+import pytest
 
+from optrees import CSRGraph, dense_prim_edges, getMinimumSpanningTree, kruskal, prim
 
-def test_prim_with_connected_graph_with_single_mst(connected_graph_with_single_mst):
+
+@pytest.mark.parametrize("heap", ["lazy", "indexed"])
+def test_prim_with_connected_graph_with_single_mst(
+    connected_graph_with_single_mst, heap
+):
     graph, mst_graph = connected_graph_with_single_mst
-    min_spanning_tree = prim(graph)
+    min_spanning_tree = prim(graph, heap=heap)
     assert min_spanning_tree.vertices_count == mst_graph.vertices_count
     assert min_spanning_tree.edges_count == mst_graph.edges_count
     assert min_spanning_tree == mst_graph
 
 
-def test_prim_with_connected_graph_with_multiple_mst(connected_graph_with_multiple_mst):
+@pytest.mark.parametrize("heap", ["lazy", "indexed"])
+def test_prim_with_connected_graph_with_multiple_mst(
+    connected_graph_with_multiple_mst, heap
+):
     graph, mst_graph = connected_graph_with_multiple_mst
-    min_spanning_tree = prim(graph)
+    min_spanning_tree = prim(graph, heap=heap)
     assert min_spanning_tree.vertices_count == mst_graph.vertices_count
     assert min_spanning_tree.edges_count == mst_graph.edges_count
     assert min_spanning_tree.weight_sum == mst_graph.weight_sum
 
 
-def test_prim_with_disconnected_graph(disconnected_graph):
+@pytest.mark.parametrize("heap", ["lazy", "indexed"])
+def test_prim_with_disconnected_graph(disconnected_graph, heap):
     graph = disconnected_graph
     try:
-        prim(graph)
+        prim(graph, heap=heap)
         check_exist_min_spanning_tree = True
     except Exception:
         check_exist_min_spanning_tree = False
     assert check_exist_min_spanning_tree is False
+
+
+def test_prim_with_unknown_heap(connected_graph_with_single_mst):
+    graph, _ = connected_graph_with_single_mst
+    with pytest.raises(ValueError):
+        prim(graph, heap="fibonacci")
+
+
+@pytest.mark.parametrize("heap", ["lazy", "indexed"])
+def test_prim_through_get_minimum_spanning_tree(random_connected_graph, heap):
+    min_spanning_tree = getMinimumSpanningTree(
+        random_connected_graph, algorithm="prim", heap=heap
+    )
+    expected = kruskal(random_connected_graph)
+    assert min_spanning_tree.edges_count == random_connected_graph.vertices_count - 1
+    assert min_spanning_tree.weight_sum == pytest.approx(expected.weight_sum)
+
+
+def test_dense_prim_with_connected_graph_with_single_mst(
+    connected_graph_with_single_mst,
+):
+    graph, mst_graph = connected_graph_with_single_mst
+    assert prim(graph, dense=True) == mst_graph
+
+
+def test_dense_prim_with_disconnected_graph(disconnected_graph):
+    min_spanning_forest = prim(disconnected_graph, dense=True)
+    expected = kruskal(disconnected_graph)
+    assert min_spanning_forest.edges_count == expected.edges_count
+    assert min_spanning_forest.weight_sum == expected.weight_sum
+
+
+def test_dense_prim_matches_kruskal(random_connected_graph):
+    min_spanning_tree = getMinimumSpanningTree(
+        random_connected_graph, algorithm="dense_prim"
+    )
+    expected = kruskal(random_connected_graph)
+    assert min_spanning_tree.edges_count == expected.edges_count
+    assert min_spanning_tree.weight_sum == pytest.approx(expected.weight_sum)
+
+
+def test_dense_prim_with_parallel_edges():
+    graph = CSRGraph.from_arrays(
+        [0, 1, 0, 2, 1, 0], [1, 0, 2, 1, 2, 1], [5, 4, 3, 9, 6, 2]
+    )
+    min_spanning_tree = prim(graph, dense=True)
+    assert sorted(min_spanning_tree.edge_weights.tolist()) == [2, 3]
+
+
+def test_dense_prim_edges():
+    points = np.random.default_rng(0).random((40, 2))
+    matrix = np.sqrt(((points[:, None] - points[None, :]) ** 2).sum(axis=2))
+    children, parents = dense_prim_edges(matrix)
+    sources, targets = np.triu_indices(40, 1)
+    graph = CSRGraph.from_arrays(sources, targets, matrix[sources, targets])
+    assert len(children) == 39
+    assert matrix[children, parents].sum() == pytest.approx(kruskal(graph).weight_sum)
+
+
+def test_dense_prim_edges_with_adjacency_matrix(connected_graph_with_single_mst):
+    graph, mst_graph = connected_graph_with_single_mst
+    children, parents = dense_prim_edges(graph.adjacency_matrix(fill_value=np.inf))
+    labels = list(graph.vertex_indices)
+    assert {
+        frozenset((labels[child], labels[parent]))
+        for child, parent in zip(children.tolist(), parents.tolist())
+    } == {
+        frozenset((edge.left_vertex.label, edge.right_vertex.label))
+        for edge in mst_graph.edges.values()
+    }
+
+
+def test_dense_prim_edges_with_non_square_matrix():
+    with pytest.raises(ValueError):
+        dense_prim_edges(np.zeros((2, 3)))
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from optrees import CSRGraph, getMinimumSpanningTree, kruskal, select_mst_algorithm
+
+
+def grid_graph(side):
+    vertices = np.arange(side * side).reshape(side, side)
+    sources = np.concatenate((vertices[:, :-1].ravel(), vertices[:-1, :].ravel()))
+    targets = np.concatenate((vertices[:, 1:].ravel(), vertices[1:, :].ravel()))
+    weights = np.random.default_rng(0).random(len(sources))
+    return CSRGraph.from_arrays(sources, targets, weights)
+
+
+def test_select_complete_graph():
+    sources, targets = np.triu_indices(30, 1)
+    graph = CSRGraph.from_arrays(sources, targets, np.arange(len(sources)))
+    assert select_mst_algorithm(graph) == "dense_prim"
+
+
+def test_select_sparse_graph(random_connected_graph):
+    assert select_mst_algorithm(random_connected_graph) == "numpy_kruskal"
+
+
+def test_select_large_sparse_graph():
+    assert select_mst_algorithm(grid_graph(300)) == "numpy_boruvka"
+
+
+def test_select_large_graph():
+    generator = np.random.default_rng(1)
+    sources = generator.integers(0, 3000, 1 << 17)
+    targets = generator.integers(0, 3000, 1 << 17)
+    graph = CSRGraph.from_arrays(sources, targets, generator.random(len(sources)))
+    assert select_mst_algorithm(graph) == "filter_kruskal"
+
+
+def test_auto_returns_algorithm(random_connected_graph):
+    tree, algorithm = getMinimumSpanningTree(
+        random_connected_graph, return_algorithm=True
+    )
+    assert algorithm == "numpy_kruskal"
+    assert tree.label == "MST"
+    assert tree.edges.keys() == kruskal(random_connected_graph).edges.keys()
+
+
+def test_auto_large_graph():
+    graph = grid_graph(300)
+    tree, algorithm = getMinimumSpanningTree(graph, "auto", return_algorithm=True)
+    assert algorithm == "numpy_boruvka"
+    assert tree.weight_sum == pytest.approx(kruskal(graph).weight_sum)
+
+
+def test_auto_dense_disconnected_graph():
+    sources, targets = np.triu_indices(10, 1)
+    sources = np.concatenate((sources, sources + 10))
+    targets = np.concatenate((targets, targets + 10))
+    weights = np.random.default_rng(2).random(len(sources))
+    graph = CSRGraph.from_arrays(sources, targets, weights)
+    tree, algorithm = getMinimumSpanningTree(graph, return_algorithm=True)
+    assert algorithm == "dense_prim"
+    assert tree.edges_count == 18
+    assert tree.weight_sum == pytest.approx(kruskal(graph).weight_sum)
+
+
+def test_auto_passes_options(random_connected_graph):
+    tree, algorithm = getMinimumSpanningTree(
+        random_connected_graph, heap="indexed", return_algorithm=True
+    )
+    assert algorithm == "prim"
+    assert tree.label == "MST"
+    assert tree.weight_sum == kruskal(random_connected_graph).weight_sum
+    tree, algorithm = getMinimumSpanningTree(
+        random_connected_graph, batch_size=10, return_algorithm=True
+    )
+    assert algorithm == "numpy_kruskal"
+    assert tree.label == "MST"
+    with pytest.raises(ValueError):
+        getMinimumSpanningTree(random_connected_graph, colour="red")
@@ -0,0 +1,193 @@
+import random
+
+import numpy as np
+import pytest
+
+from optrees import (
+    CSRGraph,
+    Graph,
+    Vertex,
+    bellman_ford,
+    dijkstra,
+    getShortestPathTree,
+)
+
+
+@pytest.fixture
+def road_graph():
+    graph = Graph("R")
+    graph.from_list(
+        [
+            ("s", "a", 4, "-"),
+            ("s", "b", 1, "->"),
+            ("b", "a", 2, "->"),
+            ("a", "c", 1, "-"),
+            ("c", "b", 1, "->"),
+            ("c", "d", 5, "<-"),
+            ("b", "d", 7, "->"),
+        ]
+    )
+    return graph
+
+
+def floyd_distances(vertices_count, sources, targets, weights):
+    distances = np.full((vertices_count, vertices_count), np.inf)
+    np.fill_diagonal(distances, 0)
+    for source, target, weight in zip(sources, targets, weights):
+        distances[source, target] = min(distances[source, target], weight)
+    for middle in range(vertices_count):
+        distances = np.minimum(
+            distances, distances[:, middle, None] + distances[None, middle, :]
+        )
+    return distances
+
+
+def tree_distances(tree, source):
+    distances = {source: 0}
+    changed = True
+    while changed:
+        changed = False
+        for edge in tree.edges.values():
+            ends = [(edge.left_vertex.label, edge.right_vertex.label)]
+            if edge.orientation == "-":
+                ends.append(ends[0][::-1])
+            elif edge.orientation == "<-":
+                ends = [ends[0][::-1]]
+            for start, end in ends:
+                if start in distances and end not in distances:
+                    distances[end] = distances[start] + edge.weight
+                    changed = True
+    return distances
+
+
+def random_graph(vertices_count, edges_count, negative=False):
+    graph = Graph("G")
+    for vertex in range(vertices_count):
+        graph.add_vertex(Vertex(str(vertex)))
+    pairs = random.sample(
+        [
+            (left, right)
+            for left in range(vertices_count)
+            for right in range(left + 1, vertices_count)
+        ],
+        edges_count,
+    )
+    for left, right in pairs:
+        orientation = random.choice(["->", "<-"] if negative else ["-", "->", "<-"])
+        weight = random.randint(-2 if negative else 0, 9)
+        graph.from_list([(str(left), str(right), weight, orientation)])
+    return graph
+
+
+@pytest.mark.parametrize(
+    "algorithm, kwargs",
+    [(dijkstra, {}), (dijkstra, {"heap": "radix"}), (bellman_ford, {})],
+)
+def test_shortest_path_tree(road_graph, algorithm, kwargs):
+    tree = algorithm(road_graph, "s", **kwargs)
+    assert tree.label == "SPT"
+    assert set(tree.edges) == {"s -> b", "b -> a", "a - c", "b -> d"}
+    assert tree_distances(tree, "s") == {"s": 0, "b": 1, "a": 3, "c": 4, "d": 8}
+
+
+def test_dijkstra_respects_orientation(road_graph):
+    tree = dijkstra(road_graph, "d")
+    assert tree_distances(tree, "d") == {"d": 0, "c": 5, "a": 6, "b": 6, "s": 10}
+
+
+@pytest.mark.parametrize("heap", ["binary", "radix"])
+def test_dijkstra_targets(road_graph, heap):
+    tree = dijkstra(road_graph, "s", targets=["a"], heap=heap)
+    assert set(tree.edges) == {"s -> b", "b -> a"}
+    tree = dijkstra(road_graph, "s", targets=["a", "s"], heap=heap)
+    assert set(tree.edges) == {"s -> b", "b -> a"}
+    assert dijkstra(road_graph, "s", targets=["s"], heap=heap).edges == {}
+
+
+def test_bellman_ford_targets(road_graph):
+    tree = bellman_ford(road_graph, "s", targets=["c"])
+    assert set(tree.edges) == {"s -> b", "b -> a", "a - c"}
+
+
+def test_unreachable_vertices_are_left_out(road_graph):
+    road_graph.add_vertex(Vertex("z"))
+    tree = dijkstra(road_graph, "s")
+    assert "z" not in tree.vertices
+    assert dijkstra(road_graph, "s", targets=["z"]).edges == {}
+
+
+def test_csr_graph_input(road_graph):
+    csr_graph = CSRGraph.from_graph(road_graph)
+    tree = dijkstra(csr_graph, "s", heap="radix")
+    assert isinstance(tree, CSRGraph)
+    assert tree.weight_sum == 11
+
+
+def test_dijkstra_errors(road_graph):
+    with pytest.raises(ValueError):
+        dijkstra(road_graph, "x")
+    with pytest.raises(ValueError):
+        dijkstra(road_graph, "s", targets=["x"])
+    with pytest.raises(ValueError):
+        dijkstra(road_graph, "s", heap="fibonacci")
+    road_graph.from_list([("a", "e", 0.5, "-")])
+    with pytest.raises(ValueError):
+        dijkstra(road_graph, "s", heap="radix")
+    road_graph.from_list([("e", "f", -1, "->")])
+    with pytest.raises(ValueError):
+        dijkstra(road_graph, "s")
+
+
+def test_bellman_ford_negative_weights(road_graph):
+    road_graph.from_list([("d", "s", -3, "->"), ("s", "e", -2, "->")])
+    tree = bellman_ford(road_graph, "s")
+    assert tree_distances(tree, "s")["e"] == -2
+
+
+def test_bellman_ford_negative_cycle(road_graph):
+    road_graph.from_list([("x", "y", -1, "-")])
+    assert "x" not in bellman_ford(road_graph, "s").vertices
+    road_graph.from_list([("d", "b", -9, "->")])
+    with pytest.raises(ValueError):
+        bellman_ford(road_graph, "s")
+
+
+@pytest.mark.parametrize("negative", [False, True])
+def test_random_graphs_against_floyd(negative):
+    random.seed(7)
+    for _ in range(30):
+        graph = random_graph(12, 30, negative)
+        sources, targets, weights = [], [], []
+        for edge in graph.edges.values():
+            left = int(edge.left_vertex.label)
+            right = int(edge.right_vertex.label)
+            if edge.orientation != "<-":
+                sources.append(left)
+                targets.append(right)
+                weights.append(edge.weight)
+            if edge.orientation != "->":
+                sources.append(right)
+                targets.append(left)
+                weights.append(edge.weight)
+        distances = floyd_distances(12, sources, targets, weights)
+        if (np.isfinite(distances[0]) & (np.diag(distances) < 0)).any():
+            with pytest.raises(ValueError):
+                bellman_ford(graph, "0")
+            continue
+        algorithms = [bellman_ford] if negative else [bellman_ford, dijkstra]
+        for algorithm in algorithms:
+            tree = algorithm(graph, "0")
+            expected = {
+                str(vertex): distances[0, vertex]
+                for vertex in range(12)
+                if np.isfinite(distances[0, vertex])
+            }
+            assert tree_distances(tree, "0") == expected
+
+
+def test_getShortestPathTree(road_graph):
+    assert getShortestPathTree(road_graph, "s").weight_sum == 11
+    tree = getShortestPathTree(road_graph, "s", "bellman_ford", targets=["b"])
+    assert set(tree.edges) == {"s -> b"}
+    with pytest.raises(ValueError):
+        getShortestPathTree(road_graph, "s", algorithm="a_star")
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from optrees import SparseMatrix
+
+
+def test_from_coo_keeps_the_lightest_duplicate():
+    matrix = SparseMatrix.from_coo(
+        [1, 0, 1, 1], [0, 2, 0, 1], [4.0, 1.0, 2.0, 3.0], (2, 3)
+    )
+    assert matrix.indptr.tolist() == [0, 1, 3]
+    assert matrix.indices.tolist() == [2, 0, 1]
+    assert matrix.data.tolist() == [1.0, 2.0, 3.0]
+    assert matrix.nnz == 3
+    assert matrix.__repr__() == "SparseMatrix(shape=(2, 3), nnz=3)"
+
+
+def test_tocoo_and_toarray():
+    matrix = SparseMatrix.from_coo([0, 1], [1, 0], [5.0, 6.0], (2, 2))
+    rows, columns, data = matrix.tocoo()
+    assert rows.tolist() == [0, 1]
+    assert columns.tolist() == [1, 0]
+    assert data.tolist() == [5.0, 6.0]
+    assert matrix.toarray(np.inf).tolist() == [[np.inf, 5.0], [6.0, np.inf]]
+
+
+def test_get_and_dot():
+    dense = np.array([[0.0, 2.0, 0.0], [1.0, 0.0, 3.0], [0.0, 0.0, 0.0]])
+    rows, columns = np.nonzero(dense)
+    matrix = SparseMatrix.from_coo(rows, columns, dense[rows, columns], dense.shape)
+    assert matrix.get(1, 2) == 3.0
+    assert matrix.get(2, 2, default=-1.0) == -1.0
+    vector = np.array([1.0, 2.0, 3.0])
+    assert matrix.dot(vector).tolist() == (dense @ vector).tolist()
+    with pytest.raises(ValueError):
+        matrix.dot([1.0])
+
+
+def test_empty_matrix():
+    matrix = SparseMatrix.from_coo([], [], [], (0, 0))
+    assert matrix.nnz == 0
+    assert matrix.toarray().shape == (0, 0)
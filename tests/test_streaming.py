@@ -0,0 +1,80 @@
+import math
+import random
+from itertools import islice
+
+import pytest
+
+from optrees import Graph, StreamingMST, kruskal
+
+
+def edge_stream(seed, vertices_count):
+    generator = random.Random(seed)
+    while True:
+        left, right = generator.sample(range(vertices_count), 2)
+        yield f"v{left}", f"v{right}", generator.randint(1, 50)
+
+
+def test_streaming_mst_graph_with_single_mst(connected_graph_with_single_mst):
+    graph, mst_graph = connected_graph_with_single_mst
+    edges = [
+        (edge.left_vertex.label, edge.right_vertex.label, edge.weight)
+        for edge in graph.edges.values()
+    ]
+    streaming_mst = StreamingMST(edges)
+    assert streaming_mst.tree == mst_graph
+    assert streaming_mst.weight_sum == mst_graph.weight_sum
+    assert streaming_mst.processed_count == graph.edges_count
+    assert streaming_mst.__repr__() == (
+        f"StreamingMST(MSF, {mst_graph.vertices_count} vertices, "
+        f"{mst_graph.edges_count} edges)"
+    )
+
+
+def test_streaming_mst_replaces_heaviest_cycle_edge():
+    streaming_mst = StreamingMST([("a", "b", 1), ("b", "c", 5), ("c", "d", 2)])
+    assert streaming_mst.weight_sum == 8
+    assert streaming_mst.add_edge(("a", "c", 3))
+    assert ("b", "c", 5, "-", None) not in streaming_mst.edges
+    assert streaming_mst.weight_sum == 6
+    assert not streaming_mst.add_edge(("a", "d", 6))
+    assert not streaming_mst.add_edge(("a", "a", 0))
+    assert not streaming_mst.add_edge(("b", "a", 1))
+    assert streaming_mst.edges_count == 3
+    assert streaming_mst.processed_count == 7
+
+
+def test_streaming_mst_keeps_edge_fields():
+    streaming_mst = StreamingMST()
+    streaming_mst.add_edges([("a", "b"), ("b", "c", None, "-", "bc")])
+    assert streaming_mst.edges == [("a", "b", 0, "-", None), ("b", "c", 0, "-", "bc")]
+    assert streaming_mst.tree.edges["bc"].right_vertex.label == "c"
+    with pytest.raises(ValueError):
+        streaming_mst.add_edge(("a",))
+
+
+def test_streaming_mst_matches_kruskal_on_prefixes():
+    streaming_mst = StreamingMST(label="T")
+    lightest = {}
+    stream = edge_stream(5, 40)
+    for _ in range(10):
+        edges = list(islice(stream, 50))
+        streaming_mst.add_edges(edges)
+        for left, right, weight in edges:
+            pair = tuple(sorted((left, right)))
+            lightest[pair] = min(weight, lightest.get(pair, weight))
+        graph = Graph("G")
+        graph.from_list([(*pair, weight) for pair, weight in lightest.items()])
+        assert streaming_mst.weight_sum == kruskal(graph).weight_sum
+        assert streaming_mst.edges_count == kruskal(graph).edges_count
+    assert streaming_mst.tree.label == "T"
+    assert streaming_mst.processed_count == 500
+
+
+def test_streaming_mst_weight_sum_does_not_drift():
+    streaming_mst = StreamingMST([("a", "b", 1e16), ("b", "c", 1.0)])
+    for index in range(100):
+        streaming_mst.add_edge(("a", "b", 1e16 - 2 * (index + 1)))
+        streaming_mst.add_edge(("b", "c", 1.0 - (index + 1) / 1000))
+    assert streaming_mst.weight_sum == math.fsum(
+        edge[2] for edge in streaming_mst.edges
+    )